@@ -44,6 +44,7 @@ class Settings(BaseSettings):
     base_quantity: int = Field(default=100, env="BASE_QUANTITY")
     max_quantity: int = Field(default=500, env="MAX_QUANTITY")
     cycle_interval: int = Field(default=60, env="CYCLE_INTERVAL")
+    max_concurrent_analyses: int = Field(default=4, env="MAX_CONCURRENT_ANALYSES")
 
     # Portfolio Configuration
     initial_cash: float = Field(default=100000.0, env="INITIAL_CASH")
@@ -56,6 +57,10 @@ class Settings(BaseSettings):
     # Database Configuration
     database_url: str = Field(default="sqlite:///./stockai.db", env="DATABASE_URL")
 
+    # Decision log (memory-mapped ring buffer, created on the first decision)
+    decision_log_path: str = Field(default="data/decisions.bin", env="DECISION_LOG_PATH")
+    decision_log_capacity: int = Field(default=1_000_000, env="DECISION_LOG_CAPACITY")
+
     # Redis Configuration
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
     redis_port: int = Field(default=6379, env="REDIS_PORT")
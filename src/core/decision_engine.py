@@ -1,4 +1,5 @@
 # decision_engine.py
+import asyncio
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
@@ -11,6 +12,8 @@ from src.agents.sentiment_agent import analyze_sentiment
 from src.agents.risk_manager import analyze_risk
 from src.agents.portfolio_manager import analyze_portfolio
 from src.models.ensemble_model import EnsembleRLModel
+from src.config.settings import get_settings
+from src.data.decision_log import DecisionLog
 from src.utils.data_preprocessor import get_processed_features_for_rl
 from src.utils.config import ENSEMBLE_MODEL_PATHS
 
@@ -23,9 +26,15 @@ class DecisionEngine:
     
     def __init__(self):
         self.ensemble_model = None
-        self.decision_history = []
+        settings = get_settings()
+        try:
+            self.decision_log = DecisionLog(
+                settings.decision_log_path, settings.decision_log_capacity
+            )
+        except (OSError, ValueError) as e:
+            print(f"❌ Error opening decision log, performance summary disabled: {e}")
+            self.decision_log = None
         self.performance_metrics = {
-            "total_decisions": 0,
             "correct_predictions": 0,
             "accuracy": 0.0
         }
@@ -40,6 +49,26 @@ class DecisionEngine:
             print(f"❌ Error loading ensemble model: {e}")
             return False
     
+    async def analyze_agents(self, stock: str, start_date: str, end_date: str,
+                             portfolio: Dict) -> Dict:
+        """
+        Run the 5 independent analytical agents concurrently.
+        
+        Each agent is a blocking call, so it runs in a worker thread; the
+        total wait is the slowest agent's latency rather than the sum.
+        
+        Returns:
+            Dict mapping agent name to its signal/confidence result
+        """
+        results = await asyncio.gather(
+            asyncio.to_thread(analyze_fundamentals, stock, end_date),
+            asyncio.to_thread(analyze_technicals, stock, start_date, end_date),
+            asyncio.to_thread(analyze_valuation, stock, end_date),
+            asyncio.to_thread(analyze_sentiment, stock, end_date),
+            asyncio.to_thread(analyze_risk, stock, start_date, end_date, portfolio)
+        )
+        return dict(zip(("fundamentals", "technicals", "valuation", "sentiment", "risk"), results))
+    
     def run_comprehensive_analysis(self, stock: str, stock_data: pd.DataFrame, 
                                  start_date: str, end_date: str, 
                                  portfolio: Dict) -> Dict:
@@ -527,12 +556,13 @@ class DecisionEngine:
     def _update_performance_metrics(self, analysis_results: Dict):
         """Update performance tracking metrics."""
         try:
-            self.decision_history.append(analysis_results)
-            self.performance_metrics["total_decisions"] += 1
-            
-            # Keep only last 100 decisions for performance tracking
-            if len(self.decision_history) > 100:
-                self.decision_history = self.decision_history[-100:]
+            if self.decision_log is not None:
+                final_decision = analysis_results["final_decision"]
+                self.decision_log.record(
+                    analysis_results["stock"],
+                    final_decision.get("signal", "HOLD"),
+                    final_decision.get("confidence", 0)
+                )
             
         except Exception as e:
             print(f"❌ Error updating performance metrics: {e}")
@@ -540,21 +570,15 @@ class DecisionEngine:
     def get_performance_summary(self) -> Dict:
         """Get performance summary of the decision engine."""
         try:
-            if not self.decision_history:
+            if self.decision_log is None or len(self.decision_log) == 0:
                 return {"message": "No decisions made yet"}
             
             # Calculate accuracy (simplified - would need actual market data for real accuracy)
-            recent_decisions = self.decision_history[-10:]  # Last 10 decisions
+            summary = self.decision_log.summary(10)  # Last 10 decisions
             
             return {
-                "total_decisions": self.performance_metrics["total_decisions"],
-                "recent_decisions": len(recent_decisions),
-                "average_confidence": np.mean([d["final_decision"].get("confidence", 0) for d in recent_decisions]),
-                "signal_distribution": {
-                    "BUY": sum(1 for d in recent_decisions if d["final_decision"].get("signal") == "BUY"),
-                    "SELL": sum(1 for d in recent_decisions if d["final_decision"].get("signal") == "SELL"),
-                    "HOLD": sum(1 for d in recent_decisions if d["final_decision"].get("signal") == "HOLD")
-                }
+                "total_decisions": len(self.decision_log),
+                **summary
             }
             
         except Exception as e:
@@ -3,15 +3,33 @@ Real-time State Manager
 Synchronizes trading system state with UI through persistent storage
 """
 
-import json
 import sqlite3
 import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 import logging
 
+try:
+    import orjson
+
+    def _dumps(payload: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(payload: Any, indent: bool = False) -> bytes:
+        return json.dumps(payload, indent=2 if indent else None).encode()
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +84,9 @@ class StateManager:
 
         self._lock = threading.Lock()
 
+        # In-memory state while a batch() block is open; written once on exit
+        self._batch_state: Optional[TradingState] = None
+
         # Initialize database
         self._init_database()
 
@@ -197,17 +218,53 @@ class StateManager:
         logger.info("Initial state created")
 
     def _save_state(self, state: TradingState):
-        """Save state to JSON file."""
+        """Save state to JSON file (deferred to the end of an open batch)."""
         with self._lock:
-            with open(self.state_file, "w") as f:
-                json.dump(asdict(state), f, indent=2)
+            if self._batch_state is not None:
+                self._batch_state = state
+                return
+            self._write_state(state)
+
+    def _write_state(self, state: TradingState):
+        """Serialize state to the JSON file; caller holds the lock."""
+        with open(self.state_file, "wb") as f:
+            f.write(_dumps(asdict(state), indent=True))
+
+    def _read_state(self) -> TradingState:
+        """Load state from the JSON file; caller holds the lock."""
+        with open(self.state_file, "rb") as f:
+            return TradingState(**_loads(f.read()))
 
     def get_state(self) -> TradingState:
         """Get current state."""
         with self._lock:
-            with open(self.state_file, "r") as f:
-                data = json.load(f)
-                return TradingState(**data)
+            if self._batch_state is not None:
+                return self._batch_state
+            return self._read_state()
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce state updates made inside the block into one file write.
+
+        The state is read once on entry, every update inside the block works
+        on that in-memory copy, and it is written back once on exit. SQLite
+        history inserts are not deferred. Nested blocks join the outer one.
+        """
+        with self._lock:
+            if self._batch_state is not None:
+                owner = False
+            else:
+                self._batch_state = self._read_state()
+                owner = True
+
+        try:
+            yield
+        finally:
+            if owner:
+                with self._lock:
+                    state, self._batch_state = self._batch_state, None
+                    self._write_state(state)
 
     def update_state(self, **kwargs):
         """Update specific state fields."""
@@ -243,7 +300,7 @@ class StateManager:
                 portfolio.get("total_value", 0) - portfolio.get("cash", 0),
                 portfolio.get("total_return", 0),
                 portfolio.get("total_return_pct", 0),
-                json.dumps(portfolio.get("positions", {})),
+                _dumps(portfolio.get("positions", {})).decode(),
             ),
         )
 
@@ -252,16 +309,29 @@ class StateManager:
 
         logger.info(f"Portfolio updated: ${portfolio.get('total_value', 0):,.2f}")
 
+    def touch_portfolio(self):
+        """Mark the portfolio as current without rewriting it or adding a snapshot."""
+        self.update_state()
+
     def add_decision(self, decision: Dict[str, Any]):
         """Add a trading decision."""
+        self.add_decisions_bulk([decision])
+
+    def add_decisions_bulk(self, decisions: List[Dict[str, Any]]):
+        """Add several trading decisions with one state write and one transaction."""
+        if not decisions:
+            return
+
         state = self.get_state()
 
-        # Add to recent decisions (keep last 50)
-        decision["timestamp"] = datetime.now().isoformat()
-        state.recent_decisions.insert(0, decision)
+        # Add to recent decisions, newest first (keep last 50)
+        timestamp = datetime.now().isoformat()
+        for decision in decisions:
+            decision["timestamp"] = timestamp
+        state.recent_decisions[:0] = reversed(decisions)
         state.recent_decisions = state.recent_decisions[:50]
 
-        state.total_decisions += 1
+        state.total_decisions += len(decisions)
 
         self._save_state(state)
 
@@ -269,40 +339,49 @@ class StateManager:
         conn = sqlite3.connect(str(self.db_file))
         cursor = conn.cursor()
 
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT INTO trading_decisions
             (timestamp, symbol, signal, confidence, quantity, price, reasoning, executed, order_id, cycle_count)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                decision["timestamp"],
-                decision.get("symbol", ""),
-                decision.get("signal", ""),
-                decision.get("confidence", 0),
-                decision.get("quantity", 0),
-                decision.get("price", 0),
-                decision.get("reasoning", ""),
-                decision.get("executed", False),
-                decision.get("order_id", ""),
-                state.cycle_count,
-            ),
+            [
+                (
+                    decision["timestamp"],
+                    decision.get("symbol", ""),
+                    decision.get("signal", ""),
+                    decision.get("confidence", 0),
+                    decision.get("quantity", 0),
+                    decision.get("price", 0),
+                    decision.get("reasoning", ""),
+                    decision.get("executed", False),
+                    decision.get("order_id", ""),
+                    state.cycle_count,
+                )
+                for decision in decisions
+            ],
         )
 
         conn.commit()
         conn.close()
 
-        logger.info(
-            f"Decision added: {decision.get('symbol')} - {decision.get('signal')}"
-        )
+        summary = ", ".join(f"{d.get('symbol')} - {d.get('signal')}" for d in decisions)
+        logger.info(f"Decisions added: {summary}")
 
     def add_trade_execution(self, execution: Dict[str, Any]):
         """Record a trade execution."""
-        state = self.get_state()
-        state.total_trades += 1
+        self.add_trade_executions_bulk([execution])
+
+    def add_trade_executions_bulk(self, executions: List[Dict[str, Any]]):
+        """Record several trade executions with one state write and one transaction."""
+        if not executions:
+            return
 
-        if execution.get("success", False):
-            state.successful_trades += 1
+        state = self.get_state()
+        state.total_trades += len(executions)
+        state.successful_trades += sum(
+            1 for execution in executions if execution.get("success", False)
+        )
 
         self._save_state(state)
 
@@ -310,31 +389,34 @@ class StateManager:
         conn = sqlite3.connect(str(self.db_file))
         cursor = conn.cursor()
 
-        cursor.execute(
+        timestamp = datetime.now().isoformat()
+        cursor.executemany(
             """
             INSERT INTO trade_executions
             (timestamp, symbol, action, quantity, price, total_value, success, error_message, order_id)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                datetime.now().isoformat(),
-                execution.get("symbol", ""),
-                execution.get("action", ""),
-                execution.get("quantity", 0),
-                execution.get("price", 0),
-                execution.get("total_value", 0),
-                execution.get("success", False),
-                execution.get("error_message", ""),
-                execution.get("order_id", ""),
-            ),
+            [
+                (
+                    timestamp,
+                    execution.get("symbol", ""),
+                    execution.get("action", ""),
+                    execution.get("quantity", 0),
+                    execution.get("price", 0),
+                    execution.get("total_value", 0),
+                    execution.get("success", False),
+                    execution.get("error_message", ""),
+                    execution.get("order_id", ""),
+                )
+                for execution in executions
+            ],
         )
 
         conn.commit()
         conn.close()
 
-        logger.info(
-            f"Trade execution recorded: {execution.get('symbol')} - {execution.get('action')}"
-        )
+        summary = ", ".join(f"{e.get('symbol')} - {e.get('action')}" for e in executions)
+        logger.info(f"Trade executions recorded: {summary}")
 
     def update_analytics(self, analytics: Dict[str, Any]):
         """Update performance analytics."""
@@ -0,0 +1,103 @@
+import os
+import time
+
+import numpy as np
+
+# One packed record per decision; signal is -1=SELL, 0=HOLD, 1=BUY
+DECISION_DTYPE = np.dtype(
+    [("ts", "<u8"), ("stock", "S8"), ("signal", "<i1"), ("conf", "<f2")]
+)
+SIGNAL_CODES = {"SELL": -1, "HOLD": 0, "BUY": 1}
+
+
+class DecisionLog:
+    """Fixed-size ring buffer of decisions backed by a memory-mapped file."""
+
+    def __init__(self, path: str = "data/decisions.bin", capacity: int = 1_000_000):
+        """
+        Open the log at path, or defer creating it until the first record.
+
+        An existing log keeps the capacity it was written with, so a changed
+        capacity setting never truncates recorded decisions.
+        """
+        self.path = path
+        self.capacity = capacity
+        self._buf = None
+        self._count = 0
+        self._head = 0
+        self._last_ts = 0
+        if os.path.exists(path):
+            self._open("r+")
+
+    def _open(self, mode: str):
+        if mode == "r+":
+            size = os.path.getsize(self.path)
+            if size == 0 or size % DECISION_DTYPE.itemsize:
+                raise ValueError(f"{self.path} is not a decision log ({size} bytes)")
+            self.capacity = size // DECISION_DTYPE.itemsize
+        else:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._buf = np.memmap(
+            self.path, dtype=DECISION_DTYPE, mode=mode, shape=(self.capacity,)
+        )
+
+        # Recover the write position from the newest timestamp
+        ts = self._buf["ts"]
+        self._count = int(np.count_nonzero(ts))
+        self._head = (int(np.argmax(ts)) + 1) % self.capacity if self._count else 0
+        self._last_ts = int(ts.max()) if self._count else 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, stock: str, signal: str, confidence: float):
+        """Append a decision, overwriting the oldest once the buffer is full."""
+        if self._buf is None:
+            self._open("w+")
+
+        # Keep timestamps strictly increasing so the head can be recovered
+        self._last_ts = max(time.time_ns(), self._last_ts + 1)
+        self._buf[self._head] = (
+            self._last_ts,
+            stock.encode()[:8],
+            SIGNAL_CODES.get(signal, 0),
+            confidence,
+        )
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def recent(self, n: int) -> np.ndarray:
+        """Get the last n records, oldest first."""
+        n = min(n, self._count)
+        if self._buf is None:
+            return np.empty(0, dtype=DECISION_DTYPE)
+        idx = np.arange(self._head - n, self._head) % self.capacity
+        return self._buf[idx]
+
+    def summary(self, n: int = 10) -> dict:
+        """Signal distribution and average confidence over the last n decisions."""
+        recent = self.recent(n)
+        if len(recent) == 0:
+            return {
+                "recent_decisions": 0,
+                "average_confidence": 0.0,
+                "signal_distribution": {"BUY": 0, "SELL": 0, "HOLD": 0},
+            }
+
+        counts = np.bincount(recent["signal"].astype(np.int64) + 1, minlength=3)
+        return {
+            "recent_decisions": len(recent),
+            "average_confidence": float(recent["conf"].astype(np.float64).mean()),
+            "signal_distribution": {
+                "BUY": int(counts[2]),
+                "SELL": int(counts[0]),
+                "HOLD": int(counts[1]),
+            },
+        }
+
+    def flush(self):
+        """Flush pending writes to disk."""
+        if self._buf is not None:
+            self._buf.flush()
@@ -0,0 +1,113 @@
+"""
+On-disk Bar Cache
+Keeps closed daily history per ticker so trading cycles only fetch today's bar
+"""
+
+import json
+import os
+import re
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# Windows that include today can still change; closed windows cannot
+LIVE_TTL = 60  # seconds
+HISTORICAL_TTL = 30 * 24 * 3600  # seconds
+
+# Anchored to the project, never the working directory, since prune() deletes
+DEFAULT_ROOT = str(Path(__file__).resolve().parents[2] / ".cache" / "bars")
+
+# Files this cache writes: <ticker>.parquet / <ticker>.json, plus .tmp leftovers
+_ENTRY_FILE = re.compile(r"^[A-Za-z0-9.\-]+\.(?:parquet|json)(?:\.tmp)?$")
+
+
+class FileCache:
+    """On-disk DataFrame cache: one parquet file plus a JSON sidecar per ticker."""
+
+    def __init__(self, root: str = DEFAULT_ROOT):
+        self.root = root
+
+    def _paths(self, ticker: str) -> tuple[str, str]:
+        base = os.path.join(self.root, ticker)
+        return base + ".parquet", base + ".json"
+
+    @staticmethod
+    def ttl_for(end: str) -> int:
+        """TTL for a window ending on the given YYYY-MM-DD date."""
+        return LIVE_TTL if end >= date.today().isoformat() else HISTORICAL_TTL
+
+    @staticmethod
+    def _is_fresh(meta: dict) -> bool:
+        return time.time() - meta["fetched_at"] < meta["ttl"]
+
+    def get(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """
+        Get cached bars for start..end (inclusive YYYY-MM-DD dates).
+
+        Returns:
+            The cached rows in the window, or None if the entry is missing,
+            expired, unreadable or does not cover the whole window
+        """
+        data_path, meta_path = self._paths(ticker)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if not self._is_fresh(meta):
+                return None
+            if meta["start"] > start or meta["end"] < end:
+                return None
+            return pd.read_parquet(data_path).loc[start:end]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, ticker: str, start: str, end: str, df: pd.DataFrame):
+        """Store a ticker's bars for start..end, replacing any previous entry."""
+        data_path, meta_path = self._paths(ticker)
+        os.makedirs(self.root, exist_ok=True)
+
+        # The sidecar is written last so readers never see a partial entry
+        df.to_parquet(data_path + ".tmp")
+        os.replace(data_path + ".tmp", data_path)
+
+        meta = {"fetched_at": time.time(), "ttl": self.ttl_for(end), "start": start, "end": end}
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def prune(self) -> int:
+        """
+        Delete expired entries, orphaned data files and .tmp leftovers.
+
+        Only files matching the cache's own naming scheme directly under the
+        root are touched; anything else, including subdirectories, is kept.
+
+        Returns:
+            Number of files removed
+        """
+        if not os.path.isdir(self.root):
+            return 0
+
+        names = [name for name in os.listdir(self.root) if _ENTRY_FILE.match(name)]
+        keep = set()
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.root, name)) as f:
+                    fresh = self._is_fresh(json.load(f))
+            except (OSError, ValueError, KeyError):
+                fresh = False
+            if fresh:
+                keep.add(name)
+                keep.add(name[: -len(".json")] + ".parquet")
+
+        removed = 0
+        for name in names:
+            path = os.path.join(self.root, name)
+            if name not in keep and os.path.isfile(path):
+                os.remove(path)
+                removed += 1
+        return removed
@@ -2,15 +2,28 @@
 import asyncio
 import signal
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from src.config.settings import get_settings
 from src.utils.logger import setup_logger
 from src.core.decision_engine import DecisionEngine
 from src.agents.execution_agent import ExecutionAgent
+from src.tools.api import get_session, close_session, get_price_data
 from src.utils.validators import validate_stock_list
 
+try:
+    import orjson
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload).decode()
+except ImportError:
+    import json
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, separators=(",", ":"))
+
 # Global variables for graceful shutdown
 shutdown_event = asyncio.Event()
 logger = setup_logger("stockai.main")
@@ -24,6 +37,7 @@ class StockAIApplication:
         self.settings = get_settings()
         self.decision_engine = None
         self.execution_agent = None
+        self.http_session = None
         self.portfolio = {
             "cash": self.settings.initial_cash,
             "positions": {},
@@ -31,6 +45,12 @@ class StockAIApplication:
         }
         self.cycle_count = 0
         
+        # In-flight analyses keyed by (stock, end_date): a cycle analyzes its
+        # stocks concurrently, so a repeated ticker joins the running analysis;
+        # the semaphore bounds how many analyses run at once
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._analysis_semaphore = asyncio.Semaphore(self.settings.max_concurrent_analyses)
+        
         # Validate configuration
         self._validate_configuration()
         
@@ -51,6 +71,10 @@ class StockAIApplication:
         try:
             logger.info("Initializing services...")
             
+            # Open the shared HTTP session up front so the first cycle
+            # doesn't pay for connection setup on every data request
+            self.http_session = get_session()
+            
             # Initialize decision engine
             self.decision_engine = DecisionEngine()
             await self.decision_engine.initialize()
@@ -85,67 +109,13 @@ class StockAIApplication:
         end_date = datetime.now().strftime("%Y-%m-%d")
         start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
         
-        for stock in self.settings.stock_list:
-            try:
-                logger.info(f"📈 Analyzing {stock}...")
-                
-                # Run comprehensive analysis
-                analysis_result = await self.decision_engine.run_comprehensive_analysis(
-                    stock=stock,
-                    start_date=start_date,
-                    end_date=end_date,
-                    portfolio=self.portfolio
-                )
-                
-                if "error" in analysis_result:
-                    logger.error(f"Analysis failed for {stock}: {analysis_result['error']}")
-                    cycle_results["errors"].append(f"Analysis failed for {stock}: {analysis_result['error']}")
-                    continue
-                
-                # Extract final decision
-                final_decision = analysis_result["final_decision"]
-                trade_signal = final_decision["signal"]
-                confidence = final_decision["confidence"]
-                quantity = final_decision["quantity"]
-                
-                logger.info(f"🎯 Decision for {stock}: {trade_signal} (confidence: {confidence}%, quantity: {quantity})")
-                
-                # Store analysis results
-                stock_result = {
-                    "stock": stock,
-                    "signal": trade_signal,
-                    "confidence": confidence,
-                    "quantity": quantity,
-                    "agent_consensus": final_decision.get("agent_consensus", "unknown"),
-                    "rl_decision": final_decision.get("rl_decision", {}),
-                    "reasoning": final_decision.get("reasoning", "")
-                }
-                cycle_results["stocks_analyzed"].append(stock_result)
-                cycle_results["decisions_made"] += 1
-                
-                # Execute trade if conditions are met
-                if (trade_signal in ["BUY", "SELL"] and 
-                    confidence > self.settings.confidence_threshold and 
-                    quantity > 0):
-                    
-                    try:
-                        await self.execution_agent.execute_trade(
-                            symbol=stock,
-                            action=trade_signal,
-                            quantity=quantity
-                        )
-                        logger.info(f"✅ Trade executed for {stock}: {trade_signal} {quantity} shares")
-                        cycle_results["trades_executed"] += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Trade execution failed for {stock}: {e}")
-                        cycle_results["errors"].append(f"Trade execution failed for {stock}: {e}")
-                else:
-                    logger.info(f"⏸️  Holding {stock} (confidence: {confidence}%, quantity: {quantity})")
-                    
-            except Exception as e:
-                logger.error(f"Unexpected error analyzing {stock}: {e}")
-                cycle_results["errors"].append(f"Unexpected error for {stock}: {e}")
+        # Analyze all stocks concurrently; _analyze_one caps how many run at once
+        await asyncio.gather(
+            *(
+                self._process_stock(stock, start_date, end_date, cycle_results)
+                for stock in self.settings.stock_list
+            )
+        )
         
         # Log cycle summary
         cycle_duration = (datetime.now() - cycle_start).total_seconds()
@@ -155,34 +125,129 @@ class StockAIApplication:
         if self.cycle_count % 10 == 0:
             await self._log_performance_summary()
     
-    def _log_cycle_summary(self, cycle_results: Dict[str, Any], duration: float):
-        """Log cycle summary."""
-        logger.info(f"📋 Cycle #{self.cycle_count} Summary:")
-        logger.info(f"   📊 Stocks Analyzed: {len(cycle_results['stocks_analyzed'])}")
-        logger.info(f"   🎯 Decisions Made: {cycle_results['decisions_made']}")
-        logger.info(f"   💼 Trades Executed: {cycle_results['trades_executed']}")
-        logger.info(f"   ❌ Errors: {len(cycle_results['errors'])}")
-        logger.info(f"   ⏱️  Duration: {duration:.2f}s")
+    async def _process_stock(self, stock: str, start_date: str, end_date: str,
+                             cycle_results: Dict[str, Any]):
+        """Analyze one stock, execute its trade if warranted and record the outcome."""
+        try:
+            logger.info(f"📈 Analyzing {stock}...")
+            
+            # Run comprehensive analysis
+            analysis_result = await self._analyze_one(stock, start_date, end_date)
+            
+            if "error" in analysis_result:
+                logger.error(f"Analysis failed for {stock}: {analysis_result['error']}")
+                cycle_results["errors"].append(f"Analysis failed for {stock}: {analysis_result['error']}")
+                return
+            
+            # Extract final decision
+            final_decision = analysis_result["final_decision"]
+            trade_signal = final_decision["signal"]
+            confidence = final_decision["confidence"]
+            quantity = final_decision["quantity"]
+            
+            logger.info(f"🎯 Decision for {stock}: {trade_signal} (confidence: {confidence}%, quantity: {quantity})")
+            
+            # Store analysis results
+            stock_result = {
+                "stock": stock,
+                "signal": trade_signal,
+                "confidence": confidence,
+                "quantity": quantity,
+                "agent_consensus": final_decision.get("agent_consensus", "unknown"),
+                "rl_decision": final_decision.get("rl_decision", {}),
+                "reasoning": final_decision.get("reasoning", "")
+            }
+            cycle_results["stocks_analyzed"].append(stock_result)
+            cycle_results["decisions_made"] += 1
+            
+            # Execute trade if conditions are met
+            if (trade_signal in ["BUY", "SELL"] and 
+                confidence > self.settings.confidence_threshold and 
+                quantity > 0):
+                
+                try:
+                    await self.execution_agent.execute_trade(
+                        symbol=stock,
+                        action=trade_signal,
+                        quantity=quantity
+                    )
+                    logger.info(f"✅ Trade executed for {stock}: {trade_signal} {quantity} shares")
+                    cycle_results["trades_executed"] += 1
+                    
+                except Exception as e:
+                    logger.error(f"Trade execution failed for {stock}: {e}")
+                    cycle_results["errors"].append(f"Trade execution failed for {stock}: {e}")
+            else:
+                logger.info(f"⏸️  Holding {stock} (confidence: {confidence}%, quantity: {quantity})")
+                
+        except Exception as e:
+            logger.error(f"Unexpected error analyzing {stock}: {e}")
+            cycle_results["errors"].append(f"Unexpected error for {stock}: {e}")
+    
+    async def _analyze_one(self, stock: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Run one analysis, joining an identical one that is already in flight."""
+        key = (stock, end_date)
+        task = self._inflight.get(key)
+        if task is not None:
+            logger.info(f"Joining in-flight analysis for {stock}")
+            return await task
+        
+        async def _run():
+            # Both calls block, so they run in worker threads; the semaphore
+            # caps how many analyses overlap
+            async with self._analysis_semaphore:
+                stock_data = await asyncio.to_thread(
+                    get_price_data, stock, start_date, end_date
+                )
+                return await asyncio.to_thread(
+                    self.decision_engine.run_comprehensive_analysis,
+                    stock=stock,
+                    stock_data=stock_data,
+                    start_date=start_date,
+                    end_date=end_date,
+                    portfolio=self.portfolio
+                )
         
-        # Show signal distribution
-        signals = [s["signal"] for s in cycle_results["stocks_analyzed"]]
-        if signals:
-            buy_count = signals.count("BUY")
-            sell_count = signals.count("SELL")
-            hold_count = signals.count("HOLD")
-            logger.info(f"   📈 Signal Distribution: BUY({buy_count}) | SELL({sell_count}) | HOLD({hold_count})")
+        task = asyncio.create_task(_run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await task
+    
+    def _log_cycle_summary(self, cycle_results: Dict[str, Any], duration: float):
+        """Log cycle summary as a single structured line."""
+        stocks = cycle_results["stocks_analyzed"]
+        signal_counts = Counter(s["signal"] for s in stocks)
+        summary = {
+            "cycle": self.cycle_count,
+            "stocks_analyzed": len(stocks),
+            "decisions_made": cycle_results["decisions_made"],
+            "trades_executed": cycle_results["trades_executed"],
+            "errors": len(cycle_results["errors"]),
+            "duration_s": round(duration, 2),
+            "signal_distribution": {
+                "BUY": signal_counts.get("BUY", 0),
+                "SELL": signal_counts.get("SELL", 0),
+                "HOLD": signal_counts.get("HOLD", 0),
+            },
+        }
+        logger.info("cycle_summary %s", _dumps(summary))
     
     async def _log_performance_summary(self):
-        """Log performance summary."""
-        logger.info(f"📊 Performance Summary (Last 10 Cycles):")
-        
+        """Log performance summary as a single structured line."""
         if self.decision_engine:
             performance = self.decision_engine.get_performance_summary()
-            logger.info(f"   🎯 Total Decisions: {performance.get('total_decisions', 0)}")
-            logger.info(f"   📊 Average Confidence: {performance.get('average_confidence', 0):.1f}%")
-            
             signal_dist = performance.get('signal_distribution', {})
-            logger.info(f"   📈 Signal Distribution: BUY({signal_dist.get('BUY', 0)}) | SELL({signal_dist.get('SELL', 0)}) | HOLD({signal_dist.get('HOLD', 0)})")
+            summary = {
+                "cycle": self.cycle_count,
+                "total_decisions": performance.get('total_decisions', 0),
+                "average_confidence": round(float(performance.get('average_confidence', 0)), 1),
+                "signal_distribution": {
+                    "BUY": signal_dist.get('BUY', 0),
+                    "SELL": signal_dist.get('SELL', 0),
+                    "HOLD": signal_dist.get('HOLD', 0),
+                },
+            }
+            logger.info("performance_summary %s", _dumps(summary))
     
     async def run(self):
         """Main application loop."""
@@ -231,6 +296,10 @@ class StockAIApplication:
         if self.execution_agent:
             await self.execution_agent.shutdown()
         
+        if self.http_session:
+            close_session()
+            self.http_session = None
+        
         logger.info("✅ StockAI shutdown complete")
 
 
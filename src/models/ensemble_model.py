@@ -1,7 +1,16 @@
 import joblib
-import numpy as np
 from typing import List, Dict, Any
 
+# Ensemble vote sign -> signal name
+SIGNAL_MAP = {1: "BUY", -1: "SELL", 0: "HOLD"}
+
+
+def _majority(buy_mask: int, sell_mask: int) -> int:
+    """Majority vote from per-model vote bitmasks: 1=BUY, -1=SELL, 0=HOLD (incl. ties)."""
+    buys = buy_mask.bit_count()
+    sells = sell_mask.bit_count()
+    return (buys > sells) - (sells > buys)
+
 class EnsembleRLModel:
     """
     5-Model Ensemble RL System for robust trading decisions.
@@ -54,6 +63,8 @@ class EnsembleRLModel:
         # Collect predictions from all models
         predictions = []
         model_predictions = {}
+        # Bit i is set when model i voted that way
+        buy_mask = sell_mask = hold_mask = 0
         
         for i, model in enumerate(self.models):
             model_name = self.model_names[i] if i < len(self.model_names) else f"Model_{i+1}"
@@ -61,10 +72,12 @@ class EnsembleRLModel:
                 pred = model.predict([features])[0]
                 predictions.append(pred)
                 model_predictions[model_name] = pred
+                buy_mask |= int(pred == 1) << i
+                sell_mask |= int(pred == -1) << i
+                hold_mask |= int(pred == 0) << i
                 
                 # Map prediction to signal for logging
-                signal_map = {1: "BUY", -1: "SELL", 0: "HOLD"}
-                signal = signal_map.get(pred, "UNKNOWN")
+                signal = SIGNAL_MAP.get(pred, "UNKNOWN")
                 print(f"🎯 {model_name}: {signal} (prediction: {pred})")
                 
             except Exception as e:
@@ -76,15 +89,14 @@ class EnsembleRLModel:
             return 0  # Default to HOLD
         
         # Majority voting: 1=BUY, -1=SELL, 0=HOLD
-        ensemble_prediction = int(np.sign(np.sum(predictions)))
+        ensemble_prediction = _majority(buy_mask, sell_mask)
         
         # Log ensemble decision
-        signal_map = {1: "BUY", -1: "SELL", 0: "HOLD"}
-        ensemble_signal = signal_map.get(ensemble_prediction, "UNKNOWN")
+        ensemble_signal = SIGNAL_MAP[ensemble_prediction]
         
         print(f"🎯 Ensemble Decision: {ensemble_signal} (prediction: {ensemble_prediction})")
         print(f"📊 Individual Predictions: {model_predictions}")
-        print(f"📈 Vote Count: BUY({predictions.count(1)}) | SELL({predictions.count(-1)}) | HOLD({predictions.count(0)})")
+        print(f"📈 Vote Count: BUY({buy_mask.bit_count()}) | SELL({sell_mask.bit_count()}) | HOLD({hold_mask.bit_count()})")
         
         return ensemble_prediction
     
@@ -110,6 +122,8 @@ class EnsembleRLModel:
         # Collect predictions from all models
         predictions = []
         model_predictions = {}
+        # Bit i is set when model i voted that way
+        buy_mask = sell_mask = hold_mask = 0
         
         for i, model in enumerate(self.models):
             model_name = self.model_names[i] if i < len(self.model_names) else f"Model_{i+1}"
@@ -117,10 +131,12 @@ class EnsembleRLModel:
                 pred = model.predict([features])[0]
                 predictions.append(pred)
                 model_predictions[model_name] = pred
+                buy_mask |= int(pred == 1) << i
+                sell_mask |= int(pred == -1) << i
+                hold_mask |= int(pred == 0) << i
                 
                 # Map prediction to signal for logging
-                signal_map = {1: "BUY", -1: "SELL", 0: "HOLD"}
-                signal = signal_map.get(pred, "UNKNOWN")
+                signal = SIGNAL_MAP.get(pred, "UNKNOWN")
                 print(f"🎯 {model_name}: {signal} (prediction: {pred})")
                 
             except Exception as e:
@@ -137,17 +153,16 @@ class EnsembleRLModel:
             }
         
         # Majority voting: 1=BUY, -1=SELL, 0=HOLD
-        ensemble_prediction = int(np.sign(np.sum(predictions)))
+        ensemble_prediction = _majority(buy_mask, sell_mask)
         
         # Log ensemble decision
-        signal_map = {1: "BUY", -1: "SELL", 0: "HOLD"}
-        ensemble_signal = signal_map.get(ensemble_prediction, "UNKNOWN")
+        ensemble_signal = SIGNAL_MAP[ensemble_prediction]
         
         # Count votes
         vote_counts = {
-            "BUY": predictions.count(1),
-            "SELL": predictions.count(-1),
-            "HOLD": predictions.count(0)
+            "BUY": buy_mask.bit_count(),
+            "SELL": sell_mask.bit_count(),
+            "HOLD": hold_mask.bit_count()
         }
         
         print(f"🎯 Ensemble Decision: {ensemble_signal} (prediction: {ensemble_prediction})")
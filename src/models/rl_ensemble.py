@@ -13,17 +13,16 @@ Models are trained using Stable-Baselines3 on historical stock data.
 
 import os
 import logging
+import importlib
+import importlib.util
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-# Stable-Baselines3 imports
-try:
-    from stable_baselines3 import SAC, PPO, A2C, TD3, DDPG
-
-    SB3_AVAILABLE = True
-except ImportError:
-    SB3_AVAILABLE = False
+# Stable-Baselines3 pulls in torch, so only check it is installed here and
+# import it when models are actually loaded
+SB3_AVAILABLE = importlib.util.find_spec("stable_baselines3") is not None
+if not SB3_AVAILABLE:
     logging.warning("Stable-Baselines3 not installed. RL models will not be available.")
 
 logger = logging.getLogger(__name__)
@@ -58,24 +57,30 @@ class RLEnsemble:
 
         # Model configurations
         self.model_configs = {
-            "SAC": {"class": SAC, "file": "agent_sac.zip"},
-            "PPO": {"class": PPO, "file": "agent_ppo.zip"},
-            "A2C": {"class": A2C, "file": "agent_a2c.zip"},
-            "TD3": {"class": TD3, "file": "agent_td3.zip"},
-            "DDPG": {"class": DDPG, "file": "agent_ddpg.zip"},
+            "SAC": {"class_name": "SAC", "file": "agent_sac.zip"},
+            "PPO": {"class_name": "PPO", "file": "agent_ppo.zip"},
+            "A2C": {"class_name": "A2C", "file": "agent_a2c.zip"},
+            "TD3": {"class_name": "TD3", "file": "agent_td3.zip"},
+            "DDPG": {"class_name": "DDPG", "file": "agent_ddpg.zip"},
         }
 
         # Loaded models
         self.models: Dict[str, any] = {}
         self.model_status: Dict[str, bool] = {}
 
+        # Unrolled predict function for the loaded model set (see _build_specialized_predict)
+        self._predict_specialized = None
+
         # Load all models
         self._load_all_models()
+        self._predict_specialized = self._build_specialized_predict()
 
     def _load_all_models(self):
         """Load all RL models from disk."""
         logger.info(f"🤖 Loading RL Ensemble from {self.models_dir}")
 
+        sb3 = importlib.import_module("stable_baselines3")
+
         for name, config in self.model_configs.items():
             model_path = self.models_dir / config["file"]
 
@@ -86,7 +91,7 @@ class RLEnsemble:
 
             try:
                 # Load model using Stable-Baselines3
-                model_class = config["class"]
+                model_class = getattr(sb3, config["class_name"])
                 model = model_class.load(str(model_path))
 
                 self.models[name] = model
@@ -104,26 +109,33 @@ class RLEnsemble:
         if loaded_count == 0:
             logger.error("❌ No RL models loaded! Ensemble will not function.")
 
-    def predict(
-        self, observation: np.ndarray, deterministic: bool = True
-    ) -> Tuple[int, Dict]:
+    def _build_specialized_predict(self):
         """
-        Make prediction using ensemble of RL models.
-
-        Args:
-            observation: Numpy array of features (shape: (n_features,))
-            deterministic: Use deterministic actions (recommended for inference)
+        Generate a predict function unrolled over the loaded models.
 
-        Returns:
-            Tuple of (ensemble_action, details_dict)
-            - ensemble_action: 0=HOLD, 1=BUY, 2=SELL (or continuous value)
-            - details_dict: Individual model predictions and voting details
+        The model set never changes after loading, so the per-call dict
+        iteration and isinstance checks can be compiled away. Returns None
+        when no models are loaded.
         """
         if not self.models:
-            logger.warning("⚠️  No models available for prediction")
-            return 0, {"error": "No models loaded"}
+            return None
 
-        # Collect predictions from all models
+        names = [f"a{i}" for i in range(len(self.models))]
+        lines = ["def _predict_specialized(obs, deterministic):"]
+        for i, name in enumerate(names):
+            lines.append(
+                f"    {name} = float(m{i}.predict(obs, deterministic=deterministic)[0].flat[0])"
+            )
+        lines.append(f"    return {' + '.join(names)}, [{', '.join(names)}]")
+
+        namespace = {f"m{i}": model for i, model in enumerate(self.models.values())}
+        exec(compile("\n".join(lines), "<rl_ensemble>", "exec"), namespace)
+        return namespace["_predict_specialized"]
+
+    def _collect_predictions(
+        self, observation: np.ndarray, deterministic: bool
+    ) -> Tuple[List[float], Dict[str, float]]:
+        """Query each model in turn, isolating per-model failures."""
         predictions = []
         model_predictions = {}
 
@@ -146,6 +158,45 @@ class RLEnsemble:
                 logger.error(f"❌ Prediction error in {name}: {e}")
                 model_predictions[name] = 0  # Default to HOLD/neutral
 
+        return predictions, model_predictions
+
+    def predict(
+        self, observation: np.ndarray, deterministic: bool = True
+    ) -> Tuple[int, Dict]:
+        """
+        Make prediction using ensemble of RL models.
+
+        Args:
+            observation: Numpy array of features (shape: (n_features,))
+            deterministic: Use deterministic actions (recommended for inference)
+
+        Returns:
+            Tuple of (ensemble_action, details_dict)
+            - ensemble_action: 0=HOLD, 1=BUY, 2=SELL (or continuous value)
+            - details_dict: Individual model predictions and voting details
+        """
+        if not self.models:
+            logger.warning("⚠️  No models available for prediction")
+            return 0, {"error": "No models loaded"}
+
+        # Collect predictions from all models. The specialized path has no
+        # per-model error isolation, so any failure falls back to the loop.
+        predictions = None
+        total = None
+        if self._predict_specialized is not None:
+            try:
+                total, predictions = self._predict_specialized(observation, deterministic)
+                model_predictions = dict(zip(self.models, predictions))
+            except Exception as e:
+                logger.debug(f"Specialized predict failed, using per-model loop: {e}")
+                predictions = None
+
+        if predictions is None:
+            predictions, model_predictions = self._collect_predictions(
+                observation, deterministic
+            )
+            total = sum(predictions)
+
         if not predictions:
             logger.warning("❌ No valid predictions from any model")
             return 0, {"error": "All model predictions failed"}
@@ -153,7 +204,8 @@ class RLEnsemble:
         # Ensemble strategy: Majority voting or averaging
         # For continuous actions, average them
         # For discrete actions, use majority vote
-        ensemble_action = np.mean(predictions)
+        # Plain float mean; np.mean dispatch costs more than the 5-element sum
+        ensemble_action = float(total) / len(predictions)
 
         # Convert to discrete action (0=HOLD, 1=BUY, 2=SELL)
         # This mapping depends on your environment's action space
@@ -1,6 +1,7 @@
 import os
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.data.cache import get_cache
 from src.data.models import (
@@ -17,6 +18,28 @@ from src.data.models import (
 # Global cache instance
 _cache = get_cache()
 
+# Shared HTTP session so every call reuses pooled keep-alive connections
+_session: requests.Session | None = None
+
+
+def get_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def close_session():
+    """Close the shared HTTP session and release its connections."""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
 
 def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
     """Fetch price data from cache or API."""
@@ -44,7 +67,7 @@ def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
         f"&start_date={start_date}"
         f"&end_date={end_date}"
     )
-    response = requests.get(url, headers=headers)
+    response = get_session().get(url, headers=headers)
     if response.status_code != 200:
         raise Exception(
             f"Error fetching data: {response.status_code} - {response.text}"
@@ -93,7 +116,7 @@ def get_financial_metrics(
         f"&limit={limit}"
         f"&period={period}"
     )
-    response = requests.get(url, headers=headers)
+    response = get_session().get(url, headers=headers)
     if response.status_code != 200:
         raise Exception(
             f"Error fetching data: {response.status_code} - {response.text}"
@@ -146,7 +169,7 @@ def search_line_items(
         "period": period,
         "limit": limit,
     }
-    response = requests.post(url, headers=headers, json=body)
+    response = get_session().post(url, headers=headers, json=body)
     if response.status_code != 200:
         raise Exception(
             f"Error fetching data: {response.status_code} - {response.text}"
@@ -194,7 +217,7 @@ def get_insider_trades(
         f"&filing_date_lte={end_date}"
         f"&limit={limit}"
     )
-    response = requests.get(url, headers=headers)
+    response = get_session().get(url, headers=headers)
     if response.status_code != 200:
         raise Exception(
             f"Error fetching data: {response.status_code} - {response.text}"
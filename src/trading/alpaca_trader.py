@@ -6,23 +6,63 @@ It includes order management, portfolio tracking, risk controls, and error handl
 """
 
 import os
+import time
 import logging
+import threading
+import uuid
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Union, Literal
-from datetime import datetime, timedelta
 from dataclasses import dataclass
 import alpaca_trade_api as tradeapi
 from alpaca_trade_api.rest import APIError, TimeFrame
+from alpaca_trade_api.common import URL
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Basket submission limits (kept under Alpaca's REST rate limit)
+ORDER_WORKERS = 10
+ORDER_BATCH_SIZE = 10
+ORDER_BATCH_INTERVAL = 1.0  # seconds between batches
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Parse REST response bodies with orjson instead of stdlib json."""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+RECENT_ORDERS_MAX = 1024
+
+
+# Bar timeframe string -> TimeFrame, built once
+_TIMEFRAME_MAP = MappingProxyType(
+    {
+        "1Min": TimeFrame.Minute,
+        "5Min": TimeFrame(5, TimeFrame.Minute),
+        "15Min": TimeFrame(15, TimeFrame.Minute),
+        "1Hour": TimeFrame.Hour,
+        "1Day": TimeFrame.Day,
+    }
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class TradeOrder:
     """Represents a trade order with all necessary information."""
 
@@ -34,6 +74,7 @@ class TradeOrder:
     time_in_force: str = "gtc"
     limit_price: Optional[float] = None
     stop_price: Optional[float] = None
+    client_order_id: Optional[str] = None  # reuse only when retrying this order
 
     def __post_init__(self):
         """Validate order parameters."""
@@ -45,7 +86,7 @@ class TradeOrder:
             raise ValueError(f"Confidence must be between 0 and 100: {self.confidence}")
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioPosition:
     """Represents a portfolio position."""
 
@@ -57,6 +98,8 @@ class PortfolioPosition:
     unrealized_pl: float
     unrealized_plpc: float
     cost_basis: float
+    change_today: float = 0.0
+    unrealized_intraday_plpc: float = 0.0
 
     @property
     def is_long(self) -> bool:
@@ -67,6 +110,160 @@ class PortfolioPosition:
         return self.quantity < 0
 
 
+@dataclass(slots=True, frozen=True)
+class AccountView:
+    """Converted snapshot of the Alpaca account fields."""
+
+    cash: float
+    portfolio_value: float
+    buying_power: float
+    equity: float
+    last_equity: float
+    multiplier: int
+    long_market_value: float
+    short_market_value: float
+    initial_margin: float
+    maintenance_margin: float
+    daytrade_count: int
+    pattern_day_trader: bool
+    trading_blocked: bool
+    transfers_blocked: bool
+    account_blocked: bool
+
+    @classmethod
+    def from_account(cls, account) -> "AccountView":
+        """Build a view from an Alpaca account entity."""
+        return cls(
+            cash=float(account.cash),
+            portfolio_value=float(account.portfolio_value),
+            buying_power=float(account.buying_power),
+            equity=float(account.equity),
+            last_equity=float(account.last_equity),
+            multiplier=int(account.multiplier),
+            long_market_value=float(account.long_market_value),
+            short_market_value=float(account.short_market_value),
+            initial_margin=float(account.initial_margin),
+            maintenance_margin=float(account.maintenance_margin),
+            daytrade_count=int(account.daytrade_count),
+            pattern_day_trader=account.pattern_day_trader,
+            trading_blocked=account.trading_blocked,
+            transfers_blocked=account.transfers_blocked,
+            account_blocked=account.account_blocked,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MarketDataStream:
+    """
+    Background Alpaca data stream caching the latest trade and quote per symbol.
+
+    Symbols are subscribed lazily on first lookup and unsubscribed once they
+    have gone unused for ``idle_timeout`` seconds. Lookups return None when
+    nothing fresher than ``max_age`` seconds has arrived, so callers can fall
+    back to REST.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        base_url: str,
+        data_feed: str = "iex",
+        idle_timeout: float = 900,
+        max_age: float = 60,
+    ):
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self._stream = tradeapi.Stream(
+            api_key, api_secret, base_url=URL(base_url), data_feed=data_feed
+        )
+        self._latest_trade: Dict[str, tuple] = {}  # symbol -> (price, received_at)
+        self._latest_quote: Dict[str, tuple] = {}  # symbol -> (quote dict, received_at)
+        self._last_access: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    async def _on_trade(self, trade):
+        self._latest_trade[trade.symbol] = (float(trade.price), time.monotonic())
+
+    async def _on_quote(self, quote):
+        self._latest_quote[quote.symbol] = (
+            {
+                "symbol": quote.symbol,
+                "bid_price": float(quote.bid_price),
+                "ask_price": float(quote.ask_price),
+                "bid_size": int(quote.bid_size),
+                "ask_size": int(quote.ask_size),
+                "timestamp": quote.timestamp,
+            },
+            time.monotonic(),
+        )
+
+    def _watch(self, symbol: str):
+        """Mark a symbol as in use, subscribing new ones and evicting idle ones."""
+        now = time.monotonic()
+        idle = []
+        with self._lock:
+            is_new = symbol not in self._last_access
+            self._last_access[symbol] = now
+            self._last_access.move_to_end(symbol)
+            while self._last_access:
+                oldest, last_used = next(iter(self._last_access.items()))
+                if now - last_used < self.idle_timeout:
+                    break
+                self._last_access.popitem(last=False)
+                idle.append(oldest)
+
+            # Claim the stream thread under the lock so only one is ever created
+            new_thread = None
+            if is_new and self._thread is None:
+                new_thread = self._thread = threading.Thread(
+                    target=self._stream.run, name="alpaca-stream", daemon=True
+                )
+
+        try:
+            if is_new:
+                try:
+                    self._stream.subscribe_trades(self._on_trade, symbol)
+                    self._stream.subscribe_quotes(self._on_quote, symbol)
+                finally:
+                    if new_thread is not None:
+                        new_thread.start()
+            if idle:
+                self._stream.unsubscribe_trades(*idle)
+                self._stream.unsubscribe_quotes(*idle)
+                for sym in idle:
+                    self._latest_trade.pop(sym, None)
+                    self._latest_quote.pop(sym, None)
+        except Exception as e:
+            logger.warning(f"Market data stream subscription update failed: {e}")
+
+    def _fresh(self, cache: Dict[str, tuple], symbol: str):
+        self._watch(symbol)
+        entry = cache.get(symbol)
+        if entry is None or time.monotonic() - entry[1] > self.max_age:
+            return None
+        return entry[0]
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """Latest streamed trade price, or None if not available."""
+        return self._fresh(self._latest_trade, symbol)
+
+    def get_quote(self, symbol: str) -> Optional[Dict]:
+        """Latest streamed quote, or None if not available."""
+        return self._fresh(self._latest_quote, symbol)
+
+    def stop(self):
+        """Stop the stream."""
+        try:
+            self._stream.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop market data stream: {e}")
+
+
 class AlpacaTrader:
     """
     Enhanced Alpaca trading interface with comprehensive features.
@@ -86,6 +283,7 @@ class AlpacaTrader:
         api_secret: Optional[str] = None,
         base_url: Optional[str] = None,
         paper_trading: bool = True,
+        stream_market_data: bool = False,
     ):
         """
         Initialize Alpaca trader.
@@ -95,6 +293,8 @@ class AlpacaTrader:
             api_secret: Alpaca API secret (defaults to ALPACA_API_SECRET env var)
             base_url: Alpaca base URL (defaults to ALPACA_BASE_URL env var)
             paper_trading: Use paper trading account (default: True)
+            stream_market_data: Serve latest prices/quotes from a WebSocket
+                stream instead of polling REST (default: False)
         """
         self.api_key = api_key or os.getenv("ALPACA_API_KEY")
         self.api_secret = api_secret or os.getenv("ALPACA_API_SECRET")
@@ -118,40 +318,121 @@ class AlpacaTrader:
             self.api = tradeapi.REST(
                 self.api_key, self.api_secret, self.base_url, api_version="v2"
             )
+            self.api._session = self._create_session()
             logger.info(f"Alpaca API initialized: {self.base_url}")
         except Exception as e:
             logger.error(f"Failed to initialize Alpaca API: {e}")
             raise
 
-        # Cache for account and position data
-        self._account_cache = None
-        self._positions_cache = {}
-        self._cache_timestamp = None
-        self._cache_ttl = 60  # Cache TTL in seconds
+        # Cached REST data: name -> (value, monotonic timestamp), each with its own TTL
+        # in seconds matched to how quickly the endpoint's data changes
+        self._cache_entries: Dict[str, tuple] = {}
+        self._cache_ttl = {"account": 10, "positions": 5, "clock": 60}
+
+        # Converted view of the cached account, rebuilt when the account object changes
+        self._account_view: Optional[AccountView] = None
+        self._account_view_source = None
 
-    def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid."""
-        if self._cache_timestamp is None:
+        # Optional streaming cache for latest trades/quotes
+        self._stream = (
+            MarketDataStream(self.api_key, self.api_secret, self.base_url)
+            if stream_market_data
+            else None
+        )
+
+        # Recently submitted orders by client_order_id, for deduplicating retries
+        self._recent_orders: "OrderedDict[str, dict]" = OrderedDict()
+        self._recent_orders_lock = threading.Lock()
+
+        # Worker pool for concurrent REST calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=ORDER_WORKERS, thread_name_prefix="alpaca"
+        )
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create a keep-alive HTTP session sized for the worker pool.
+
+        Retries only cover idempotent requests (urllib3 does not retry POST),
+        so order submission is never resent.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+            pool_block=False,
+        )
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        if orjson is not None:
+            session.hooks["response"].append(_orjson_response_hook)
+        return session
+
+    def _is_cache_valid(self, name: str) -> bool:
+        """Check if a cache entry is still valid."""
+        entry = self._cache_entries.get(name)
+        if entry is None:
             return False
-        return (
-            datetime.now() - self._cache_timestamp
-        ).total_seconds() < self._cache_ttl
+        return (time.monotonic() - entry[1]) < self._cache_ttl[name]
+
+    def _get_cached(self, name: str, fetcher, force_refresh: bool = False):
+        """
+        Get a cached value, refreshing it via fetcher when stale.
+
+        If the refresh fails the previous value (if any) is returned.
+        """
+        if force_refresh or not self._is_cache_valid(name):
+            try:
+                self._cache_entries[name] = (fetcher(), time.monotonic())
+                logger.debug(f"{name} cache refreshed")
+            except Exception as e:
+                logger.error(f"Failed to refresh {name} cache: {e}")
+
+        entry = self._cache_entries.get(name)
+        return entry[0] if entry else None
+
+    def _fetch_account(self):
+        """Fetch the account, keeping the cached object if nothing changed."""
+        account = self.api.get_account()
+        cached = self._cache_entries.get("account")
+        if cached is not None and cached[0]._raw == account._raw:
+            return cached[0]
+        return account
+
+    def _fetch_positions(self) -> dict:
+        """Fetch open positions keyed by symbol."""
+        return {pos.symbol: pos for pos in self.api.list_positions()}
 
     def _refresh_cache(self):
-        """Refresh account and position cache."""
-        try:
-            self._account_cache = self.api.get_account()
-            positions = self.api.list_positions()
-            self._positions_cache = {pos.symbol: pos for pos in positions}
-            self._cache_timestamp = datetime.now()
-            logger.debug("Cache refreshed successfully")
-        except Exception as e:
-            logger.error(f"Failed to refresh cache: {e}")
+        """Refresh account and position cache, fetching both concurrently."""
+        futures = [
+            self._executor.submit(self._get_cached, "account", self._fetch_account, True),
+            self._executor.submit(self._get_cached, "positions", self._fetch_positions, True),
+        ]
+        for future in futures:
+            future.result()
 
     # ============================================
     # Account Management
     # ============================================
 
+    def _get_account_view(self, force_refresh: bool = False) -> AccountView:
+        """
+        Get the converted account view.
+
+        Field conversions run once per fetched account, not once per call.
+        """
+        account = self._get_cached("account", self._fetch_account, force_refresh)
+        if account is None:
+            raise Exception("Failed to retrieve account information")
+
+        if account is not self._account_view_source:
+            self._account_view = AccountView.from_account(account)
+            self._account_view_source = account
+        return self._account_view
+
     def get_account(self, force_refresh: bool = False) -> dict:
         """
         Get account information.
@@ -162,50 +443,29 @@ class AlpacaTrader:
         Returns:
             Dictionary with account information
         """
-        if force_refresh or not self._is_cache_valid():
-            self._refresh_cache()
-
-        if self._account_cache is None:
-            raise Exception("Failed to retrieve account information")
-
-        account = self._account_cache
-        return {
-            "cash": float(account.cash),
-            "portfolio_value": float(account.portfolio_value),
-            "buying_power": float(account.buying_power),
-            "equity": float(account.equity),
-            "last_equity": float(account.last_equity),
-            "multiplier": int(account.multiplier),
-            "long_market_value": float(account.long_market_value),
-            "short_market_value": float(account.short_market_value),
-            "initial_margin": float(account.initial_margin),
-            "maintenance_margin": float(account.maintenance_margin),
-            "daytrade_count": int(account.daytrade_count),
-            "pattern_day_trader": account.pattern_day_trader,
-            "trading_blocked": account.trading_blocked,
-            "transfers_blocked": account.transfers_blocked,
-            "account_blocked": account.account_blocked,
-        }
+        return self._get_account_view(force_refresh).to_dict()
 
     def get_buying_power(self, force_refresh: bool = False) -> float:
         """Get available buying power."""
-        account = self.get_account(force_refresh)
-        return account["buying_power"]
+        return self._get_account_view(force_refresh).buying_power
 
     def get_cash_balance(self, force_refresh: bool = False) -> float:
         """Get cash balance."""
-        account = self.get_account(force_refresh)
-        return account["cash"]
+        return self._get_account_view(force_refresh).cash
 
     def get_portfolio_value(self, force_refresh: bool = False) -> float:
         """Get total portfolio value."""
-        account = self.get_account(force_refresh)
-        return account["portfolio_value"]
+        return self._get_account_view(force_refresh).portfolio_value
 
     # ============================================
     # Position Management
     # ============================================
 
+    def _get_raw_position(self, symbol: str, force_refresh: bool = False):
+        """Get the cached API position entity for a symbol, or None."""
+        positions = self._get_cached("positions", self._fetch_positions, force_refresh)
+        return (positions or {}).get(symbol)
+
     def get_position(
         self, symbol: str, force_refresh: bool = False
     ) -> Optional[PortfolioPosition]:
@@ -219,10 +479,7 @@ class AlpacaTrader:
         Returns:
             PortfolioPosition object or None if no position
         """
-        if force_refresh or not self._is_cache_valid():
-            self._refresh_cache()
-
-        pos = self._positions_cache.get(symbol)
+        pos = self._get_raw_position(symbol, force_refresh)
         if pos is None:
             return None
 
@@ -235,14 +492,15 @@ class AlpacaTrader:
             unrealized_pl=float(pos.unrealized_pl),
             unrealized_plpc=float(pos.unrealized_plpc),
             cost_basis=float(pos.cost_basis),
+            change_today=float(pos.change_today or 0),
+            unrealized_intraday_plpc=float(pos.unrealized_intraday_plpc or 0),
         )
 
     def get_all_positions(self, force_refresh: bool = False) -> List[PortfolioPosition]:
         """Get all open positions."""
-        if force_refresh or not self._is_cache_valid():
-            self._refresh_cache()
+        positions = self._get_cached("positions", self._fetch_positions, force_refresh)
 
-        return [
+        result = [
             PortfolioPosition(
                 symbol=pos.symbol,
                 quantity=int(pos.qty),
@@ -252,14 +510,18 @@ class AlpacaTrader:
                 unrealized_pl=float(pos.unrealized_pl),
                 unrealized_plpc=float(pos.unrealized_plpc),
                 cost_basis=float(pos.cost_basis),
+                change_today=float(pos.change_today or 0),
+                unrealized_intraday_plpc=float(pos.unrealized_intraday_plpc or 0),
             )
-            for pos in self._positions_cache.values()
+            for pos in (positions or {}).values()
         ]
 
+        return result
+
     def get_position_quantity(self, symbol: str, force_refresh: bool = False) -> int:
         """Get quantity of shares held for a symbol."""
-        position = self.get_position(symbol, force_refresh)
-        return position.quantity if position else 0
+        pos = self._get_raw_position(symbol, force_refresh)
+        return int(pos.qty) if pos is not None else 0
 
     # ============================================
     # Market Data
@@ -275,6 +537,11 @@ class AlpacaTrader:
         Returns:
             Latest price or None if not available
         """
+        if self._stream is not None:
+            price = self._stream.get_price(symbol)
+            if price is not None:
+                return price
+
         try:
             quote = self.api.get_latest_trade(symbol)
             return float(quote.price)
@@ -282,8 +549,44 @@ class AlpacaTrader:
             logger.error(f"Failed to get latest price for {symbol}: {e}")
             return None
 
+    def get_latest_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get latest prices for many symbols with a single REST request.
+
+        Prefer this over calling get_latest_price in a loop.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dictionary of symbol -> latest price (symbols without a price are omitted)
+        """
+        prices = {}
+        missing = []
+        for symbol in symbols:
+            price = self._stream.get_price(symbol) if self._stream is not None else None
+            if price is None:
+                missing.append(symbol)
+            else:
+                prices[symbol] = price
+
+        if missing:
+            try:
+                trades = self.api.get_latest_trades(missing)
+                for symbol, trade in trades.items():
+                    prices[symbol] = float(trade.price)
+            except Exception as e:
+                logger.error(f"Failed to get latest prices for {missing}: {e}")
+
+        return prices
+
     def get_latest_quote(self, symbol: str) -> Optional[Dict]:
         """Get latest quote (bid/ask) for a symbol."""
+        if self._stream is not None:
+            quote = self._stream.get_quote(symbol)
+            if quote is not None:
+                return quote
+
         try:
             quote = self.api.get_latest_quote(symbol)
             return {
@@ -321,15 +624,7 @@ class AlpacaTrader:
         """
         try:
             # Map timeframe string to TimeFrame enum
-            timeframe_map = {
-                "1Min": TimeFrame.Minute,
-                "5Min": TimeFrame(5, TimeFrame.Minute),
-                "15Min": TimeFrame(15, TimeFrame.Minute),
-                "1Hour": TimeFrame.Hour,
-                "1Day": TimeFrame.Day,
-            }
-
-            tf = timeframe_map.get(timeframe, TimeFrame.Day)
+            tf = _TIMEFRAME_MAP.get(timeframe, TimeFrame.Day)
 
             bars = self.api.get_bars(symbol, tf, start=start, end=end, limit=limit).df
 
@@ -338,10 +633,71 @@ class AlpacaTrader:
             logger.error(f"Failed to get bars for {symbol}: {e}")
             return pd.DataFrame()
 
+    def get_bars_multi(
+        self,
+        symbols: List[str],
+        timeframe: str = "1Day",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get historical bars for many symbols in one request.
+
+        Args:
+            symbols: Stock symbols
+            timeframe: Bar timeframe (1Min, 5Min, 15Min, 1Hour, 1Day)
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary of symbol -> DataFrame with OHLCV data (symbols with no
+            bars are omitted)
+        """
+        try:
+            tf = _TIMEFRAME_MAP.get(timeframe, TimeFrame.Day)
+            bars = self.api.get_bars(symbols, tf, start=start, end=end).df
+            if bars.empty:
+                return {}
+
+            return {
+                symbol: frame.drop(columns="symbol")
+                for symbol, frame in bars.groupby("symbol", sort=False)
+            }
+        except Exception as e:
+            logger.error(f"Failed to get bars for {symbols}: {e}")
+            return {}
+
     # ============================================
     # Order Execution
     # ============================================
 
+    @staticmethod
+    def _order_to_dict(order) -> dict:
+        """Convert an Alpaca order entity to a dictionary."""
+        return {
+            "id": order.id,
+            "client_order_id": order.client_order_id,
+            "symbol": order.symbol,
+            "qty": int(order.qty),
+            "side": order.side,
+            "type": order.type,
+            "time_in_force": order.time_in_force,
+            "limit_price": float(order.limit_price) if order.limit_price else None,
+            "stop_price": float(order.stop_price) if order.stop_price else None,
+            "status": order.status,
+            "created_at": order.created_at,
+            "filled_avg_price": float(order.filled_avg_price)
+            if order.filled_avg_price
+            else None,
+        }
+
+    def _remember_order(self, client_order_id: str, result: dict):
+        """Record a submitted order, evicting the oldest beyond RECENT_ORDERS_MAX."""
+        with self._recent_orders_lock:
+            self._recent_orders[client_order_id] = result
+            while len(self._recent_orders) > RECENT_ORDERS_MAX:
+                self._recent_orders.popitem(last=False)
+
     def submit_order(
         self,
         symbol: str,
@@ -356,6 +712,12 @@ class AlpacaTrader:
         """
         Submit an order to Alpaca.
 
+        The client_order_id identifies one logical order: submitting it again
+        is treated as a retry and returns the original order instead of
+        placing another. Callers that may retry should pass their own ID and
+        reuse it only for retries; without one, a fresh ID is generated and
+        every call places a new order.
+
         Args:
             symbol: Stock symbol
             qty: Quantity of shares
@@ -364,11 +726,20 @@ class AlpacaTrader:
             time_in_force: Time in force (day, gtc, ioc, fok)
             limit_price: Limit price for limit orders
             stop_price: Stop price for stop orders
-            client_order_id: Custom order ID
+            client_order_id: Idempotency key for this order (generated if None)
 
         Returns:
             Order object or None if failed
         """
+        if client_order_id is None:
+            client_order_id = uuid.uuid4().hex
+
+        with self._recent_orders_lock:
+            cached = self._recent_orders.get(client_order_id)
+        if cached is not None:
+            logger.info(f"Order {client_order_id} already submitted, returning existing result")
+            return dict(cached)
+
         try:
             logger.info(
                 f"Submitting {side.upper()} order: {symbol} x {qty} @ {order_type}"
@@ -387,29 +758,37 @@ class AlpacaTrader:
 
             logger.info(f"✅ Order submitted successfully: {order.id}")
 
-            return {
-                "id": order.id,
-                "client_order_id": order.client_order_id,
-                "symbol": order.symbol,
-                "qty": int(order.qty),
-                "side": order.side,
-                "type": order.type,
-                "time_in_force": order.time_in_force,
-                "limit_price": float(order.limit_price) if order.limit_price else None,
-                "stop_price": float(order.stop_price) if order.stop_price else None,
-                "status": order.status,
-                "created_at": order.created_at,
-                "filled_avg_price": float(order.filled_avg_price)
-                if order.filled_avg_price
-                else None,
-            }
+            result = self._order_to_dict(order)
+            self._remember_order(client_order_id, result)
+            return dict(result)
         except APIError as e:
+            # Alpaca rejected a reused ID: an earlier attempt was accepted
+            if e.status_code == 422 and "client_order_id" in str(e):
+                existing = self._recover_order(client_order_id)
+                if existing is not None:
+                    return existing
             logger.error(f"❌ Alpaca API error: {e}")
             return None
         except Exception as e:
+            # A timeout or dropped connection may have lost the response to
+            # an accepted order
+            existing = self._recover_order(client_order_id)
+            if existing is not None:
+                return existing
             logger.error(f"❌ Order submission failed: {e}")
             return None
 
+    def _recover_order(self, client_order_id: str) -> Optional[dict]:
+        """Look up an order submitted under client_order_id, or None if there is none."""
+        try:
+            order = self.api.get_order_by_client_order_id(client_order_id)
+        except Exception:
+            return None
+        result = self._order_to_dict(order)
+        self._remember_order(client_order_id, result)
+        logger.info(f"Order {client_order_id} already exists: {order.id}")
+        return dict(result)
+
     def buy(
         self,
         symbol: str,
@@ -417,6 +796,7 @@ class AlpacaTrader:
         order_type: str = "market",
         limit_price: Optional[float] = None,
         stop_price: Optional[float] = None,
+        client_order_id: Optional[str] = None,
     ) -> Optional[dict]:
         """Submit a buy order."""
         return self.submit_order(
@@ -426,6 +806,7 @@ class AlpacaTrader:
             order_type=order_type,
             limit_price=limit_price,
             stop_price=stop_price,
+            client_order_id=client_order_id,
         )
 
     def sell(
@@ -435,6 +816,7 @@ class AlpacaTrader:
         order_type: str = "market",
         limit_price: Optional[float] = None,
         stop_price: Optional[float] = None,
+        client_order_id: Optional[str] = None,
     ) -> Optional[dict]:
         """Submit a sell order."""
         return self.submit_order(
@@ -444,6 +826,7 @@ class AlpacaTrader:
             order_type=order_type,
             limit_price=limit_price,
             stop_price=stop_price,
+            client_order_id=client_order_id,
         )
 
     def execute_trade_order(self, trade_order: TradeOrder) -> Optional[dict]:
@@ -474,8 +857,42 @@ class AlpacaTrader:
             time_in_force=trade_order.time_in_force,
             limit_price=trade_order.limit_price,
             stop_price=trade_order.stop_price,
+            client_order_id=trade_order.client_order_id,
         )
 
+    def submit_orders(self, orders: List[TradeOrder]) -> List[Optional[dict]]:
+        """
+        Submit a basket of orders concurrently.
+
+        Buys are submitted before sells, each side in batches of
+        ORDER_BATCH_SIZE with ORDER_BATCH_INTERVAL between batches.
+
+        Args:
+            orders: TradeOrder objects to execute
+
+        Returns:
+            Order results in the same order as the input (None for holds/failures)
+        """
+        results: List[Optional[dict]] = [None] * len(orders)
+        first_batch = True
+
+        for side in ("buy", "sell"):
+            indices = [i for i, order in enumerate(orders) if order.action == side]
+
+            for start in range(0, len(indices), ORDER_BATCH_SIZE):
+                if not first_batch:
+                    time.sleep(ORDER_BATCH_INTERVAL)
+                first_batch = False
+
+                futures = {
+                    self._executor.submit(self.execute_trade_order, orders[i]): i
+                    for i in indices[start : start + ORDER_BATCH_SIZE]
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+        return results
+
     # ============================================
     # Order Management
     # ============================================
@@ -515,22 +932,32 @@ class AlpacaTrader:
         """
         try:
             orders = self.api.list_orders(status=status, limit=limit)
-            return [
-                {
-                    "id": order.id,
-                    "symbol": order.symbol,
-                    "qty": int(order.qty),
-                    "side": order.side,
-                    "type": order.type,
-                    "status": order.status,
-                    "filled_qty": int(order.filled_qty),
-                    "filled_avg_price": float(order.filled_avg_price)
-                    if order.filled_avg_price
-                    else None,
-                    "created_at": order.created_at,
-                }
-                for order in orders
-            ]
+            if not orders:
+                return []
+
+            # Collect raw fields, then cast whole columns at once
+            df = pd.DataFrame.from_records(
+                [
+                    {
+                        "id": order.id,
+                        "symbol": order.symbol,
+                        "qty": order.qty,
+                        "side": order.side,
+                        "type": order.type,
+                        "status": order.status,
+                        "filled_qty": order.filled_qty,
+                        "filled_avg_price": order.filled_avg_price or None,
+                        "created_at": order.created_at,
+                    }
+                    for order in orders
+                ]
+            ).astype({"qty": "int64", "filled_qty": "int64", "filled_avg_price": "float64"})
+
+            # Unfilled orders have no average price; keep None rather than NaN
+            df["filled_avg_price"] = (
+                df["filled_avg_price"].astype(object).where(df["filled_avg_price"].notna(), None)
+            )
+            return df.to_dict("records")
         except Exception as e:
             logger.error(f"Failed to get orders: {e}")
             return []
@@ -555,6 +982,16 @@ class AlpacaTrader:
             logger.error(f"❌ Failed to cancel all orders: {e}")
             return False
 
+    def cancel_all_orders_async(self) -> Future:
+        """
+        Cancel all open orders without blocking on the response.
+
+        Returns:
+            Future resolving to the cancel_all_orders result (wrap with
+            asyncio.wrap_future to await it)
+        """
+        return self._executor.submit(self.cancel_all_orders)
+
     # ============================================
     # Position Closing
     # ============================================
@@ -602,37 +1039,58 @@ class AlpacaTrader:
             logger.error(f"❌ Failed to close all positions: {e}")
             return False
 
+    def close_all_positions_async(self) -> Future:
+        """
+        Close all open positions without blocking on the response.
+
+        Returns:
+            Future resolving to the close_all_positions result (wrap with
+            asyncio.wrap_future to await it)
+        """
+        return self._executor.submit(self.close_all_positions)
+
     # ============================================
     # Risk Controls
     # ============================================
 
     def can_trade(
-        self, symbol: str, qty: int, side: Literal["buy", "sell"]
+        self,
+        symbol: str,
+        qty: int,
+        side: Literal["buy", "sell"],
+        current_price: Optional[float] = None,
     ) -> tuple[bool, str]:
         """
         Check if a trade can be executed based on account status and risk controls.
 
+        Args:
+            symbol: Stock symbol
+            qty: Quantity of shares
+            side: "buy" or "sell"
+            current_price: Pre-fetched price for buy checks (looked up if None)
+
         Returns:
             (can_trade, reason) tuple
         """
         try:
-            account = self.get_account(force_refresh=True)
+            account = self._get_account_view()
 
             # Check if account is blocked
-            if account["trading_blocked"]:
+            if account.trading_blocked:
                 return False, "Trading is blocked on this account"
 
-            if account["account_blocked"]:
+            if account.account_blocked:
                 return False, "Account is blocked"
 
             # Check buying power for buy orders
             if side == "buy":
-                current_price = self.get_latest_price(symbol)
+                if current_price is None:
+                    current_price = self.get_latest_price(symbol)
                 if current_price is None:
                     return False, f"Could not get price for {symbol}"
 
                 required_buying_power = current_price * qty
-                available_buying_power = account["buying_power"]
+                available_buying_power = account.buying_power
 
                 if required_buying_power > available_buying_power:
                     return (
@@ -642,7 +1100,7 @@ class AlpacaTrader:
 
             # Check if selling more than owned
             if side == "sell":
-                position_qty = self.get_position_quantity(symbol, force_refresh=True)
+                position_qty = self.get_position_quantity(symbol)
                 if qty > position_qty:
                     return False, f"Cannot sell {qty} shares, only own {position_qty}"
 
@@ -651,25 +1109,49 @@ class AlpacaTrader:
         except Exception as e:
             return False, f"Error checking trade validity: {e}"
 
-    def get_max_quantity(self, symbol: str, max_position_value_pct: float = 0.2) -> int:
+    def can_trade_batch(self, orders: List[TradeOrder]) -> List[tuple[bool, str]]:
+        """
+        Run can_trade for many orders, fetching all buy-side prices in one request.
+
+        Returns:
+            (can_trade, reason) tuples in the same order as the input
+        """
+        buy_symbols = list({order.symbol for order in orders if order.action == "buy"})
+        prices = self.get_latest_prices(buy_symbols) if buy_symbols else {}
+
+        return [
+            self.can_trade(
+                order.symbol, order.quantity, order.action, prices.get(order.symbol)
+            )
+            for order in orders
+        ]
+
+    def get_max_quantity(
+        self,
+        symbol: str,
+        max_position_value_pct: float = 0.2,
+        current_price: Optional[float] = None,
+    ) -> int:
         """
         Calculate maximum quantity that can be purchased based on buying power and position limit.
 
         Args:
             symbol: Stock symbol
             max_position_value_pct: Maximum position value as % of portfolio (default: 20%)
+            current_price: Pre-fetched price (looked up if None)
 
         Returns:
             Maximum quantity that can be purchased
         """
         try:
-            current_price = self.get_latest_price(symbol)
+            if current_price is None:
+                current_price = self.get_latest_price(symbol)
             if current_price is None or current_price <= 0:
                 return 0
 
-            account = self.get_account(force_refresh=True)
-            portfolio_value = account["portfolio_value"]
-            buying_power = account["buying_power"]
+            account = self._get_account_view()
+            portfolio_value = account.portfolio_value
+            buying_power = account.buying_power
 
             # Calculate max based on position limit
             max_position_value = portfolio_value * max_position_value_pct
@@ -685,6 +1167,40 @@ class AlpacaTrader:
             logger.error(f"Error calculating max quantity for {symbol}: {e}")
             return 0
 
+    def get_max_quantities(
+        self, symbols: List[str], max_position_value_pct: float = 0.2
+    ) -> Dict[str, int]:
+        """
+        Calculate get_max_quantity for many symbols with one batched price request.
+
+        Returns:
+            Dictionary of symbol -> maximum quantity (0 when no price is available)
+        """
+        result = dict.fromkeys(symbols, 0)
+        try:
+            prices = self.get_latest_prices(symbols)
+            priced = [symbol for symbol in symbols if prices.get(symbol, 0) > 0]
+            if not priced:
+                return result
+
+            account = self._get_account_view()
+            price_arr = np.fromiter(
+                (prices[symbol] for symbol in priced), dtype=np.float64, count=len(priced)
+            )
+
+            # Same limits as get_max_quantity, computed for all symbols at once
+            max_position_value = account.portfolio_value * max_position_value_pct
+            max_qty = np.minimum(
+                max_position_value / price_arr, account.buying_power / price_arr
+            ).astype(np.int64)
+
+            result.update(zip(priced, max_qty.tolist()))
+            return result
+
+        except Exception as e:
+            logger.error(f"Error calculating max quantities: {e}")
+            return result
+
     # ============================================
     # Utility Methods
     # ============================================
@@ -692,7 +1208,7 @@ class AlpacaTrader:
     def is_market_open(self) -> bool:
         """Check if market is currently open."""
         try:
-            clock = self.api.get_clock()
+            clock = self._get_cached("clock", self.api.get_clock)
             return clock.is_open
         except Exception as e:
             logger.error(f"Failed to check market status: {e}")
@@ -701,7 +1217,7 @@ class AlpacaTrader:
     def get_market_hours(self) -> Optional[dict]:
         """Get next market open/close times."""
         try:
-            clock = self.api.get_clock()
+            clock = self._get_cached("clock", self.api.get_clock)
             return {
                 "is_open": clock.is_open,
                 "next_open": clock.next_open,
@@ -712,31 +1228,46 @@ class AlpacaTrader:
             logger.error(f"Failed to get market hours: {e}")
             return None
 
+    def snapshot(self) -> dict:
+        """
+        Refresh account and positions together and return both.
+
+        Both requests run concurrently; subsequent non-forced getters are
+        served from the refreshed cache.
+
+        Returns:
+            {"account": account dict, "positions": list of PortfolioPosition}
+        """
+        self._refresh_cache()
+        return {"account": self.get_account(), "positions": self.get_all_positions()}
+
     def get_portfolio_summary(self) -> dict:
         """Get comprehensive portfolio summary."""
         try:
-            account = self.get_account(force_refresh=True)
-            positions = self.get_all_positions(force_refresh=True)
+            self._refresh_cache()
+            account = self.get_account()
+            positions = self.get_all_positions()
+
+            # Column arrays so the aggregates are computed in C
+            count = len(positions)
+            soa = {
+                "symbol": [pos.symbol for pos in positions],
+                "quantity": np.fromiter((pos.quantity for pos in positions), dtype=np.int64, count=count),
+                "avg_entry_price": np.fromiter((pos.avg_entry_price for pos in positions), dtype=np.float64, count=count),
+                "current_price": np.fromiter((pos.current_price for pos in positions), dtype=np.float64, count=count),
+                "market_value": np.fromiter((pos.market_value for pos in positions), dtype=np.float64, count=count),
+                "unrealized_pl": np.fromiter((pos.unrealized_pl for pos in positions), dtype=np.float64, count=count),
+                "unrealized_plpc": np.fromiter((pos.unrealized_plpc for pos in positions), dtype=np.float64, count=count),
+            }
 
-            total_pl = sum(pos.unrealized_pl for pos in positions)
+            total_pl = float(soa["unrealized_pl"].sum())
             total_pl_pct = (
                 (total_pl / account["equity"]) * 100 if account["equity"] > 0 else 0
             )
 
             return {
                 "account": account,
-                "positions": [
-                    {
-                        "symbol": pos.symbol,
-                        "quantity": pos.quantity,
-                        "avg_entry_price": pos.avg_entry_price,
-                        "current_price": pos.current_price,
-                        "market_value": pos.market_value,
-                        "unrealized_pl": pos.unrealized_pl,
-                        "unrealized_plpc": pos.unrealized_plpc,
-                    }
-                    for pos in positions
-                ],
+                "positions": pd.DataFrame(soa).to_dict("records"),
                 "total_positions": len(positions),
                 "total_unrealized_pl": total_pl,
                 "total_unrealized_pl_pct": total_pl_pct,
@@ -745,6 +1276,13 @@ class AlpacaTrader:
             logger.error(f"Failed to get portfolio summary: {e}")
             return {}
 
+    def close(self):
+        """Stop streaming, shut down the worker pool and release pooled connections."""
+        if self._stream is not None:
+            self._stream.stop()
+        self._executor.shutdown(wait=True)
+        self.api._session.close()
+
 
 # Convenience function to create trader instance
 def create_trader(paper_trading: bool = True) -> AlpacaTrader:
@@ -5,35 +5,75 @@ Integrates decision engine with Alpaca trading to execute portfolio decisions.
 Handles order execution, position management, and risk controls.
 """
 
+import asyncio
+import atexit
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+import numpy as np
 import pandas as pd
 
 from src.trading.alpaca_trader import AlpacaTrader, TradeOrder
 
+try:
+    import orjson
+
+    def _dumps(payload: Dict) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(payload: Dict) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_TTL = 5.0  # seconds a finished batch's snapshot may be reused by the next
+HISTORY_FILE = "executions.ndjson"
+MAX_CONCURRENT_ORDERS = 20  # worker threads for execute_decisions_async
+
+_RULE = "=" * 60
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TradingDecision:
-    """Represents a trading decision from the decision engine."""
+    """
+    Represents a trading decision from the decision engine.
+
+    Immutable, so one instance can be shared safely with worker threads.
+    """
 
     symbol: str
     signal: str  # BUY, SELL, HOLD
     confidence: float
     quantity: int
     reasoning: str
-    timestamp: datetime = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    # Broker idempotency key: one per decision, reused only when retrying it
+    client_order_id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        # Normalise once so executors can compare and dispatch on the raw value;
+        # interning makes repeated symbol/signal comparisons pointer checks
+        object.__setattr__(self, "symbol", sys.intern(self.symbol))
+        object.__setattr__(self, "signal", sys.intern(self.signal.upper()))
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of trade execution."""
 
@@ -45,11 +85,43 @@ class ExecutionResult:
     order_id: Optional[str] = None
     error_message: Optional[str] = None
     execution_price: Optional[float] = None
-    timestamp: datetime = None
+    timestamp: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        # Results are long-lived in the history; share one copy of each string
+        self.symbol = sys.intern(self.symbol)
+        self.action = sys.intern(self.action)
+
+    def to_record(self) -> Dict:
+        """Serializable dict for the on-disk execution history."""
+        record = {f.name: getattr(self, f.name) for f in fields(self)}
+        record["timestamp"] = self.timestamp.isoformat()
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "ExecutionResult":
+        """Rebuild a result written by to_record."""
+        record["timestamp"] = datetime.fromisoformat(record["timestamp"])
+        return cls(**record)
+
+
+@dataclass(slots=True)
+class RiskSnapshot:
+    """Account, position and price state captured once for a batch."""
+
+    portfolio_value: float
+    buying_power: float
+    positions: Dict[str, int]
+    prices: Dict[str, float]
+    expires: float
+
+    def max_quantity(self, symbol: str, max_position_pct: float) -> Optional[int]:
+        """Same limit as AlpacaTrader.get_max_quantity, or None without a price."""
+        price = self.prices.get(symbol)
+        if not price or price <= 0:
+            return None
+        max_value = min(self.portfolio_value * max_position_pct, self.buying_power)
+        return int(max_value / price)
 
 
 class PortfolioExecutor:
@@ -71,6 +143,9 @@ class PortfolioExecutor:
         min_confidence: float = 60.0,
         enable_risk_controls: bool = True,
         dry_run: bool = False,
+        max_history: int = 10_000,
+        persist_path: Optional[str] = None,
+        track_inactive: bool = True,
     ):
         """
         Initialize Portfolio Executor.
@@ -81,17 +156,50 @@ class PortfolioExecutor:
             min_confidence: Minimum confidence to execute trade (default: 60%)
             enable_risk_controls: Enable risk control checks (default: True)
             dry_run: Simulate trades without executing (default: False)
+            max_history: Number of execution results kept in memory (default: 10,000)
+            persist_path: Directory for an append-only execution log that is
+                replayed on startup (default: None, history is memory-only)
+            track_inactive: Log and record HOLD and low-confidence decisions;
+                when False they return lightweight results without touching the
+                history or stats (default: True)
         """
         self.trader = trader or AlpacaTrader(paper_trading=True)
         self.max_position_pct = max_position_pct
         self.min_confidence = min_confidence
         self.enable_risk_controls = enable_risk_controls
         self.dry_run = dry_run
+        self.track_inactive = track_inactive
+
+        # Execution history (oldest results are evicted once full)
+        self.execution_history: Deque[ExecutionResult] = deque(maxlen=max_history)
+
+        # Running (action, success) counts; these outlive evicted history entries
+        self._action_counts: Counter = Counter()
+        self._history_lock = threading.Lock()
+
+        # Optional on-disk history: replay its tail, then append new results
+        self._history_file = None
+        if persist_path:
+            self._open_history(os.path.join(persist_path, HISTORY_FILE))
+
+        # Account/position snapshot shared by all decisions in one batch; the
+        # lock guards its buying power as accepted buys draw it down. The last
+        # batch's snapshot, reservations included, is kept for reuse
+        self._snapshot: Optional[RiskSnapshot] = None
+        self._last_snapshot: Optional[RiskSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+
+        # Workers for concurrent execution, kept across cycles so each batch
+        # reuses warm threads and the trader's pooled keep-alive connections
+        self._pool = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_ORDERS, thread_name_prefix="executor"
+        )
 
-        # Execution history
-        self.execution_history: List[ExecutionResult] = []
+        # Signal -> handler tables for single-order and basket execution
+        self._executors = {"BUY": self._execute_buy, "SELL": self._execute_sell}
+        self._preparers = {"BUY": self._prepare_buy, "SELL": self._prepare_sell}
 
-        logger.info(f"Portfolio Executor initialized (dry_run={dry_run})")
+        logger.info("Portfolio Executor initialized (dry_run=%s)", dry_run)
 
     # ============================================
     # Decision Execution
@@ -110,70 +218,132 @@ class PortfolioExecutor:
         Returns:
             ExecutionResult with execution details
         """
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Processing decision for {decision.symbol}")
+        if not self.track_inactive:
+            result = self._untracked_result(decision, force)
+            if result is not None:
+                return result
+
         logger.info(
-            f"Signal: {decision.signal}, Confidence: {decision.confidence}%, Quantity: {decision.quantity}"
+            "\n%s\nProcessing decision for %s\n"
+            "Signal: %s, Confidence: %s%%, Quantity: %s\nReasoning: %s\n%s",
+            _RULE,
+            decision.symbol,
+            decision.signal,
+            decision.confidence,
+            decision.quantity,
+            decision.reasoning,
+            _RULE,
         )
-        logger.info(f"Reasoning: {decision.reasoning}")
-        logger.info(f"{'=' * 60}")
 
-        # Validate decision
+        result = self._screen_decision(decision, force)
+        if result is None:
+            # Execute BUY or SELL
+            handler = self._executors.get(decision.signal)
+            result = handler(decision) if handler else self._invalid_signal(decision)
+
+        self._record(result)
+        return result
+
+    def _untracked_result(
+        self, decision: TradingDecision, force: bool = False
+    ) -> Optional[ExecutionResult]:
+        """
+        Result for an untracked HOLD/low-confidence decision, else None.
+
+        Skips logging and reuses the decision's timestamp instead of reading
+        the clock; the result is never added to the history.
+        """
         if not force and decision.confidence < self.min_confidence:
-            logger.warning(
-                f"⚠️  Confidence {decision.confidence}% below minimum {self.min_confidence}%"
-            )
-            result = ExecutionResult(
+            return ExecutionResult(
                 symbol=decision.symbol,
                 action="SKIP",
                 intended_quantity=decision.quantity,
                 executed_quantity=0,
                 success=False,
-                error_message=f"Confidence {decision.confidence}% below threshold {self.min_confidence}%",
+                error_message="Confidence below threshold",
+                timestamp=decision.timestamp,
             )
-            self.execution_history.append(result)
-            return result
-
-        # Handle HOLD signal
-        if decision.signal.upper() == "HOLD":
-            logger.info(f"⏸️  HOLD signal for {decision.symbol} - No action taken")
-            result = ExecutionResult(
+        if decision.signal == "HOLD":
+            return ExecutionResult(
                 symbol=decision.symbol,
                 action="HOLD",
                 intended_quantity=0,
                 executed_quantity=0,
                 success=True,
+                timestamp=decision.timestamp,
             )
-            self.execution_history.append(result)
-            return result
+        return None
 
-        # Execute BUY or SELL
-        if decision.signal.upper() == "BUY":
-            result = self._execute_buy(decision)
-        elif decision.signal.upper() == "SELL":
-            result = self._execute_sell(decision)
-        else:
-            logger.error(f"❌ Invalid signal: {decision.signal}")
-            result = ExecutionResult(
+    def _screen_decision(
+        self, decision: TradingDecision, force: bool = False
+    ) -> Optional[ExecutionResult]:
+        """Resolve low-confidence and HOLD decisions without placing an order."""
+        # Validate decision
+        if not force and decision.confidence < self.min_confidence:
+            logger.warning(
+                "⚠️  Confidence %s%% below minimum %s%%",
+                decision.confidence,
+                self.min_confidence,
+            )
+            return ExecutionResult(
                 symbol=decision.symbol,
-                action="ERROR",
+                action="SKIP",
                 intended_quantity=decision.quantity,
                 executed_quantity=0,
                 success=False,
-                error_message=f"Invalid signal: {decision.signal}",
+                error_message=f"Confidence {decision.confidence}% below threshold {self.min_confidence}%",
             )
 
-        self.execution_history.append(result)
-        return result
+        # Handle HOLD signal
+        if decision.signal == "HOLD":
+            logger.info("⏸️  HOLD signal for %s - No action taken", decision.symbol)
+            return ExecutionResult(
+                symbol=decision.symbol,
+                action="HOLD",
+                intended_quantity=0,
+                executed_quantity=0,
+                success=True,
+            )
+
+        return None
+
+    @staticmethod
+    def _invalid_signal(decision: TradingDecision) -> ExecutionResult:
+        """Result for a decision whose signal is not BUY, SELL or HOLD."""
+        logger.error("❌ Invalid signal: %s", decision.signal)
+        return ExecutionResult(
+            symbol=decision.symbol,
+            action="ERROR",
+            intended_quantity=decision.quantity,
+            executed_quantity=0,
+            success=False,
+            error_message=f"Invalid signal: {decision.signal}",
+        )
 
     def _execute_buy(self, decision: TradingDecision) -> ExecutionResult:
         """Execute buy order."""
+        prepared = self._prepare_buy(decision)
+        if isinstance(prepared, ExecutionResult):
+            return prepared
+        return self._place_order(decision, prepared)
+
+    def _execute_sell(self, decision: TradingDecision) -> ExecutionResult:
+        """Execute sell order."""
+        prepared = self._prepare_sell(decision)
+        if isinstance(prepared, ExecutionResult):
+            return prepared
+        return self._place_order(decision, prepared)
+
+    def _prepare_buy(
+        self, decision: TradingDecision
+    ) -> Union[TradeOrder, ExecutionResult]:
+        """Validate a buy decision, returning the order to place or a rejection."""
         symbol = decision.symbol
         quantity = decision.quantity
 
         # Validate quantity
         if quantity <= 0:
-            logger.warning(f"⚠️  Invalid quantity {quantity} for BUY order")
+            logger.warning("⚠️  Invalid quantity %s for BUY order", quantity)
             return ExecutionResult(
                 symbol=symbol,
                 action="BUY",
@@ -188,12 +358,15 @@ class PortfolioExecutor:
             adjusted_qty, reason = self._apply_risk_controls(symbol, quantity, "buy")
             if adjusted_qty != quantity:
                 logger.info(
-                    f"📊 Quantity adjusted by risk controls: {quantity} → {adjusted_qty} ({reason})"
+                    "📊 Quantity adjusted by risk controls: %s → %s (%s)",
+                    quantity,
+                    adjusted_qty,
+                    reason,
                 )
                 quantity = adjusted_qty
 
             if quantity == 0:
-                logger.warning(f"⚠️  Risk controls rejected BUY order: {reason}")
+                logger.warning("⚠️  Risk controls rejected BUY order: %s", reason)
                 return ExecutionResult(
                     symbol=symbol,
                     action="BUY",
@@ -204,9 +377,14 @@ class PortfolioExecutor:
                 )
 
         # Check if trade can be executed
-        can_trade, trade_reason = self.trader.can_trade(symbol, quantity, "buy")
+        price = self._get_price(symbol)
+        can_trade, trade_reason = self.trader.can_trade(
+            symbol, quantity, "buy", current_price=price
+        )
+        if can_trade:
+            can_trade, trade_reason = self._reserve_buying_power(symbol, quantity, price)
         if not can_trade:
-            logger.error(f"❌ Cannot execute BUY: {trade_reason}")
+            logger.error("❌ Cannot execute BUY: %s", trade_reason)
             return ExecutionResult(
                 symbol=symbol,
                 action="BUY",
@@ -216,57 +394,46 @@ class PortfolioExecutor:
                 error_message=trade_reason,
             )
 
-        # Execute order
-        if self.dry_run:
-            logger.info(f"🔍 [DRY RUN] Would BUY {quantity} shares of {symbol}")
-            return ExecutionResult(
-                symbol=symbol,
-                action="BUY",
-                intended_quantity=decision.quantity,
-                executed_quantity=quantity,
-                success=True,
-                order_id="DRY_RUN",
-                execution_price=self.trader.get_latest_price(symbol),
-            )
+        return self._make_order(decision, "buy", quantity)
 
-        # Submit order to Alpaca
-        logger.info(f"💰 Executing BUY order: {symbol} x {quantity}")
-        order = self.trader.buy(symbol, quantity)
+    def _reserve_buying_power(
+        self, symbol: str, quantity: int, price: Optional[float]
+    ) -> Tuple[bool, str]:
+        """
+        Draw an accepted buy's cost from the batch snapshot's buying power.
 
-        if order:
-            logger.info(
-                f"✅ BUY order executed: {symbol} x {quantity} (Order ID: {order['id']})"
-            )
-            return ExecutionResult(
-                symbol=symbol,
-                action="BUY",
-                intended_quantity=decision.quantity,
-                executed_quantity=quantity,
-                success=True,
-                order_id=order["id"],
-                execution_price=order.get("filled_avg_price"),
-            )
-        else:
-            logger.error(f"❌ BUY order failed for {symbol}")
-            return ExecutionResult(
-                symbol=symbol,
-                action="BUY",
-                intended_quantity=decision.quantity,
-                executed_quantity=0,
-                success=False,
-                error_message="Order submission failed",
-            )
+        Every buy in a batch is checked against the same snapshot, so without
+        this a basket could spend more than the account has in total. The
+        bought shares are added to the snapshot's positions so a batch that
+        reuses it sees them.
+        """
+        snapshot = self._current_snapshot()
+        if snapshot is None or not price:
+            return True, "OK"
 
-    def _execute_sell(self, decision: TradingDecision) -> ExecutionResult:
-        """Execute sell order."""
+        cost = quantity * price
+        with self._snapshot_lock:
+            if cost > snapshot.buying_power:
+                return (
+                    False,
+                    f"Insufficient buying power: need ${cost:.2f}, have ${snapshot.buying_power:.2f}",
+                )
+            snapshot.buying_power -= cost
+            snapshot.positions[symbol] = snapshot.positions.get(symbol, 0) + quantity
+        return True, "OK"
+
+    def _prepare_sell(
+        self, decision: TradingDecision
+    ) -> Union[TradeOrder, ExecutionResult]:
+        """Validate a sell decision, returning the order to place or a rejection."""
         symbol = decision.symbol
         quantity = decision.quantity
 
         # Get current position
-        current_position = self.trader.get_position_quantity(symbol, force_refresh=True)
+        current_position = self._get_position_quantity(symbol, force_refresh=True)
 
         if current_position <= 0:
-            logger.warning(f"⚠️  No position to sell for {symbol}")
+            logger.warning("⚠️  No position to sell for %s", symbol)
             return ExecutionResult(
                 symbol=symbol,
                 action="SELL",
@@ -280,14 +447,16 @@ class PortfolioExecutor:
         actual_quantity = min(quantity, current_position)
         if actual_quantity != quantity:
             logger.info(
-                f"📊 Sell quantity adjusted: {quantity} → {actual_quantity} (max available)"
+                "📊 Sell quantity adjusted: %s → %s (max available)",
+                quantity,
+                actual_quantity,
             )
             quantity = actual_quantity
 
         # Check if trade can be executed
         can_trade, trade_reason = self.trader.can_trade(symbol, quantity, "sell")
         if not can_trade:
-            logger.error(f"❌ Cannot execute SELL: {trade_reason}")
+            logger.error("❌ Cannot execute SELL: %s", trade_reason)
             return ExecutionResult(
                 symbol=symbol,
                 action="SELL",
@@ -297,47 +466,97 @@ class PortfolioExecutor:
                 error_message=trade_reason,
             )
 
-        # Execute order
+        # Keep the snapshot's positions current for a batch that reuses it
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            with self._snapshot_lock:
+                snapshot.positions[symbol] = snapshot.positions.get(symbol, 0) - quantity
+
+        return self._make_order(decision, "sell", quantity)
+
+    @staticmethod
+    def _make_order(decision: TradingDecision, side: str, quantity: int) -> TradeOrder:
+        """Build the market order for a validated decision."""
+        return TradeOrder(
+            symbol=decision.symbol,
+            action=side,
+            quantity=quantity,
+            confidence=min(max(decision.confidence, 0.0), 100.0),
+            client_order_id=decision.client_order_id,
+        )
+
+    def _place_order(
+        self, decision: TradingDecision, order: TradeOrder
+    ) -> ExecutionResult:
+        """Submit a validated order (or simulate it in dry-run mode)."""
         if self.dry_run:
-            logger.info(f"🔍 [DRY RUN] Would SELL {quantity} shares of {symbol}")
-            return ExecutionResult(
-                symbol=symbol,
-                action="SELL",
-                intended_quantity=decision.quantity,
-                executed_quantity=quantity,
-                success=True,
-                order_id="DRY_RUN",
-                execution_price=self.trader.get_latest_price(symbol),
+            return self._dry_run_result(decision, order)
+
+        if order.action == "buy":
+            logger.info("💰 Executing BUY order: %s x %s", order.symbol, order.quantity)
+            placed = self.trader.buy(
+                order.symbol, order.quantity, client_order_id=order.client_order_id
             )
+        else:
+            logger.info("💸 Executing SELL order: %s x %s", order.symbol, order.quantity)
+            placed = self.trader.sell(
+                order.symbol, order.quantity, client_order_id=order.client_order_id
+            )
+        return self._order_result(decision, order, placed)
 
-        # Submit order to Alpaca
-        logger.info(f"💸 Executing SELL order: {symbol} x {quantity}")
-        order = self.trader.sell(symbol, quantity)
+    def _dry_run_result(
+        self, decision: TradingDecision, order: TradeOrder
+    ) -> ExecutionResult:
+        """Result for an order that would have been placed in dry-run mode."""
+        action = order.action.upper()
+        logger.info(
+            "🔍 [DRY RUN] Would %s %s shares of %s", action, order.quantity, order.symbol
+        )
+        return ExecutionResult(
+            symbol=order.symbol,
+            action=action,
+            intended_quantity=decision.quantity,
+            executed_quantity=order.quantity,
+            success=True,
+            order_id="DRY_RUN",
+            execution_price=self._get_price(order.symbol)
+            or self.trader.get_latest_price(order.symbol),
+        )
 
-        if order:
+    @staticmethod
+    def _order_result(
+        decision: TradingDecision, order: TradeOrder, placed: Optional[dict]
+    ) -> ExecutionResult:
+        """Convert an Alpaca order response into an ExecutionResult."""
+        action = order.action.upper()
+        if placed:
             logger.info(
-                f"✅ SELL order executed: {symbol} x {quantity} (Order ID: {order['id']})"
+                "✅ %s order executed: %s x %s (Order ID: %s)",
+                action,
+                order.symbol,
+                order.quantity,
+                placed["id"],
             )
             return ExecutionResult(
-                symbol=symbol,
-                action="SELL",
+                symbol=order.symbol,
+                action=action,
                 intended_quantity=decision.quantity,
-                executed_quantity=quantity,
+                executed_quantity=order.quantity,
                 success=True,
-                order_id=order["id"],
-                execution_price=order.get("filled_avg_price"),
-            )
-        else:
-            logger.error(f"❌ SELL order failed for {symbol}")
-            return ExecutionResult(
-                symbol=symbol,
-                action="SELL",
-                intended_quantity=decision.quantity,
-                executed_quantity=0,
-                success=False,
-                error_message="Order submission failed",
+                order_id=placed["id"],
+                execution_price=placed.get("filled_avg_price"),
             )
 
+        logger.error("❌ %s order failed for %s", action, order.symbol)
+        return ExecutionResult(
+            symbol=order.symbol,
+            action=action,
+            intended_quantity=decision.quantity,
+            executed_quantity=0,
+            success=False,
+            error_message="Order submission failed",
+        )
+
     # ============================================
     # Batch Execution
     # ============================================
@@ -348,28 +567,145 @@ class PortfolioExecutor:
         """
         Execute multiple trading decisions.
 
+        By default all decisions are validated first and the resulting orders
+        are submitted together as one basket (see submit_batch).
+
         Args:
             decisions: Dictionary of symbol -> TradingDecision
-            parallel: Execute in parallel (not implemented yet)
+            parallel: Run each decision end to end concurrently instead
 
         Returns:
             Dictionary of symbol -> ExecutionResult
         """
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Executing {len(decisions)} trading decisions")
-        logger.info(f"{'=' * 60}\n")
+        logger.info(
+            "\n%s\nExecuting %d trading decisions\n%s\n", _RULE, len(decisions), _RULE
+        )
 
-        results = {}
-        for symbol, decision in decisions.items():
-            result = self.execute_decision(decision)
-            results[symbol] = result
+        if parallel:
+            results = asyncio.run(self.execute_decisions_async(decisions))
+        else:
+            results = self.submit_batch(decisions)
 
         # Print summary
         successful = sum(1 for r in results.values() if r.success)
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Execution Summary: {successful}/{len(decisions)} successful")
-        logger.info(f"{'=' * 60}\n")
+        logger.info(
+            "\n%s\nExecution Summary: %d/%d successful\n%s\n",
+            _RULE,
+            successful,
+            len(decisions),
+            _RULE,
+        )
+
+        return results
+
+    async def execute_decisions_async(
+        self, decisions: Dict[str, TradingDecision]
+    ) -> Dict[str, ExecutionResult]:
+        """
+        Execute multiple trading decisions concurrently.
+
+        Each decision runs on the executor's persistent worker pool so the
+        blocking Alpaca round-trips overlap; the batch takes roughly as long
+        as its slowest order.
+
+        Args:
+            decisions: Dictionary of symbol -> TradingDecision
+
+        Returns:
+            Dictionary of symbol -> ExecutionResult
+        """
+        loop = asyncio.get_running_loop()
+        symbols = list(decisions)
+        await loop.run_in_executor(self._pool, self._take_snapshot, decisions)
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._pool, self.execute_decision, decisions[s])
+                    for s in symbols
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._end_batch()
+
+        results = {}
+        for symbol, outcome in zip(symbols, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("❌ Execution failed for %s: %s", symbol, outcome)
+                decision = decisions[symbol]
+                outcome = ExecutionResult(
+                    symbol=symbol,
+                    action=decision.signal,
+                    intended_quantity=decision.quantity,
+                    executed_quantity=0,
+                    success=False,
+                    error_message=str(outcome),
+                )
+                self._record(outcome)
+            results[symbol] = outcome
+
+        return results
+
+    def submit_batch(
+        self, decisions: Dict[str, TradingDecision]
+    ) -> Dict[str, ExecutionResult]:
+        """
+        Validate all decisions locally, then submit the surviving orders as one basket.
+
+        Alpaca has no bulk order endpoint, so the basket goes through
+        AlpacaTrader.submit_orders, which fans the POSTs out over its pooled
+        keep-alive session. Results are matched back to decisions by position.
+
+        Args:
+            decisions: Dictionary of symbol -> TradingDecision
 
+        Returns:
+            Dictionary of symbol -> ExecutionResult
+        """
+        self._take_snapshot(decisions)
+        try:
+            results: Dict[str, ExecutionResult] = {}
+            untracked: Dict[str, ExecutionResult] = {}
+            pending: List[Tuple[str, TradingDecision, TradeOrder]] = []
+
+            for symbol, decision in decisions.items():
+                if not self.track_inactive:
+                    result = self._untracked_result(decision)
+                    if result is not None:
+                        untracked[symbol] = result
+                        continue
+
+                result = self._screen_decision(decision)
+                if result is None:
+                    prepare = self._preparers.get(decision.signal)
+                    result = (
+                        prepare(decision) if prepare else self._invalid_signal(decision)
+                    )
+
+                if isinstance(result, TradeOrder):
+                    pending.append((symbol, decision, result))
+                results[symbol] = result
+
+            if pending:
+                logger.info("Submitting basket of %d orders", len(pending))
+                if self.dry_run:
+                    for symbol, decision, order in pending:
+                        results[symbol] = self._dry_run_result(decision, order)
+                else:
+                    placed = self.trader.submit_orders([order for _, _, order in pending])
+                    for (symbol, decision, order), response in zip(pending, placed):
+                        results[symbol] = self._order_result(decision, order, response)
+        finally:
+            self._end_batch()
+
+        for result in results.values():
+            self._record(result)
+        if untracked:
+            # Keep the caller's symbol order
+            results = {
+                symbol: results.get(symbol) or untracked[symbol]
+                for symbol in decisions
+            }
         return results
 
     # ============================================
@@ -386,11 +722,11 @@ class PortfolioExecutor:
             (adjusted_quantity, reason) tuple
         """
         # Get maximum allowed quantity
-        max_qty = self.trader.get_max_quantity(symbol, self.max_position_pct)
+        max_qty = self._get_max_quantity(symbol)
 
         if side == "buy":
             # Check against max position size
-            current_position = self.trader.get_position_quantity(symbol)
+            current_position = self._get_position_quantity(symbol)
             max_additional = max_qty - current_position
 
             if max_additional <= 0:
@@ -407,18 +743,97 @@ class PortfolioExecutor:
 
         return quantity, "OK"
 
-    def validate_portfolio_risk(self) -> Tuple[bool, List[str]]:
+    def _take_snapshot(self, decisions: Dict[str, TradingDecision]):
+        """
+        Capture account, positions and prices once for a batch.
+
+        Per-decision risk checks then run locally against this snapshot
+        instead of issuing their own REST calls. It is held for the whole
+        batch however long that takes, so buying power reserved by earlier
+        buys is never lost. A batch starting within SNAPSHOT_TTL of the
+        previous snapshot being taken reuses it, reservations included.
+        """
+        last = self._last_snapshot
+        symbols = [d.symbol for d in decisions.values() if d.signal in ("BUY", "SELL")]
+        if (
+            last is not None
+            and time.monotonic() < last.expires
+            and all(symbol in last.prices for symbol in symbols)
+        ):
+            self._snapshot = last
+            return
+
+        try:
+            account = self.trader.get_account(force_refresh=True)
+            positions = {
+                pos.symbol: pos.quantity
+                for pos in self.trader.get_all_positions(force_refresh=True)
+            }
+            prices = self.trader.get_latest_prices(symbols) if symbols else {}
+        except Exception as e:
+            logger.warning("Could not take risk snapshot: %s", e)
+            self._snapshot = None
+            return
+
+        self._snapshot = RiskSnapshot(
+            portfolio_value=account["portfolio_value"],
+            buying_power=account["buying_power"],
+            positions=positions,
+            prices=prices,
+            expires=time.monotonic() + SNAPSHOT_TTL,
+        )
+
+    def _end_batch(self):
+        """Release the batch snapshot, keeping it for reuse by the next batch."""
+        self._last_snapshot, self._snapshot = self._snapshot, None
+
+    def _current_snapshot(self) -> Optional[RiskSnapshot]:
+        """Get the snapshot of the batch in progress, or None outside a batch."""
+        return self._snapshot
+
+    def _get_position_quantity(self, symbol: str, force_refresh: bool = False) -> int:
+        """Position quantity from the batch snapshot, falling back to the trader."""
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            return snapshot.positions.get(symbol, 0)
+        return self.trader.get_position_quantity(symbol, force_refresh=force_refresh)
+
+    def _get_max_quantity(self, symbol: str) -> int:
+        """Max position size from the batch snapshot, falling back to the trader."""
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            max_qty = snapshot.max_quantity(symbol, self.max_position_pct)
+            if max_qty is not None:
+                return max_qty
+        return self.trader.get_max_quantity(symbol, self.max_position_pct)
+
+    def _get_price(self, symbol: str) -> Optional[float]:
+        """Price prefetched in the batch snapshot, or None if not captured."""
+        snapshot = self._current_snapshot()
+        return snapshot.prices.get(symbol) if snapshot is not None else None
+
+    def validate_portfolio_risk(
+        self,
+        account: Optional[Dict] = None,
+        positions: Optional[List] = None,
+    ) -> Tuple[bool, List[str]]:
         """
         Validate overall portfolio risk.
 
+        Args:
+            account: Pre-fetched account dict (fetched if None)
+            positions: Pre-fetched positions (fetched if None)
+
         Returns:
             (is_valid, warnings) tuple
         """
         warnings = []
 
         try:
-            account = self.trader.get_account()
-            positions = self.trader.get_all_positions()
+            if account is None:
+                account = self.trader.get_account()
+            if positions is None:
+                positions = self.trader.get_all_positions()
 
             # Check for pattern day trader status
             if account.get("pattern_day_trader"):
@@ -431,11 +846,16 @@ class PortfolioExecutor:
 
             # Check portfolio concentration
             total_value = account["portfolio_value"]
-            for pos in positions:
-                position_pct = (pos.market_value / total_value) * 100
-                if position_pct > (self.max_position_pct * 100):
+            if len(positions) and total_value > 0:
+                market_values = np.fromiter(
+                    (pos.market_value for pos in positions),
+                    dtype=np.float64,
+                    count=len(positions),
+                )
+                position_pcts = market_values * (100.0 / total_value)
+                for i in np.flatnonzero(position_pcts > self.max_position_pct * 100):
                     warnings.append(
-                        f"⚠️  {pos.symbol} position ({position_pct:.1f}%) exceeds limit ({self.max_position_pct * 100}%)"
+                        f"⚠️  {positions[i].symbol} position ({position_pcts[i]:.1f}%) exceeds limit ({self.max_position_pct * 100}%)"
                     )
 
             # Check buying power
@@ -451,18 +871,60 @@ class PortfolioExecutor:
     # Analytics
     # ============================================
 
+    def _record(self, result: ExecutionResult):
+        """Append a result to the history and update the running counts."""
+        with self._history_lock:
+            self.execution_history.append(result)
+            self._action_counts[(result.action, result.success)] += 1
+            if self._history_file is not None:
+                self._history_file.write(_dumps(result.to_record()) + b"\n")
+
+    def _open_history(self, path: str):
+        """Load the tail of a persisted history and open it for appending."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                tail = deque(f, maxlen=self.execution_history.maxlen)
+            for line in tail:
+                try:
+                    result = ExecutionResult.from_record(_loads(line))
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning("Skipping malformed execution record: %s", e)
+                    continue
+                self.execution_history.append(result)
+                self._action_counts[(result.action, result.success)] += 1
+            logger.info("Loaded %d executions from %s", len(self.execution_history), path)
+
+        self._history_file = open(path, "ab")
+        atexit.register(self.close)
+
+    def flush_history(self):
+        """Flush buffered execution records to disk."""
+        with self._history_lock:
+            if self._history_file is not None and not self._history_file.closed:
+                self._history_file.flush()
+
+    def close(self):
+        """Stop the worker pool and close the execution log."""
+        self._pool.shutdown(wait=True)
+        with self._history_lock:
+            if self._history_file is not None:
+                self._history_file.close()
+                self._history_file = None
+                atexit.unregister(self.close)
+
     def get_execution_stats(self) -> Dict:
         """Get execution statistics."""
-        if not self.execution_history:
+        counts = self._action_counts
+        total = sum(counts.values())
+        if not total:
             return {"total_executions": 0}
 
-        total = len(self.execution_history)
-        successful = sum(1 for r in self.execution_history if r.success)
-        buys = sum(1 for r in self.execution_history if r.action == "BUY" and r.success)
-        sells = sum(
-            1 for r in self.execution_history if r.action == "SELL" and r.success
-        )
-        holds = sum(1 for r in self.execution_history if r.action == "HOLD")
+        successful = sum(n for (_, success), n in counts.items() if success)
+        buys = counts[("BUY", True)]
+        sells = counts[("SELL", True)]
+        holds = counts[("HOLD", True)] + counts[("HOLD", False)]
 
         return {
             "total_executions": total,
@@ -493,7 +955,8 @@ class PortfolioExecutor:
 
     def get_recent_executions(self, limit: int = 10) -> List[ExecutionResult]:
         """Get recent executions."""
-        return self.execution_history[-limit:]
+        start = max(len(self.execution_history) - limit, 0)
+        return list(islice(self.execution_history, start, None))
 
 
 # Convenience functions
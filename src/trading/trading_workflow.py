@@ -9,23 +9,75 @@ Integrates the entire trading pipeline:
 5. Portfolio Monitoring
 """
 
+import atexit
 import logging
+import queue
+from collections import Counter
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from logging.handlers import QueueHandler, QueueListener
 import time
+from dataclasses import dataclass, field, fields
+
+import numpy as np
+import pandas as pd
 
 from src.trading.alpaca_trader import AlpacaTrader
 from src.trading.portfolio_executor import PortfolioExecutor, TradingDecision
 from src.agents.decision_engine import create_decision_engine
 from src.agents.data_fetcher import get_stock_data
 from src.core.state_manager import get_state_manager
+from src.data.file_cache import FileCache
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_log_listener: Optional[QueueListener] = None
+
+ANALYSIS_WINDOW_DAYS = 30
+_BAR = "=" * 80
+
+# One row per open position; every per-cycle position view is built from it
+_POSITION_DTYPE = np.dtype(
+    [
+        ("symbol", "U16"),
+        ("quantity", "i8"),
+        ("market_value", "f8"),
+        ("cost_basis", "f8"),
+        ("avg_entry_price", "f8"),
+        ("current_price", "f8"),
+        ("unrealized_pl", "f8"),
+        ("unrealized_plpc", "f8"),
+        ("change_today", "f8"),
+        ("unrealized_intraday_plpc", "f8"),
+    ]
+)
+
+# Alpaca bar columns -> the OHLCV names the analysis pipeline expects
+_BAR_COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+}
+
+
+@dataclass(slots=True)
+class CycleResult:
+    """Outcome of one trading cycle."""
+
+    cycle: int
+    timestamp: str
+    tickers_analyzed: List[str] = field(default_factory=list)
+    decisions: Dict[str, Dict] = field(default_factory=dict)
+    executions: Dict[str, Dict] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        """Shallow dict view, the shape run_single_cycle returns."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class TradingWorkflow:
     """
@@ -47,6 +99,7 @@ class TradingWorkflow:
         min_confidence: float = 60.0,
         max_position_pct: float = 0.20,
         check_interval: int = 60,
+        max_workers: int = 8,
     ):
         """
         Initialize Trading Workflow.
@@ -57,12 +110,16 @@ class TradingWorkflow:
             min_confidence: Minimum confidence to execute trade (default: 60%)
             max_position_pct: Max position size as % of portfolio (default: 20%)
             check_interval: Seconds between trading cycles (default: 60)
+            max_workers: Tickers analyzed concurrently per cycle (default: 8)
         """
+        _configure_logging()
+
         self.tickers = tickers
         self.dry_run = dry_run
         self.min_confidence = min_confidence
         self.max_position_pct = max_position_pct
         self.check_interval = check_interval
+        self.max_workers = max_workers
 
         # Initialize components
         logger.info("Initializing Trading Workflow components...")
@@ -82,8 +139,22 @@ class TradingWorkflow:
 
         # Decision engine
         self.decision_engine = create_decision_engine()
+        self.decision_engine.warmup()
         logger.info("✅ Decision Engine initialized")
 
+        # On-disk cache of closed bar history; drop entries left by old runs
+        self.data_cache = FileCache()
+        try:
+            self.data_cache.prune()
+        except OSError as e:
+            logger.warning("Failed to prune bar cache: %s", e)
+
+        # Fingerprint of the last portfolio pushed to the state manager
+        self._last_portfolio_fingerprint = None
+
+        # Next market open (UTC) while the market is known to be closed
+        self._next_open: Optional[pd.Timestamp] = None
+
         # Trading stats
         self.cycle_count = 0
         self.total_trades = 0
@@ -112,32 +183,52 @@ class TradingWorkflow:
         """
         Run a single trading cycle.
 
+        State manager updates made during the cycle are coalesced and
+        written to the state file once, when the cycle ends.
+
         Returns:
             Dictionary with cycle results
         """
+        with self.state_manager.batch():
+            return self._run_cycle()
+
+    def _run_cycle(self) -> Dict:
+        """Body of run_single_cycle."""
         self.cycle_count += 1
         cycle_start = datetime.now()
 
         # Update cycle count in state
         self.state_manager.increment_cycle()
 
-        logger.info(f"\n{'=' * 80}")
+        # Market is known to be closed until the cached next open
+        if self._seconds_until_open() > 0:
+            return {"status": "market_closed", "cycle": self.cycle_count}
+
+        logger.info("\n%s", _BAR)
         logger.info(
-            f"CYCLE #{self.cycle_count} - {cycle_start.strftime('%Y-%m-%d %H:%M:%S')}"
+            "CYCLE #%d - %s",
+            self.cycle_count,
+            cycle_start.strftime("%Y-%m-%d %H:%M:%S"),
         )
-        logger.info(f"{'=' * 80}\n")
+        logger.info("%s\n", _BAR)
 
         # Check if market is open
         if not self.trader.is_market_open():
             logger.warning("⏸️  Market is closed. Skipping cycle.")
             market_hours = self.trader.get_market_hours()
             if market_hours:
-                logger.info(f"Next market open: {market_hours['next_open']}")
+                logger.info("Next market open: %s", market_hours["next_open"])
+                self._next_open = pd.Timestamp(market_hours["next_open"]).tz_convert(
+                    timezone.utc
+                )
             return {"status": "market_closed", "cycle": self.cycle_count}
+        self._next_open = None
 
-        # Get account info
+        # Get account info and positions in one concurrent refresh
         try:
-            account = self.trader.get_account(force_refresh=True)
+            snapshot = self.trader.snapshot()
+            account = snapshot["account"]
+            positions = snapshot["positions"]
             logger.info(f"💰 Account Status:")
             logger.info(f"   Cash: ${account['cash']:,.2f}")
             logger.info(f"   Portfolio Value: ${account['portfolio_value']:,.2f}")
@@ -163,123 +254,108 @@ class TradingWorkflow:
             return {"status": "error", "error": str(e)}
 
         # Validate portfolio risk
-        is_valid, warnings = self.executor.validate_portfolio_risk()
+        is_valid, warnings = self.executor.validate_portfolio_risk(account, positions)
         if warnings:
             for warning in warnings:
                 logger.warning(warning)
 
-        # Set date range for analysis
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        # Set date range for analysis (fixed for the whole cycle)
+        end_date = cycle_start.date().isoformat()
+        window_start = cycle_start - timedelta(days=ANALYSIS_WINDOW_DAYS)
+        start_date = window_start.date().isoformat()
 
         # Portfolio snapshot for decision engine
-        positions = self.trader.get_all_positions(force_refresh=True)
+        table = _position_table(positions)
+        symbols = table["symbol"].tolist()
         portfolio = {
             "cash": account["cash"],
             "positions": {
-                pos.symbol: {"shares": pos.quantity, "value": pos.market_value}
-                for pos in positions
+                symbol: {"shares": shares, "value": value}
+                for symbol, shares, value in zip(
+                    symbols,
+                    table["quantity"].tolist(),
+                    table["market_value"].tolist(),
+                )
             },
-            "cost_basis": {pos.symbol: pos.cost_basis for pos in positions},
+            "cost_basis": dict(zip(symbols, table["cost_basis"].tolist())),
         }
 
         # Update portfolio in state with detailed position info
-        portfolio_state = {
-            "cash": account["cash"],
-            "total_value": account["portfolio_value"],
-            "total_return": account["portfolio_value"]
-            - 100000.0,  # Assuming 100k initial
-            "total_return_pct": ((account["portfolio_value"] - 100000.0) / 100000.0)
-            * 100,
-            "positions": {},
-            "cost_basis": {},
-        }
-
-        for pos in positions:
-            portfolio_state["positions"][pos.symbol] = {
-                "shares": pos.quantity,
-                "market_value": pos.market_value,
-                "avg_cost": pos.avg_entry_price,
-                "current_price": pos.current_price,
-                "unrealized_pnl": pos.unrealized_pl,
-                "unrealized_pnl_pct": pos.unrealized_plpc * 100,
-                "day_change": pos.change_today,
-                "day_change_pct": pos.unrealized_intraday_plpc * 100,
-            }
-            portfolio_state["cost_basis"][pos.symbol] = pos.cost_basis
-
-        self.state_manager.update_portfolio(portfolio_state)
+        self._publish_portfolio(account, table)
 
         # Analyze each ticker
         decisions = {}
-        cycle_results = {
-            "cycle": self.cycle_count,
-            "timestamp": cycle_start.isoformat(),
-            "tickers_analyzed": [],
-            "decisions": {},
-            "executions": {},
-            "errors": [],
-        }
+        cycle_results = CycleResult(
+            cycle=self.cycle_count, timestamp=cycle_start.isoformat()
+        )
 
-        for ticker in self.tickers:
-            logger.info(f"\n📊 Analyzing {ticker}...")
+        # Decisions are written to the state manager in one batch
+        pending_decisions = []
 
-            try:
-                # Get stock data
-                stock_data = get_stock_data(ticker)
-                if stock_data is None or stock_data.empty:
-                    logger.warning(f"❌ No data available for {ticker}")
-                    cycle_results["errors"].append(f"No data for {ticker}")
-                    continue
-
-                # Run comprehensive analysis
-                analysis = self.decision_engine.run_comprehensive_analysis(
-                    stock=ticker,
-                    stock_data=stock_data,
-                    start_date=start_date,
-                    end_date=end_date,
-                    portfolio=portfolio,
-                )
+        # Fetch bars for every ticker in one request
+        bulk_data = self._prefetch_bulk(self.tickers, start_date, end_date)
 
-                if "error" in analysis:
-                    logger.error(
-                        f"❌ Analysis failed for {ticker}: {analysis['error']}"
-                    )
-                    cycle_results["errors"].append(f"Analysis failed for {ticker}")
-                    continue
+        stock_data = {}
+        for ticker in self.tickers:
+            df = self._load_stock_data(ticker, bulk_data.get(ticker))
+            if df is None:
+                cycle_results.errors.append(f"No data for {ticker}")
+            else:
+                stock_data[ticker] = df
+
+        # Analyze all tickers in one batch; state updates stay on this thread
+        analyses = self.decision_engine.run_batch_analysis(
+            stock_data,
+            start_date=start_date,
+            end_date=end_date,
+            portfolio=portfolio,
+            max_workers=self.max_workers,
+        )
+
+        # Collect in ticker order so decisions execute in a stable order
+        make_decision = TradingDecision
+        for ticker, analysis in analyses.items():
+            if "error" in analysis:
+                logger.error("❌ Analysis failed for %s: %s", ticker, analysis["error"])
+                cycle_results.errors.append(f"Analysis failed for {ticker}")
+                continue
+            current_price = stock_data[ticker]["Close"].iloc[-1]
 
+            try:
                 # Extract decision
                 final_decision = analysis["final_decision"]
 
                 # Create trading decision
-                trading_decision = TradingDecision(
-                    symbol=ticker,
-                    signal=final_decision["signal"],
-                    confidence=final_decision["confidence"],
-                    quantity=final_decision["quantity"],
-                    reasoning=final_decision.get("reasoning", "No reasoning provided"),
+                # Positional: symbol, signal, confidence, quantity, reasoning
+                trading_decision = make_decision(
+                    ticker,
+                    final_decision["signal"],
+                    final_decision["confidence"],
+                    final_decision["quantity"],
+                    final_decision.get("reasoning", "No reasoning provided"),
                 )
 
                 decisions[ticker] = trading_decision
-                cycle_results["tickers_analyzed"].append(ticker)
-                cycle_results["decisions"][ticker] = {
+                cycle_results.tickers_analyzed.append(ticker)
+                cycle_results.decisions[ticker] = {
                     "signal": final_decision["signal"],
                     "confidence": final_decision["confidence"],
                     "quantity": final_decision["quantity"],
                 }
 
                 # Log decision
-                logger.info(f"🎯 Decision for {ticker}:")
-                logger.info(f"   Signal: {final_decision['signal']}")
-                logger.info(f"   Confidence: {final_decision['confidence']:.1f}%")
-                logger.info(f"   Quantity: {final_decision['quantity']}")
-                logger.info(f"   Reasoning: {final_decision.get('reasoning', 'N/A')}")
-
-                # Add decision to state
-                current_price = (
-                    stock_data["Close"].iloc[-1] if not stock_data.empty else 0
-                )
-                self.state_manager.add_decision(
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "🎯 Decision for %s: signal=%s conf=%.1f%% qty=%s | %s",
+                        ticker,
+                        final_decision["signal"],
+                        final_decision["confidence"],
+                        final_decision["quantity"],
+                        final_decision.get("reasoning", "N/A"),
+                    )
+
+                # Queue decision for the state manager
+                pending_decisions.append(
                     {
                         "symbol": ticker,
                         "signal": final_decision["signal"],
@@ -292,17 +368,20 @@ class TradingWorkflow:
                 )
 
             except Exception as e:
-                logger.error(f"❌ Error analyzing {ticker}: {e}")
-                cycle_results["errors"].append(f"Error analyzing {ticker}: {str(e)}")
+                logger.error("❌ Error analyzing %s: %s", ticker, e)
+                cycle_results.errors.append(f"Error analyzing {ticker}: {str(e)}")
+
+        self.state_manager.add_decisions_bulk(pending_decisions)
 
         # Execute decisions
         if decisions:
-            logger.info(f"\n💼 Executing {len(decisions)} trading decisions...")
+            logger.info("\n💼 Executing %d trading decisions...", len(decisions))
             execution_results = self.executor.execute_decisions(decisions)
 
             # Track results
+            pending_executions = []
             for ticker, result in execution_results.items():
-                cycle_results["executions"][ticker] = {
+                cycle_results.executions[ticker] = {
                     "action": result.action,
                     "success": result.success,
                     "quantity": result.executed_quantity,
@@ -314,8 +393,8 @@ class TradingWorkflow:
                     self.successful_trades += 1
                 self.total_trades += 1
 
-                # Record trade execution in state
-                self.state_manager.add_trade_execution(
+                # Queue trade execution for the state manager
+                pending_executions.append(
                     {
                         "symbol": ticker,
                         "action": result.action,
@@ -332,35 +411,189 @@ class TradingWorkflow:
                     }
                 )
 
+            self.state_manager.add_trade_executions_bulk(pending_executions)
+
         # Print cycle summary
-        logger.info(f"\n{'=' * 80}")
-        logger.info(f"CYCLE #{self.cycle_count} SUMMARY")
-        logger.info(f"{'=' * 80}")
-        logger.info(f"Tickers Analyzed: {len(cycle_results['tickers_analyzed'])}")
-        logger.info(f"Decisions Made: {len(cycle_results['decisions'])}")
+        logger.info("\n%s", _BAR)
+        logger.info("CYCLE #%d SUMMARY", self.cycle_count)
+        logger.info(_BAR)
+        logger.info("Tickers Analyzed: %d", len(cycle_results.tickers_analyzed))
+        logger.info("Decisions Made: %d", len(cycle_results.decisions))
         logger.info(
-            f"Trades Executed: {len([r for r in cycle_results['executions'].values() if r['success']])}"
+            "Trades Executed: %d",
+            sum(1 for r in cycle_results.executions.values() if r["success"]),
         )
-        logger.info(f"Errors: {len(cycle_results['errors'])}")
+        logger.info("Errors: %d", len(cycle_results.errors))
 
-        if cycle_results["errors"]:
-            logger.info(f"\nErrors:")
-            for error in cycle_results["errors"]:
-                logger.error(f"  - {error}")
+        if cycle_results.errors:
+            logger.info("\nErrors:")
+            for error in cycle_results.errors:
+                logger.error("  - %s", error)
 
         # Signal distribution
-        signals = [d["signal"] for d in cycle_results["decisions"].values()]
+        signals = Counter(d["signal"] for d in cycle_results.decisions.values())
         if signals:
-            buy_count = signals.count("BUY")
-            sell_count = signals.count("SELL")
-            hold_count = signals.count("HOLD")
+            buy_count, sell_count, hold_count = (
+                signals["BUY"],
+                signals["SELL"],
+                signals["HOLD"],
+            )
             logger.info(
-                f"\nSignal Distribution: BUY({buy_count}) | SELL({sell_count}) | HOLD({hold_count})"
+                "\nSignal Distribution: BUY(%d) | SELL(%d) | HOLD(%d)",
+                buy_count,
+                sell_count,
+                hold_count,
             )
 
-        logger.info(f"{'=' * 80}\n")
+        logger.info("%s\n", _BAR)
+
+        return cycle_results.to_dict()
 
-        return cycle_results
+    def _publish_portfolio(self, account: Dict, table: np.ndarray):
+        """
+        Push the portfolio to the state manager if it changed since last cycle.
+
+        An unchanged portfolio only has its state timestamp bumped, skipping
+        the rebuild and the history snapshot.
+
+        Args:
+            account: Account dictionary from the trader
+            table: Positions as a _POSITION_DTYPE array
+        """
+        ordered = table[np.argsort(table["symbol"])]
+        fingerprint = hash(
+            (
+                account["cash"],
+                account["portfolio_value"],
+                ordered["symbol"].tobytes(),
+                ordered["quantity"].tobytes(),
+                np.round(ordered["current_price"], 4).tobytes(),
+            )
+        )
+        if fingerprint == self._last_portfolio_fingerprint:
+            self.state_manager.touch_portfolio()
+            return
+
+        symbols = table["symbol"].tolist()
+        rows = zip(
+            symbols,
+            table["quantity"].tolist(),
+            table["market_value"].tolist(),
+            table["avg_entry_price"].tolist(),
+            table["current_price"].tolist(),
+            table["unrealized_pl"].tolist(),
+            (table["unrealized_plpc"] * 100).tolist(),
+            table["change_today"].tolist(),
+            (table["unrealized_intraday_plpc"] * 100).tolist(),
+        )
+        portfolio_state = {
+            "cash": account["cash"],
+            "total_value": account["portfolio_value"],
+            "total_return": account["portfolio_value"]
+            - 100000.0,  # Assuming 100k initial
+            "total_return_pct": ((account["portfolio_value"] - 100000.0) / 100000.0)
+            * 100,
+            "positions": {
+                symbol: {
+                    "shares": shares,
+                    "market_value": market_value,
+                    "avg_cost": avg_cost,
+                    "current_price": price,
+                    "unrealized_pnl": pnl,
+                    "unrealized_pnl_pct": pnl_pct,
+                    "day_change": day_change,
+                    "day_change_pct": day_change_pct,
+                }
+                for (
+                    symbol,
+                    shares,
+                    market_value,
+                    avg_cost,
+                    price,
+                    pnl,
+                    pnl_pct,
+                    day_change,
+                    day_change_pct,
+                ) in rows
+            },
+            "cost_basis": dict(zip(symbols, table["cost_basis"].tolist())),
+        }
+
+        self.state_manager.update_portfolio(portfolio_state)
+        self._last_portfolio_fingerprint = fingerprint
+
+    def _prefetch_bulk(
+        self, tickers: List[str], start_date: str, end_date: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily bars for all tickers with multi-symbol requests.
+
+        Closed history (through the day before end_date) comes from the
+        on-disk cache where possible, so a cycle normally requests only the
+        latest bar for every ticker in one call.
+
+        Returns:
+            Dictionary of ticker -> OHLCV DataFrame (missing tickers omitted)
+        """
+        history_end = (date.fromisoformat(end_date) - timedelta(days=1)).isoformat()
+
+        history = {}
+        for ticker in tickers:
+            cached = self.data_cache.get(ticker, start_date, history_end)
+            if cached is not None:
+                history[ticker] = cached
+
+        missing = [ticker for ticker in tickers if ticker not in history]
+        if missing:
+            bars = self.trader.get_bars_multi(
+                missing, timeframe="1Day", start=start_date, end=history_end
+            )
+            for ticker, df in bars.items():
+                df = df.rename(columns=_BAR_COLUMNS)
+                history[ticker] = df
+                try:
+                    self.data_cache.set(ticker, start_date, history_end, df)
+                except Exception as e:
+                    logger.warning("Failed to cache bars for %s: %s", ticker, e)
+
+        latest = self.trader.get_bars_multi(
+            tickers, timeframe="1Day", start=end_date, end=end_date
+        )
+
+        result = {}
+        for ticker in tickers:
+            frames = [history.get(ticker)]
+            if ticker in latest:
+                frames.append(latest[ticker].rename(columns=_BAR_COLUMNS))
+            frames = [df for df in frames if df is not None and not df.empty]
+            if frames:
+                result[ticker] = pd.concat(frames) if len(frames) > 1 else frames[0]
+
+        return result
+
+    def _load_stock_data(
+        self, ticker: str, stock_data: Optional[pd.DataFrame] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get bars for one ticker, falling back to a single-ticker fetch.
+
+        Args:
+            stock_data: Prefetched bars; fetched individually if None or empty
+
+        Returns:
+            OHLCV DataFrame, or None if no data is available
+        """
+        try:
+            if stock_data is None or stock_data.empty:
+                stock_data = get_stock_data(ticker)
+        except Exception as e:
+            logger.error("❌ Error fetching data for %s: %s", ticker, e)
+            return None
+
+        if stock_data is None or stock_data.empty:
+            logger.warning("❌ No data available for %s", ticker)
+            return None
+        return stock_data
 
     def run_continuous(self, max_cycles: Optional[int] = None):
         """
@@ -379,10 +612,15 @@ class TradingWorkflow:
         if max_cycles:
             logger.info(f"Max Cycles: {max_cycles}")
 
-        logger.info(f"\n{'=' * 80}\n")
+        logger.info("\n%s\n", _BAR)
 
         try:
+            # Cycles start on a fixed cadence: sleep only what is left of the
+            # interval after the cycle's own work
+            next_deadline = time.monotonic()
             while True:
+                next_deadline += self.check_interval
+
                 # Run cycle
                 result = self.run_single_cycle()
 
@@ -395,11 +633,18 @@ class TradingWorkflow:
                 if self.cycle_count % 10 == 0:
                     self.print_overall_stats()
 
-                # Wait for next cycle
-                logger.info(
-                    f"⏰ Waiting {self.check_interval} seconds for next cycle..."
-                )
-                time.sleep(self.check_interval)
+                # Wait for next cycle; sleep through a closed market in one go
+                remaining = next_deadline - time.monotonic()
+                until_open = self._seconds_until_open()
+                if until_open > remaining:
+                    next_deadline += until_open - remaining
+                    remaining = until_open
+                if remaining > 0:
+                    logger.info(f"⏰ Waiting {remaining:.1f} seconds for next cycle...")
+                    time.sleep(remaining)
+                else:
+                    logger.warning(f"⚠️  Cycle overran interval by {-remaining:.2f}s")
+                    next_deadline = time.monotonic()
 
         except KeyboardInterrupt:
             logger.info(f"\n⚠️  Trading workflow interrupted by user")
@@ -409,11 +654,17 @@ class TradingWorkflow:
         finally:
             self.shutdown()
 
+    def _seconds_until_open(self) -> float:
+        """Seconds until the cached next market open (0 if unknown or passed)."""
+        if self._next_open is None:
+            return 0.0
+        return max(0.0, (self._next_open - datetime.now(timezone.utc)).total_seconds())
+
     def print_overall_stats(self):
         """Print overall trading statistics."""
-        logger.info(f"\n{'=' * 80}")
-        logger.info(f"OVERALL TRADING STATISTICS")
-        logger.info(f"{'=' * 80}")
+        logger.info("\n%s", _BAR)
+        logger.info("OVERALL TRADING STATISTICS")
+        logger.info(_BAR)
         logger.info(f"Total Cycles: {self.cycle_count}")
         logger.info(f"Total Trades: {self.total_trades}")
         logger.info(f"Successful Trades: {self.successful_trades}")
@@ -445,13 +696,13 @@ class TradingWorkflow:
         logger.info(f"  Sells: {exec_stats.get('sells', 0)}")
         logger.info(f"  Holds: {exec_stats.get('holds', 0)}")
 
-        logger.info(f"{'=' * 80}\n")
+        logger.info("%s\n", _BAR)
 
     def shutdown(self):
         """Shutdown workflow and cleanup."""
-        logger.info(f"\n{'=' * 80}")
+        logger.info("\n%s", _BAR)
         logger.info("SHUTTING DOWN TRADING WORKFLOW")
-        logger.info(f"{'=' * 80}")
+        logger.info(_BAR)
 
         # Print final stats
         self.print_overall_stats()
@@ -461,23 +712,78 @@ class TradingWorkflow:
             logger.info("Canceling all pending orders...")
             self.trader.cancel_all_orders()
 
+        self.executor.close()
         logger.info("✅ Trading workflow shutdown complete")
 
 
+def _configure_logging():
+    """
+    Send root logging through a queue to a background stderr writer.
+
+    Only applies when the application has not configured logging itself,
+    so importing this module never changes global logging state.
+    """
+    global _log_listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter(_LOG_FORMAT))
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    _log_listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def _position_table(positions: List) -> np.ndarray:
+    """Pack PortfolioPosition objects into one _POSITION_DTYPE array."""
+    return np.fromiter(
+        (
+            (
+                pos.symbol,
+                pos.quantity,
+                pos.market_value,
+                pos.cost_basis,
+                pos.avg_entry_price,
+                pos.current_price,
+                pos.unrealized_pl,
+                pos.unrealized_plpc,
+                pos.change_today,
+                pos.unrealized_intraday_plpc,
+            )
+            for pos in positions
+        ),
+        dtype=_POSITION_DTYPE,
+        count=len(positions),
+    )
+
+
 def create_workflow(
     tickers: List[str],
     dry_run: bool = True,
     min_confidence: float = 60.0,
     max_position_pct: float = 0.20,
     check_interval: int = 60,
+    max_workers: int = 8,
 ) -> TradingWorkflow:
-    """Create a TradingWorkflow instance."""
+    """
+    Create a TradingWorkflow instance.
+
+    Installing the optional numba package (pip install numba) compiles the
+    rolling indicators used when neither TA-Lib nor pandas_ta is available;
+    the machine code is cached on disk, so only the first run pays for it.
+    """
     return TradingWorkflow(
         tickers=tickers,
         dry_run=dry_run,
         min_confidence=min_confidence,
         max_position_pct=max_position_pct,
         check_interval=check_interval,
+        max_workers=max_workers,
     )
 
 
@@ -19,394 +19,112 @@ st.set_page_config(
 )
 
 # Now import everything else
-import sys
-import os
 from datetime import datetime
 import asyncio
+import copy
+import functools
+import re
+import time
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-
-from pages.dashboard import render_dashboard
-from pages.analysis import render_analysis_page
-from pages.portfolio import render_portfolio_page
-from pages.monitoring import render_monitoring_page
-
-# Import simple state manager (no external dependencies)
-try:
-    from ui import simple_state
-
-    STATE_MANAGER = simple_state
-    SYSTEM_AVAILABLE = True
-except Exception as e:
-    print(f"Warning: Could not initialize state manager: {e}")
-    STATE_MANAGER = None
-    SYSTEM_AVAILABLE = False
-
-# Custom CSS for professional look
-st.markdown(
-    """
-<style>
-    /* Main theme colors */
-    :root {
-        --primary-color: #1f77b4;
-        --success-color: #28a745;
-        --warning-color: #ffc107;
-        --danger-color: #dc3545;
-        --info-color: #17a2b8;
-        --dark-bg: #0e1117;
-        --light-bg: #f0f2f6;
-    }
-
-    /* Header styling */
-    .main-header {
-        font-size: 3.5rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #1f77b4 0%, #17a2b8 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 1rem;
-        padding: 1rem 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }
-
-    .sub-header {
-        font-size: 1.2rem;
-        color: #666;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #f0f2f6 0%, #ffffff 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border-left: 5px solid #1f77b4;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1rem;
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
-    }
-
-    .metric-card.success {
-        border-left-color: #28a745;
-    }
-
-    .metric-card.warning {
-        border-left-color: #ffc107;
-    }
-
-    .metric-card.danger {
-        border-left-color: #dc3545;
-    }
-
-    .metric-card.info {
-        border-left-color: #17a2b8;
-    }
-
-    /* Status indicators */
-    .status-active {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.5rem 1.5rem;
-        background-color: #d4edda;
-        color: #155724;
-        border-radius: 20px;
-        font-weight: 600;
-        box-shadow: 0 2px 4px rgba(40, 167, 69, 0.2);
-    }
-
-    .status-inactive {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.5rem 1.5rem;
-        background-color: #fff3cd;
-        color: #856404;
-        border-radius: 20px;
-        font-weight: 600;
-        box-shadow: 0 2px 4px rgba(255, 193, 7, 0.2);
-    }
-
-    .status-error {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.5rem 1.5rem;
-        background-color: #f8d7da;
-        color: #721c24;
-        border-radius: 20px;
-        font-weight: 600;
-        box-shadow: 0 2px 4px rgba(220, 53, 69, 0.2);
-    }
-
-    /* Signal badges */
-    .signal-buy {
-        background-color: #d4edda;
-        color: #155724;
-        padding: 0.25rem 0.75rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-
-    .signal-sell {
-        background-color: #f8d7da;
-        color: #721c24;
-        padding: 0.25rem 0.75rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-
-    .signal-hold {
-        background-color: #fff3cd;
-        color: #856404;
-        padding: 0.25rem 0.75rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
+import numpy as np
 
-    /* Sidebar styling */
-    .css-1d391kg {
-        background-color: #f8f9fa;
-    }
 
-    /* Button styling */
-    .stButton>button {
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
+@st.cache_resource
+def get_state_manager():
+    """Import the simple state manager once per process; None if unavailable."""
+    try:
+        import simple_state
+    except Exception as e:
+        print(f"Warning: Could not initialize state manager: {e}")
+        return None
+    return simple_state
 
-    .stButton>button:hover {
-        transform: scale(1.05);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-    }
 
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2rem;
-    }
+# Seconds a loaded state snapshot is reused across reruns
+STATE_CACHE_TTL = 5
 
-    .stTabs [data-baseweb="tab"] {
-        height: 3rem;
-        padding: 0 2rem;
-        border-radius: 8px 8px 0 0;
-        font-weight: 600;
-        font-size: 1.1rem;
-    }
+# Seconds a batch of quotes is reused across reruns
+QUOTE_CACHE_TTL = 5
 
-    /* Alert boxes */
-    .alert-success {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        color: #155724;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
 
-    .alert-warning {
-        background-color: #fff3cd;
-        border: 1px solid #ffeaa7;
-        color: #856404;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
+@st.cache_data(ttl=STATE_CACHE_TTL, show_spinner=False)
+def _cached_state(version: int) -> tuple:
+    """Load state and its parsed timestamp; reruns with the same version share it."""
+    state = get_state_manager().load_state()
+    stamp = state.get("timestamp")
+    return state, datetime.fromisoformat(stamp) if stamp else None
 
-    .alert-danger {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
 
-    /* Loading animation */
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
+def load_state() -> dict:
+    """Get current state, hitting disk only when the state version changes."""
+    return _cached_state(st.session_state.get("state_version", 0))[0]
 
-    .loading {
-        animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite;
-    }
 
-    /* Footer styling */
-    .footer {
-        text-align: center;
-        color: #999;
-        padding: 2rem 0;
-        border-top: 1px solid #e0e0e0;
-        margin-top: 3rem;
-    }
+def bump_state_version():
+    """Invalidate the cached state so the next load_state() reads it fresh."""
+    st.session_state.state_version = st.session_state.get("state_version", 0) + 1
 
-    /* Data table styling */
-    .dataframe {
-        font-size: 0.9rem;
-    }
 
-    .dataframe thead th {
-        background-color: #1f77b4 !important;
-        color: white !important;
-        font-weight: 600;
-    }
+# Custom CSS for professional look, kept in assets/app.css
+CSS_PATH = Path(__file__).parent / "assets" / "app.css"
 
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
 
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 10px;
-        height: 10px;
-    }
+@st.cache_resource
+def _css_blob() -> str:
+    """Read and minify the app stylesheet once per process."""
+    css = re.sub(r"/\*.*?\*/", "", CSS_PATH.read_text(), flags=re.S)
+    return "<style>" + " ".join(css.split()) + "</style>"
 
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 10px;
-    }
 
-    ::-webkit-scrollbar-thumb {
-        background: #888;
-        border-radius: 10px;
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-        background: #555;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
+# Tickers offered in the sidebar's trading universe picker
+STOCK_UNIVERSE: tuple[str, ...] = (
+    "AAPL",
+    "TSLA",
+    "GOOGL",
+    "MSFT",
+    "AMZN",
+    "NVDA",
+    "META",
+    "NFLX",
+    "AMD",
+    "INTC",
 )
 
-
-# Initialize session state
-def initialize_session_state():
-    """Initialize session state variables - now loads from state manager."""
-    if "initialized" not in st.session_state:
-        st.session_state.initialized = True
-
-    # Load real-time state from simple state manager
-    if STATE_MANAGER is not None:
-        try:
-            # Get current state from state manager
-            current_state = STATE_MANAGER.load_state()
-
-            # Update session state with real data
-            st.session_state.trading_active = current_state.get("trading_active", False)
-            st.session_state.last_update = datetime.fromisoformat(
-                current_state.get("timestamp", datetime.now().isoformat())
-            )
-            st.session_state.cycle_count = current_state.get("cycle_count", 0)
-            st.session_state.total_decisions = current_state.get("total_decisions", 0)
-            st.session_state.total_trades = current_state.get("total_trades", 0)
-            st.session_state.successful_trades = current_state.get(
-                "successful_trades", 0
-            )
-
-            # Portfolio state
-            st.session_state.portfolio = current_state.get("portfolio", {})
-
-            # System state
-            st.session_state.system_health = current_state.get("system_health", {})
-
-            # Recent decisions
-            st.session_state.recent_decisions = current_state.get(
-                "recent_decisions", []
-            )
-
-            # Analytics
-            st.session_state.analytics = current_state.get("analytics", {})
-
-            # Settings
-            st.session_state.settings = current_state.get("settings", {})
-
-            # Portfolio history
-            st.session_state.portfolio_history = None  # Will be loaded on demand
-            st.session_state.daily_pnl_history = None  # Will be loaded on demand
-
-        except Exception as e:
-            st.error(f"Error loading state from state manager: {e}")
-            # Fall back to default values
-            _initialize_default_state()
-    else:
-        # No state manager available, use defaults
-        _initialize_default_state()
-
-
-def update_portfolio_value():
-    """Update total portfolio value."""
-    positions_value = sum(
-        pos["shares"] * get_stock_price(symbol)
-        for symbol, pos in st.session_state.positions.items()
-    )
-    st.session_state.portfolio["total_value"] = st.session_state.cash + positions_value
-    st.session_state.portfolio["cash"] = st.session_state.cash
-
-    # Calculate return
-    initial = 100000.0
-    st.session_state.portfolio["total_return"] = (
-        st.session_state.portfolio["total_value"] - initial
-    )
-    st.session_state.portfolio["total_return_pct"] = (
-        st.session_state.portfolio["total_return"] / initial
-    ) * 100
-
-
-def _initialize_default_state():
-    """Initialize default state when state manager is not available."""
-    st.session_state.trading_active = False
-    st.session_state.last_update = datetime.now()
-    st.session_state.cycle_count = 0
-    st.session_state.total_decisions = 0
-    st.session_state.total_trades = 0
-    st.session_state.successful_trades = 0
-
-    # Portfolio state
-    st.session_state.portfolio = {
+# Session defaults, copied into each new session
+_DEFAULTS = {
+    "initialized": True,
+    "trading_active": False,
+    "cycle_count": 0,
+    "total_decisions": 0,
+    "total_trades": 0,
+    "successful_trades": 0,
+    "portfolio": {
         "cash": 100000.0,
         "positions": {},
         "cost_basis": {},
         "total_value": 100000.0,
         "total_return": 0.0,
         "total_return_pct": 0.0,
-    }
-
-    # System state
-    st.session_state.system_health = {
+    },
+    "system_health": {
         "api_status": "Disconnected",
         "database_status": "Offline",
         "models_loaded": 0,
         "total_models": 5,
         "memory_usage": 0,
         "cpu_usage": 0,
-    }
-
-    # Recent decisions
-    st.session_state.recent_decisions = []
-
-    # Analytics
-    st.session_state.analytics = {
+    },
+    "recent_decisions": [],
+    "analytics": {
         "daily_pnl": 0.0,
         "weekly_pnl": 0.0,
         "monthly_pnl": 0.0,
         "sharpe_ratio": 0.0,
         "max_drawdown": 0.0,
         "win_rate": 0.0,
-    }
-
-    # Settings
-    st.session_state.settings = {
+    },
+    "settings": {
         "stock_list": ["AAPL", "TSLA", "GOOGL"],
         "confidence_threshold": 60,
         "base_quantity": 100,
@@ -414,9 +132,96 @@ def _initialize_default_state():
         "cycle_interval": 60,
         "auto_refresh": True,
         "refresh_interval": 5,
+    },
+    # Loaded on demand
+    "portfolio_history": None,
+    "daily_pnl_history": None,
+}
+
+# Keys mirrored from the state manager on every refresh
+_LIVE_KEYS = (
+    "trading_active",
+    "cycle_count",
+    "total_decisions",
+    "total_trades",
+    "successful_trades",
+    "portfolio",
+    "system_health",
+    "recent_decisions",
+    "analytics",
+)
+
+
+def _state_updates(current_state: dict, keys) -> dict:
+    """Pick keys from a state-manager state, falling back to fresh defaults."""
+    return {
+        key: current_state[key]
+        if key in current_state
+        else copy.deepcopy(_DEFAULTS[key])
+        for key in keys
     }
 
 
+# Initialize session state
+def initialize_session_state():
+    """Initialize session state variables - now loads from state manager."""
+    first_run = "initialized" not in st.session_state
+    st.session_state.setdefault("state_version", 0)
+    for key, value in _DEFAULTS.items():
+        st.session_state.setdefault(key, copy.deepcopy(value))
+    st.session_state.setdefault("last_update", datetime.now())
+
+    # No state manager available, keep the defaults
+    if get_state_manager() is None:
+        return
+
+    # Load real-time state from simple state manager in one update; saved
+    # settings seed a new session, after that the sidebar widgets own them
+    keys = _LIVE_KEYS + ("settings",) if first_run else _LIVE_KEYS
+    try:
+        current_state, saved_at = _cached_state(st.session_state.state_version)
+        updates = _state_updates(current_state, keys)
+        updates["last_update"] = saved_at or datetime.now()
+        st.session_state.update(updates)
+    except Exception as e:
+        st.error(f"Error loading state from state manager: {e}")
+
+
+@st.cache_data(ttl=QUOTE_CACHE_TTL, show_spinner=False)
+def _cached_quotes(symbols: tuple) -> np.ndarray:
+    """Latest prices for the given symbols, in order."""
+    from trade_utils import get_stock_price
+
+    return np.fromiter(
+        (get_stock_price(symbol) for symbol in symbols),
+        dtype=np.float64,
+        count=len(symbols),
+    )
+
+
+def update_portfolio_value():
+    """Update total portfolio value."""
+    positions = st.session_state.positions
+    symbols = tuple(positions)
+    shares = np.fromiter(
+        (positions[symbol]["shares"] for symbol in symbols),
+        dtype=np.float64,
+        count=len(symbols),
+    )
+    positions_value = float(shares @ _cached_quotes(symbols))
+    st.session_state.portfolio["total_value"] = st.session_state.cash + positions_value
+    st.session_state.portfolio["cash"] = st.session_state.cash
+
+    # Calculate return
+    initial = 100000.0
+    st.session_state.portfolio["total_return"] = (
+        st.session_state.portfolio["total_value"] - initial
+    )
+    st.session_state.portfolio["total_return_pct"] = (
+        st.session_state.portfolio["total_return"] / initial
+    ) * 100
+
+
 def render_header():
     """Render the main header with status."""
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -433,52 +238,111 @@ def render_header():
 
     # Real-time status bar
     st.markdown("---")
-    col1, col2, col3, col4 = st.columns(4)
+    st.fragment(run_every=_refresh_every())(_status_strip)()
 
-    with col1:
-        if st.session_state.trading_active:
-            st.markdown(
-                '<div class="status-active">🟢 SYSTEM ACTIVE</div>',
-                unsafe_allow_html=True,
-            )
-        else:
-            st.markdown(
-                '<div class="status-inactive">🟡 SYSTEM STANDBY</div>',
-                unsafe_allow_html=True,
-            )
 
-    with col2:
-        api_status = st.session_state.system_health.get("api_status", "Disconnected")
-        if api_status == "Connected":
-            st.markdown(
-                '<div class="status-active">📡 API Connected</div>',
-                unsafe_allow_html=True,
-            )
-        else:
-            st.markdown(
-                '<div class="status-inactive">📡 API Offline</div>',
-                unsafe_allow_html=True,
-            )
+def _refresh_every():
+    """Auto-refresh period in seconds for timed fragments, or None when off."""
+    settings = st.session_state.settings
+    if not settings.get("auto_refresh"):
+        return None
+    return settings.get("refresh_interval", 5)
 
-    with col3:
-        models_loaded = st.session_state.system_health.get("models_loaded", 0)
-        total_models = st.session_state.system_health.get("total_models", 5)
-        if models_loaded == total_models:
-            st.markdown(
-                f'<div class="status-active">🤖 Models {models_loaded}/{total_models}</div>',
-                unsafe_allow_html=True,
-            )
-        else:
-            st.markdown(
-                f'<div class="status-inactive">🤖 Models {models_loaded}/{total_models}</div>',
-                unsafe_allow_html=True,
-            )
 
-    with col4:
-        st.markdown(
-            f'<div class="status-active">⏱️ Cycle #{st.session_state.cycle_count}</div>',
-            unsafe_allow_html=True,
+def _status_strip():
+    """Status cards; with auto-refresh on, this fragment alone reruns on a timer."""
+    if st.session_state.settings.get("auto_refresh", False):
+        _refresh_state()
+
+    session = st.session_state
+    health = session.system_health
+    trading_active = session.trading_active
+    cycle_count = session.cycle_count
+
+    st.html(
+        _status_html(
+            trading_active,
+            health.get("api_status", "Disconnected"),
+            health.get("models_loaded", 0),
+            health.get("total_models", 5),
+            cycle_count,
         )
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _status_html(
+    trading_active: bool,
+    api_status: str,
+    models_loaded: int,
+    total_models: int,
+    cycle_count: int,
+) -> str:
+    """Status strip markup; rebuilt only when one of the inputs changes."""
+    if trading_active:
+        active = '<div class="status-active">🟢 SYSTEM ACTIVE</div>'
+    else:
+        active = '<div class="status-inactive">🟡 SYSTEM STANDBY</div>'
+
+    if api_status == "Connected":
+        api = '<div class="status-active">📡 API Connected</div>'
+    else:
+        api = '<div class="status-inactive">📡 API Offline</div>'
+
+    if models_loaded == total_models:
+        models_class = "status-active"
+    else:
+        models_class = "status-inactive"
+    models = f'<div class="{models_class}">🤖 Models {models_loaded}/{total_models}</div>'
+
+    cycle = f'<div class="status-active">⏱️ Cycle #{cycle_count}</div>'
+
+    # One element for the whole strip; the grid lives in the stylesheet
+    return f'<div class="status-strip">{active}{api}{models}{cycle}</div>'
+
+
+def _refresh_state():
+    """Merge the latest state-manager state into the session, once per interval."""
+    if get_state_manager() is None:
+        return
+
+    now = time.monotonic()
+    interval = st.session_state.settings.get("refresh_interval", 5)
+    if now - st.session_state.get("last_refresh", 0.0) < interval:
+        return
+    st.session_state.last_refresh = now
+
+    try:
+        bump_state_version()
+        current_state = load_state()
+
+        # Every state-manager write stamps the state; skip the merge when the
+        # stamp has not moved since the last one we applied
+        stamp = current_state.get("timestamp")
+        if stamp is not None and stamp == st.session_state.get("state_timestamp"):
+            return
+        st.session_state.state_timestamp = stamp
+
+        st.session_state.update(
+            {key: current_state[key] for key in _LIVE_KEYS if key in current_state}
+        )
+        st.session_state.last_update = datetime.now()
+    except Exception as e:
+        st.error(f"Error refreshing state: {e}")
+
+
+def _sync_setting(name: str):
+    """Widget callback: copy a widget's new value into the settings dict."""
+    st.session_state.settings[name] = st.session_state[name]
+
+
+def _last_update_str() -> str:
+    """last_update as HH:MM:SS, reformatted only when it changes."""
+    last_update = st.session_state.last_update
+    if st.session_state.get("_ts_cache") != last_update:
+        st.session_state._ts_cache = last_update
+        st.session_state._ts_str = last_update.strftime("%H:%M:%S")
+    return st.session_state._ts_str
 
 
 def render_sidebar():
@@ -495,19 +359,20 @@ def render_sidebar():
                 st.session_state.trading_active = True
                 st.session_state.system_health["api_status"] = "Connected"
                 st.session_state.system_health["models_loaded"] = 5
+                bump_state_version()
                 st.success("✅ Trading system started!")
-                st.rerun()
 
         with col2:
             if st.button("⏹️ Stop", type="secondary", use_container_width=True):
                 st.session_state.trading_active = False
                 st.session_state.system_health["api_status"] = "Disconnected"
+                bump_state_version()
                 st.warning("⏸️ Trading system stopped!")
-                st.rerun()
 
         if st.button("🔄 Reset System", use_container_width=True):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
+            _cached_state.clear()
+            initialize_session_state()
             st.success("🔄 System reset complete!")
             st.rerun()
 
@@ -516,180 +381,232 @@ def render_sidebar():
         # Configuration Section
         st.markdown("### ⚙️ Configuration")
 
-        # Stock selection
-        stock_list = st.multiselect(
-            "📊 Trading Universe",
-            options=[
-                "AAPL",
-                "TSLA",
-                "GOOGL",
-                "MSFT",
-                "AMZN",
-                "NVDA",
-                "META",
-                "NFLX",
-                "AMD",
-                "INTC",
-            ],
-            default=st.session_state.settings["stock_list"],
-            help="Select stocks to monitor and trade",
-        )
-        st.session_state.settings["stock_list"] = stock_list
-
-        # Confidence threshold
-        confidence_threshold = st.slider(
-            "🎯 Confidence Threshold (%)",
-            min_value=50,
-            max_value=95,
-            value=st.session_state.settings["confidence_threshold"],
-            step=5,
-            help="Minimum confidence required to execute trades",
-        )
-        st.session_state.settings["confidence_threshold"] = confidence_threshold
+        # Widgets inside the form only rerun the app when Apply is pressed
+        settings = st.session_state.settings
+        with st.form("config_form", clear_on_submit=False):
+            # Stock selection
+            stock_list = st.multiselect(
+                "📊 Trading Universe",
+                options=STOCK_UNIVERSE,
+                default=settings["stock_list"],
+                help="Select stocks to monitor and trade",
+                key="stock_list_ms",
+            )
 
-        # Quantity settings
-        col1, col2 = st.columns(2)
-        with col1:
-            base_qty = st.number_input(
-                "📦 Base Qty",
-                min_value=1,
-                max_value=1000,
-                value=st.session_state.settings["base_quantity"],
+            # Confidence threshold
+            confidence_threshold = st.slider(
+                "🎯 Confidence Threshold (%)",
+                min_value=50,
+                max_value=95,
+                value=settings["confidence_threshold"],
+                step=5,
+                help="Minimum confidence required to execute trades",
+                key="confidence_threshold",
+            )
+
+            # Quantity settings
+            col1, col2 = st.columns(2)
+            with col1:
+                base_qty = st.number_input(
+                    "📦 Base Qty",
+                    min_value=1,
+                    max_value=1000,
+                    value=settings["base_quantity"],
+                    step=10,
+                    key="base_quantity",
+                )
+
+            with col2:
+                max_qty = st.number_input(
+                    "📦 Max Qty",
+                    min_value=1,
+                    max_value=5000,
+                    value=settings["max_quantity"],
+                    step=50,
+                    key="max_quantity",
+                )
+
+            # Cycle interval
+            cycle_interval = st.slider(
+                "⏱️ Cycle Interval (sec)",
+                min_value=10,
+                max_value=300,
+                value=settings["cycle_interval"],
                 step=10,
+                help="Time between trading cycles",
+                key="cycle_interval",
             )
-            st.session_state.settings["base_quantity"] = base_qty
 
-        with col2:
-            max_qty = st.number_input(
-                "📦 Max Qty",
+            if st.form_submit_button("✅ Apply", use_container_width=True):
+                settings.update(
+                    {
+                        "stock_list": stock_list,
+                        "confidence_threshold": confidence_threshold,
+                        "base_quantity": base_qty,
+                        "max_quantity": max_qty,
+                        "cycle_interval": cycle_interval,
+                    }
+                )
+
+        st.markdown("---")
+
+        # Read-only metrics refresh on their own timer
+        st.fragment(run_every=_refresh_every())(_sidebar_metrics)()
+
+        # Display Settings
+        st.markdown("### 🎨 Display Settings")
+
+        st.checkbox(
+            "🔄 Auto-refresh",
+            value=st.session_state.settings["auto_refresh"],
+            help="Automatically refresh data",
+            key="auto_refresh",
+            on_change=_sync_setting,
+            args=("auto_refresh",),
+        )
+
+        if st.session_state.settings["auto_refresh"]:
+            st.slider(
+                "Refresh interval (sec)",
                 min_value=1,
-                max_value=5000,
-                value=st.session_state.settings["max_quantity"],
-                step=50,
+                max_value=60,
+                value=st.session_state.settings["refresh_interval"],
+                key="refresh_interval",
+                on_change=_sync_setting,
+                args=("refresh_interval",),
             )
-            st.session_state.settings["max_quantity"] = max_qty
-
-        # Cycle interval
-        cycle_interval = st.slider(
-            "⏱️ Cycle Interval (sec)",
-            min_value=10,
-            max_value=300,
-            value=st.session_state.settings["cycle_interval"],
-            step=10,
-            help="Time between trading cycles",
-        )
-        st.session_state.settings["cycle_interval"] = cycle_interval
 
+        # Footer
         st.markdown("---")
+        st.caption(f"Last updated: {_last_update_str()}")
+        st.caption("StockAI v1.0.0")
 
-        # Portfolio Overview
-        st.markdown("### 💼 Portfolio Overview")
 
-        total_value = st.session_state.portfolio["total_value"]
-        cash = st.session_state.portfolio["cash"]
-        positions_count = len(st.session_state.portfolio["positions"])
-        total_return_pct = st.session_state.portfolio["total_return_pct"]
+def _sidebar_metrics():
+    """Portfolio, performance and health metrics shown in the sidebar."""
+    if st.session_state.settings.get("auto_refresh", False):
+        _refresh_state()
 
-        st.metric(
-            "💰 Total Value", f"${total_value:,.2f}", delta=f"{total_return_pct:+.2f}%"
-        )
+    session = st.session_state
+    portfolio = session.portfolio
+    analytics = session.analytics
+    health = session.system_health
 
-        st.metric("💵 Cash Available", f"${cash:,.2f}")
+    # Portfolio Overview
+    st.markdown("### 💼 Portfolio Overview")
 
-        st.metric("📊 Active Positions", f"{positions_count}")
+    total_value = portfolio["total_value"]
+    cash = portfolio["cash"]
+    positions_count = len(portfolio["positions"])
+    total_return_pct = portfolio["total_return_pct"]
 
-        # Calculate invested amount
-        invested = total_value - cash
-        if total_value > 0:
-            invested_pct = (invested / total_value) * 100
-        else:
-            invested_pct = 0
+    st.metric(
+        "💰 Total Value", f"${total_value:,.2f}", delta=f"{total_return_pct:+.2f}%"
+    )
 
-        st.progress(invested_pct / 100, text=f"Invested: {invested_pct:.1f}%")
+    st.metric("💵 Cash Available", f"${cash:,.2f}")
 
-        st.markdown("---")
+    st.metric("📊 Active Positions", f"{positions_count}")
 
-        # Performance Metrics
-        st.markdown("### 📊 Performance")
+    # Calculate invested amount
+    invested = total_value - cash
+    if total_value > 0:
+        invested_pct = (invested / total_value) * 100
+    else:
+        invested_pct = 0
 
-        st.metric("📈 Win Rate", f"{st.session_state.analytics['win_rate']:.1f}%")
+    st.progress(invested_pct / 100, text=f"Invested: {invested_pct:.1f}%")
 
-        st.metric(
-            "📉 Max Drawdown", f"{st.session_state.analytics['max_drawdown']:.2f}%"
-        )
+    st.markdown("---")
 
-        st.metric(
-            "⚡ Sharpe Ratio", f"{st.session_state.analytics['sharpe_ratio']:.2f}"
-        )
+    # Performance Metrics
+    st.markdown("### 📊 Performance")
 
-        st.markdown("---")
+    st.metric("📈 Win Rate", f"{analytics['win_rate']:.1f}%")
 
-        # System Status
-        st.markdown("### 🏥 System Health")
+    st.metric("📉 Max Drawdown", f"{analytics['max_drawdown']:.2f}%")
 
-        mem_usage = st.session_state.system_health.get("memory_usage", 0)
-        cpu_usage = st.session_state.system_health.get("cpu_usage", 0)
+    st.metric("⚡ Sharpe Ratio", f"{analytics['sharpe_ratio']:.2f}")
 
-        st.metric("💾 Memory", f"{mem_usage}%")
-        st.progress(mem_usage / 100)
+    st.markdown("---")
 
-        st.metric("🖥️ CPU", f"{cpu_usage}%")
-        st.progress(cpu_usage / 100)
+    # System Status
+    st.markdown("### 🏥 System Health")
 
-        st.markdown("---")
+    mem_usage = health.get("memory_usage", 0)
+    cpu_usage = health.get("cpu_usage", 0)
 
-        # Display Settings
-        st.markdown("### 🎨 Display Settings")
+    st.metric("💾 Memory", f"{mem_usage}%")
+    st.progress(mem_usage / 100)
 
-        auto_refresh = st.checkbox(
-            "🔄 Auto-refresh",
-            value=st.session_state.settings["auto_refresh"],
-            help="Automatically refresh data",
-        )
-        st.session_state.settings["auto_refresh"] = auto_refresh
+    st.metric("🖥️ CPU", f"{cpu_usage}%")
+    st.progress(cpu_usage / 100)
 
-        if auto_refresh:
-            refresh_interval = st.slider(
-                "Refresh interval (sec)",
-                min_value=1,
-                max_value=60,
-                value=st.session_state.settings["refresh_interval"],
-            )
-            st.session_state.settings["refresh_interval"] = refresh_interval
+    st.markdown("---")
 
-        # Footer
-        st.markdown("---")
-        st.caption(f"Last updated: {st.session_state.last_update.strftime('%H:%M:%S')}")
-        st.caption("StockAI v1.0.0")
+
+# Each tab is a fragment: its own widgets rerun only that tab, not the app.
+# Page modules are imported on first render, after the header and sidebar.
+@st.fragment
+def _dashboard_tab():
+    from pages.dashboard import render_dashboard
+
+    render_dashboard()
+
+
+@st.fragment
+def _analysis_tab():
+    from pages.analysis import render_analysis_page
+
+    render_analysis_page()
+
+
+@st.fragment
+def _portfolio_tab():
+    from pages.portfolio import render_portfolio_page
+
+    render_portfolio_page()
+
+
+@st.fragment
+def _monitoring_tab():
+    from pages.monitoring import render_monitoring_page
+
+    render_monitoring_page()
 
 
 def main():
     """Main application entry point."""
+    # Streamlit drops elements a rerun does not emit, so the (cached,
+    # minified) stylesheet is sent on every run
+    st.markdown(_css_blob(), unsafe_allow_html=True)
+
     # Initialize session state
     initialize_session_state()
 
+    # Render sidebar first so Start/Stop take effect before the header
+    # status strip reads trading_active; no extra st.rerun() needed
+    render_sidebar()
+
     # Render header
     render_header()
 
-    # Render sidebar
-    render_sidebar()
-
     # Main content area with tabs
     tab1, tab2, tab3, tab4 = st.tabs(
         ["📊 Dashboard", "🔍 Analysis", "💼 Portfolio", "📈 Monitoring"]
     )
 
     with tab1:
-        render_dashboard()
+        _dashboard_tab()
 
     with tab2:
-        render_analysis_page()
+        _analysis_tab()
 
     with tab3:
-        render_portfolio_page()
+        _portfolio_tab()
 
     with tab4:
-        render_monitoring_page()
+        _monitoring_tab()
 
     # Footer
     st.markdown("---")
@@ -707,39 +624,6 @@ def main():
         unsafe_allow_html=True,
     )
 
-    # Auto-refresh logic - reload state from state manager
-    if st.session_state.settings.get("auto_refresh", False):
-        import time
-
-        time.sleep(st.session_state.settings.get("refresh_interval", 5))
-
-        # Reload state from state manager
-        if STATE_MANAGER is not None:
-            try:
-                current_state = STATE_MANAGER.load_state()
-                st.session_state.trading_active = current_state.get(
-                    "trading_active", False
-                )
-                st.session_state.cycle_count = current_state.get("cycle_count", 0)
-                st.session_state.total_decisions = current_state.get(
-                    "total_decisions", 0
-                )
-                st.session_state.total_trades = current_state.get("total_trades", 0)
-                st.session_state.successful_trades = current_state.get(
-                    "successful_trades", 0
-                )
-                st.session_state.portfolio = current_state.get("portfolio", {})
-                st.session_state.system_health = current_state.get("system_health", {})
-                st.session_state.recent_decisions = current_state.get(
-                    "recent_decisions", []
-                )
-                st.session_state.analytics = current_state.get("analytics", {})
-                st.session_state.last_update = datetime.now()
-            except Exception as e:
-                st.error(f"Error refreshing state: {e}")
-
-        st.rerun()
-
 
 if __name__ == "__main__":
     main()
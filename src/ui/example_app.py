@@ -1,12 +1,11 @@
 # Streamlit UI for StockAI Trading System
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import asyncio
-import json
-import time
+from pathlib import Path
 from typing import Dict, List, Any
 import sys
 import os
@@ -16,8 +15,6 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from config.settings import get_settings
 from src.utils.logger import setup_logger
-from core.decision_engine import DecisionEngine
-from src.agents.execution_agent import ExecutionAgent
 
 # Configure page
 st.set_page_config(
@@ -27,35 +24,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .success-card {
-        border-left-color: #28a745;
-    }
-    .warning-card {
-        border-left-color: #ffc107;
-    }
-    .danger-card {
-        border-left-color: #dc3545;
-    }
-    .sidebar .sidebar-content {
-        background-color: #f8f9fa;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS lives in assets/example_app.css. Streamlit drops elements a rerun
+# does not emit, so the (cached) stylesheet is still sent on every run
+CSS_PATH = Path(__file__).parent / "assets" / "example_app.css"
+
+@st.cache_resource
+def _css_blob() -> str:
+    return "<style>" + CSS_PATH.read_text() + "</style>"
+
+st.markdown(_css_blob(), unsafe_allow_html=True)
 
 # Initialize session state
 if 'initialized' not in st.session_state:
@@ -64,15 +41,168 @@ if 'initialized' not in st.session_state:
     st.session_state.execution_agent = None
     st.session_state.portfolio = {
         "cash": 100000.0,
-        "positions": {},
+        # One row per symbol, one column per field, so totals are column sums
+        "positions": pd.DataFrame(
+            {
+                "shares": pd.Series(dtype="float64"),
+                "cost_basis": pd.Series(dtype="float64"),
+                "market_value": pd.Series(dtype="float64")
+            },
+            index=pd.Index([], name="symbol")
+        ),
         "cost_basis": {}
     }
     st.session_state.trading_active = False
     st.session_state.last_update = None
 
+# Tickers offered in the sidebar stock picker
+_STOCK_UNIVERSE = ("AAPL", "TSLA", "GOOGL", "MSFT", "AMZN", "NVDA", "META", "NFLX")
+
 # Initialize logger
 logger = setup_logger("stockai.ui")
 
+# Heavy services are built once per server process and shared by every session;
+# their modules are only imported on first use
+@st.cache_resource(show_spinner="Initializing StockAI services...")
+def get_decision_engine():
+    from core.decision_engine import DecisionEngine
+    return DecisionEngine()
+
+@st.cache_resource(show_spinner="Initializing StockAI services...")
+def get_execution_agent():
+    from src.agents.execution_agent import ExecutionAgent
+    return ExecutionAgent()
+
+# Daily bars for a window ending on end_date (YYYY-MM-DD). Pickled to disk so
+# restarts and other sessions skip the API call; end_date is part of the key, so
+# entries roll over daily (persisted caches ignore ttl), max_entries bounds disk use
+@st.cache_data(persist="disk", max_entries=500, show_spinner=False)
+def load_price_history(symbol: str, window: int, end_date: str) -> pd.DataFrame:
+    from src.tools.api import get_price_data
+    start_date = (datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=window)).strftime('%Y-%m-%d')
+    return get_price_data(symbol, start_date, end_date)
+
+# Seconds between system log refreshes when auto-refresh is on
+LOG_REFRESH_INTERVAL = 5
+
+# Most points a line chart is given; longer series are downsampled first
+MAX_CHART_POINTS = 3000
+
+def _downsample(x, y, max_points=MAX_CHART_POINTS):
+    """Thin (x, y) to about max_points, keeping each bucket's min and max so spikes survive."""
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    
+    size = -(-n // (max_points // 2))
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    
+    base = np.arange(buckets) * size
+    idx = np.union1d(base + np.nanargmin(padded, axis=1), base + np.nanargmax(padded, axis=1))
+    return x[idx], y[idx]
+
+# Sample data builders; reruns reuse the cached frames instead of rebuilding them
+@st.cache_data(ttl="1h", show_spinner=False)
+def _perf_series(days: int):
+    """Daily portfolio values over the last `days` days as (dates, values) arrays, ready to plot."""
+    now = datetime.now()
+    dates = pd.date_range(start=now - timedelta(days=days), end=now, freq='D')
+    performance = [100000 + i * 100 + (i % 7) * 50 for i in range(len(dates))]
+    return _downsample(dates.to_numpy(), np.asarray(performance, dtype=np.float64))
+
+# Figures are cached whole, so a rerun skips building the trace and layout dicts
+@st.cache_data(show_spinner=False)
+def _build_portfolio_fig(allocation: tuple) -> go.Figure:
+    """Allocation pie chart from (label, value) pairs."""
+    labels, values = zip(*allocation)
+    fig = go.Figure(data=[go.Pie(
+        labels=list(labels),
+        values=list(values),
+        hole=0.3
+    )])
+    
+    fig.update_layout(
+        title="Portfolio Allocation",
+        showlegend=True,
+        height=400
+    )
+    return fig
+
+@st.cache_data(ttl="1h", show_spinner=False)
+def _build_performance_fig(days: int) -> go.Figure:
+    """Portfolio value line chart over the last `days` days."""
+    dates, performance = _perf_series(days)
+    
+    # WebGL trace for long histories; plain lists, since typed arrays render slower
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=np.datetime_as_string(dates, unit='D').tolist(),
+        y=performance.tolist(),
+        mode='lines',
+        name='Portfolio Value',
+        line=dict(color='#1f77b4', width=2)
+    ))
+    
+    fig.update_layout(
+        title=f"Portfolio Performance ({days} Days)",
+        xaxis_title="Date",
+        yaxis_title="Portfolio Value ($)",
+        height=400
+    )
+    return fig
+
+# Cell styles for the Signal column
+BUY_STYLE = "background-color: #d4edda; color: #155724"
+SELL_STYLE = "background-color: #f8d7da; color: #721c24"
+HOLD_STYLE = "background-color: #fff3cd; color: #856404"
+
+def _signal_styles(signals: pd.Series) -> np.ndarray:
+    values = signals.to_numpy()
+    return np.select([values == "BUY", values == "SELL"], [BUY_STYLE, SELL_STYLE], default=HOLD_STYLE)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _recent_decisions_df(now: datetime) -> pd.DataFrame:
+    """Sample decisions as of `now`; pass it rounded to the minute so reruns hit the cache."""
+    decisions_data = {
+        "Timestamp": [now - timedelta(minutes=m) for m in (5, 10, 15, 20, 25)],
+        "Symbol": ["AAPL", "TSLA", "GOOGL", "MSFT", "AMZN"],
+        "Signal": ["BUY", "SELL", "HOLD", "BUY", "HOLD"],
+        "Confidence": [85, 72, 45, 91, 38],
+        "Quantity": [50, 25, 0, 30, 0],
+        "Price": [150.25, 245.80, 2800.50, 320.15, 3100.75]
+    }
+    return pd.DataFrame(decisions_data)
+
+# Static sample positions, built once at import; display only, never mutated
+_POSITIONS_DF = pd.DataFrame({
+    "Symbol": ["AAPL", "TSLA", "GOOGL"],
+    "Shares": [50, 25, 15],
+    "Avg Price": [145.50, 240.00, 2750.00],
+    "Current Price": [150.25, 245.80, 2800.50],
+    "Market Value": [7512.50, 6145.00, 42007.50],
+    "Unrealized P&L": [237.50, 145.00, 757.50],
+    "P&L %": [3.26, 2.42, 1.80]
+})
+
+@st.cache_data(ttl=LOG_REFRESH_INTERVAL, show_spinner=False)
+def _logs_df() -> pd.DataFrame:
+    now = datetime.now()
+    logs_data = {
+        "Timestamp": [now - timedelta(minutes=m) for m in (1, 2, 3, 4, 5)],
+        "Level": ["INFO", "INFO", "WARNING", "INFO", "ERROR"],
+        "Message": [
+            "Trade executed: BUY 50 AAPL",
+            "Analysis completed for TSLA",
+            "Low confidence signal for GOOGL",
+            "Portfolio updated successfully",
+            "API connection timeout"
+        ]
+    }
+    return pd.DataFrame(logs_data)
+
 class StockAIUI:
     """Main UI class for StockAI Trading System."""
     
@@ -81,18 +211,10 @@ class StockAIUI:
         self.initialize_services()
     
     def initialize_services(self):
-        """Initialize trading services."""
+        """Initialize trading services (shared by all sessions)."""
         try:
-            if not st.session_state.initialized:
-                with st.spinner("Initializing StockAI services..."):
-                    # Initialize decision engine
-                    st.session_state.decision_engine = DecisionEngine()
-                    
-                    # Initialize execution agent
-                    st.session_state.execution_agent = ExecutionAgent()
-                    
-                    st.session_state.initialized = True
-                    st.success("✅ Services initialized successfully!")
+            st.session_state.decision_engine = get_decision_engine()
+            st.session_state.execution_agent = get_execution_agent()
         except Exception as e:
             st.error(f"❌ Failed to initialize services: {e}")
             logger.error(f"Service initialization failed: {e}")
@@ -132,7 +254,7 @@ class StockAIUI:
         # Stock list
         stock_list = st.sidebar.multiselect(
             "📊 Select Stocks",
-            options=["AAPL", "TSLA", "GOOGL", "MSFT", "AMZN", "NVDA", "META", "NFLX"],
+            options=_STOCK_UNIVERSE,
             default=["AAPL", "TSLA", "GOOGL"]
         )
         
@@ -157,17 +279,8 @@ class StockAIUI:
         st.sidebar.divider()
         
         # System Status
-        st.sidebar.subheader("📊 System Status")
-        
-        # Portfolio value
-        total_value = st.session_state.portfolio["cash"]
-        for symbol, position in st.session_state.portfolio["positions"].items():
-            # This would be calculated with current prices
-            total_value += position.get("market_value", 0)
-        
-        st.sidebar.metric("💰 Portfolio Value", f"${total_value:,.2f}")
-        st.sidebar.metric("💵 Available Cash", f"${st.session_state.portfolio['cash']:,.2f}")
-        st.sidebar.metric("📈 Active Positions", len(st.session_state.portfolio["positions"]))
+        with st.sidebar:
+            self.render_system_status()
         
         return {
             "stock_list": stock_list,
@@ -175,8 +288,22 @@ class StockAIUI:
             "base_quantity": base_quantity
         }
     
+    @st.fragment
+    def render_system_status(self):
+        """Render the sidebar portfolio metrics; only reads st.session_state.portfolio."""
+        st.subheader("📊 System Status")
+        
+        # Portfolio value; market_value would be calculated with current prices
+        positions = st.session_state.portfolio["positions"]
+        total_value = st.session_state.portfolio["cash"] + positions["market_value"].sum()
+        
+        st.metric("💰 Portfolio Value", f"${total_value:,.2f}")
+        st.metric("💵 Available Cash", f"${st.session_state.portfolio['cash']:,.2f}")
+        st.metric("📈 Active Positions", len(positions))
+    
+    @st.fragment
     def render_dashboard(self):
-        """Render the main dashboard."""
+        """Render the main dashboard; its widgets rerun only this fragment."""
         st.subheader("📊 Trading Dashboard")
         
         # Key metrics
@@ -229,86 +356,26 @@ class StockAIUI:
         st.subheader("📊 Portfolio Composition")
         
         # Sample data - in real implementation, this would come from the portfolio
-        portfolio_data = {
-            "AAPL": {"shares": 50, "value": 7500, "percentage": 35},
-            "TSLA": {"shares": 25, "value": 5000, "percentage": 23},
-            "GOOGL": {"shares": 15, "value": 4000, "percentage": 19},
-            "Cash": {"shares": 0, "value": 5000, "percentage": 23}
-        }
+        allocation = (("AAPL", 7500), ("TSLA", 5000), ("GOOGL", 4000), ("Cash", 5000))
         
-        # Create pie chart
-        fig = go.Figure(data=[go.Pie(
-            labels=list(portfolio_data.keys()),
-            values=[data["value"] for data in portfolio_data.values()],
-            hole=0.3
-        )])
-        
-        fig.update_layout(
-            title="Portfolio Allocation",
-            showlegend=True,
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_portfolio_fig(allocation), use_container_width=True)
     
     def render_performance_chart(self):
         """Render performance chart."""
         st.subheader("📈 Performance Over Time")
         
         # Sample data - in real implementation, this would come from historical data
-        dates = pd.date_range(start=datetime.now() - timedelta(days=30), end=datetime.now(), freq='D')
-        performance = [100000 + i * 100 + (i % 7) * 50 for i in range(len(dates))]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=performance,
-            mode='lines',
-            name='Portfolio Value',
-            line=dict(color='#1f77b4', width=2)
-        ))
-        
-        fig.update_layout(
-            title="Portfolio Performance (30 Days)",
-            xaxis_title="Date",
-            yaxis_title="Portfolio Value ($)",
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_performance_fig(30), use_container_width=True)
     
     def render_recent_decisions(self):
         """Render recent trading decisions."""
         st.subheader("🔄 Recent Trading Decisions")
         
         # Sample data - in real implementation, this would come from the decision engine
-        decisions_data = {
-            "Timestamp": [
-                datetime.now() - timedelta(minutes=5),
-                datetime.now() - timedelta(minutes=10),
-                datetime.now() - timedelta(minutes=15),
-                datetime.now() - timedelta(minutes=20),
-                datetime.now() - timedelta(minutes=25)
-            ],
-            "Symbol": ["AAPL", "TSLA", "GOOGL", "MSFT", "AMZN"],
-            "Signal": ["BUY", "SELL", "HOLD", "BUY", "HOLD"],
-            "Confidence": [85, 72, 45, 91, 38],
-            "Quantity": [50, 25, 0, 30, 0],
-            "Price": [150.25, 245.80, 2800.50, 320.15, 3100.75]
-        }
-        
-        df = pd.DataFrame(decisions_data)
-        
-        # Color code the signals
-        def color_signal(val):
-            if val == "BUY":
-                return "background-color: #d4edda; color: #155724"
-            elif val == "SELL":
-                return "background-color: #f8d7da; color: #721c24"
-            else:
-                return "background-color: #fff3cd; color: #856404"
+        df = _recent_decisions_df(datetime.now().replace(second=0, microsecond=0))
         
-        styled_df = df.style.applymap(color_signal, subset=['Signal'])
+        # Color code the signals, one vectorized call for the whole column
+        styled_df = df.style.apply(_signal_styles, subset=['Signal'])
         st.dataframe(styled_df, use_container_width=True)
     
     def render_analysis_page(self):
@@ -322,9 +389,27 @@ class StockAIUI:
         )
         
         if st.button("🔍 Run Analysis"):
+            # Engine built (or failed and reported) by initialize_services
+            decision_engine = st.session_state.decision_engine
+            if decision_engine is None:
+                st.error("❌ Decision engine unavailable; analysis cannot run")
+                return
+            
             with st.spinner(f"Analyzing {selected_stock}..."):
-                # Simulate analysis
-                time.sleep(2)
+                # All agents run concurrently; the wait is the slowest agent, not the sum
+                end_date = datetime.now()
+                start_date = end_date - timedelta(days=90)
+                try:
+                    analysis_results = asyncio.run(decision_engine.analyze_agents(
+                        selected_stock,
+                        start_date.strftime('%Y-%m-%d'),
+                        end_date.strftime('%Y-%m-%d'),
+                        st.session_state.portfolio
+                    ))
+                except Exception as e:
+                    st.error(f"❌ Analysis failed for {selected_stock}: {e}")
+                    logger.error(f"Analysis failed for {selected_stock}: {e}")
+                    return
                 
                 # Display analysis results
                 col1, col2 = st.columns(2)
@@ -332,17 +417,9 @@ class StockAIUI:
                 with col1:
                     st.subheader("📊 Agent Analysis")
                     
-                    analysis_results = {
-                        "Fundamentals": {"signal": "bullish", "confidence": 80},
-                        "Technicals": {"signal": "neutral", "confidence": 65},
-                        "Valuation": {"signal": "bullish", "confidence": 75},
-                        "Sentiment": {"signal": "bearish", "confidence": 60},
-                        "Risk": {"signal": "neutral", "confidence": 70}
-                    }
-                    
                     for agent, result in analysis_results.items():
                         signal_color = "🟢" if result["signal"] == "bullish" else "🔴" if result["signal"] == "bearish" else "🟡"
-                        st.write(f"{signal_color} **{agent}**: {result['signal'].title()} ({result['confidence']}%)")
+                        st.write(f"{signal_color} **{agent.title()}**: {result['signal'].title()} ({result['confidence']}%)")
                 
                 with col2:
                     st.subheader("🤖 RL Ensemble")
@@ -362,6 +439,14 @@ class StockAIUI:
                     st.divider()
                     st.subheader("🎯 Final Decision")
                     st.success("**BUY** - Confidence: 78% - Quantity: 45 shares")
+                
+                # Price history behind the analysis
+                st.subheader(f"📈 {selected_stock} Price History")
+                try:
+                    history = load_price_history(selected_stock, 90, end_date.strftime('%Y-%m-%d'))
+                    st.line_chart(history["close"])
+                except Exception as e:
+                    st.info(f"Price history unavailable: {e}")
     
     def render_portfolio_page(self):
         """Render the portfolio management page."""
@@ -384,18 +469,7 @@ class StockAIUI:
         # Positions table
         st.subheader("📊 Current Positions")
         
-        positions_data = {
-            "Symbol": ["AAPL", "TSLA", "GOOGL"],
-            "Shares": [50, 25, 15],
-            "Avg Price": [145.50, 240.00, 2750.00],
-            "Current Price": [150.25, 245.80, 2800.50],
-            "Market Value": [7512.50, 6145.00, 42007.50],
-            "Unrealized P&L": [237.50, 145.00, 757.50],
-            "P&L %": [3.26, 2.42, 1.80]
-        }
-        
-        df = pd.DataFrame(positions_data)
-        st.dataframe(df, use_container_width=True)
+        st.dataframe(_POSITIONS_DF, use_container_width=True)
         
         # Trade execution
         st.subheader("💼 Execute Trade")
@@ -438,31 +512,16 @@ class StockAIUI:
         # Logs viewer
         st.subheader("📝 System Logs")
         
+        # Auto-refresh reruns only the logs fragment on a timer
+        auto_refresh = st.checkbox("🔄 Auto-refresh logs")
+        run_every = LOG_REFRESH_INTERVAL if auto_refresh else None
+        st.fragment(run_every=run_every)(self.render_logs)()
+    
+    def render_logs(self):
+        """Render the system logs table."""
         # Sample logs
-        logs_data = {
-            "Timestamp": [
-                datetime.now() - timedelta(minutes=1),
-                datetime.now() - timedelta(minutes=2),
-                datetime.now() - timedelta(minutes=3),
-                datetime.now() - timedelta(minutes=4),
-                datetime.now() - timedelta(minutes=5)
-            ],
-            "Level": ["INFO", "INFO", "WARNING", "INFO", "ERROR"],
-            "Message": [
-                "Trade executed: BUY 50 AAPL",
-                "Analysis completed for TSLA",
-                "Low confidence signal for GOOGL",
-                "Portfolio updated successfully",
-                "API connection timeout"
-            ]
-        }
-        
-        df = pd.DataFrame(logs_data)
+        df = _logs_df()
         st.dataframe(df, use_container_width=True)
-        
-        # Auto-refresh
-        if st.checkbox("🔄 Auto-refresh logs"):
-            st.rerun()
 
 def main():
     """Main Streamlit application."""
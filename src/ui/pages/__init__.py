@@ -1,16 +1,25 @@
 # Pages package for StockAI UI
 """
 Individual page components for the Streamlit UI.
+
+Page modules are imported on first attribute access (PEP 562), so importing
+one page does not pull in the others.
 """
 
-from .dashboard import render_dashboard
-from .analysis import render_analysis_page
-from .portfolio import render_portfolio_page
-from .monitoring import render_monitoring_page
+import importlib
+
+_PAGE_MODULES = {
+    'render_dashboard': '.dashboard',
+    'render_analysis_page': '.analysis',
+    'render_portfolio_page': '.portfolio',
+    'render_monitoring_page': '.monitoring'
+}
+
+__all__ = list(_PAGE_MODULES)
+
 
-__all__ = [
-    'render_dashboard',
-    'render_analysis_page', 
-    'render_portfolio_page',
-    'render_monitoring_page'
-]
+def __getattr__(name):
+    if name in _PAGE_MODULES:
+        module = importlib.import_module(_PAGE_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
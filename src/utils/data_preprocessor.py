@@ -32,6 +32,51 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Optional numba kernel for the rolling mean absolute deviation (CCI). The
+# explicit signature compiles it at import and cache=True stores the machine
+# code in __pycache__, so later processes load it without JIT latency.
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _mean_abs_deviation(window: np.ndarray) -> float:
+    """Mean absolute deviation of one rolling window."""
+    return np.abs(window - window.mean()).mean()
+
+
+if NUMBA_AVAILABLE:
+
+    @njit("f8[:, :](f8[:, :], i8)", cache=True, nogil=True)
+    def _mad_kernel(values, window):
+        rows, cols = values.shape
+        out = np.full((rows, cols), np.nan)
+        for j in range(cols):
+            for i in range(window - 1, rows):
+                chunk = values[i - window + 1 : i + 1, j]
+                out[i, j] = np.abs(chunk - chunk.mean()).mean()
+        return out
+
+else:
+    _mad_kernel = None
+
+
+def _rolling_mean_abs_deviation(data, window: int):
+    """Rolling mean absolute deviation of a Series or DataFrame, per column."""
+    if _mad_kernel is None:
+        return data.rolling(window=window).apply(_mean_abs_deviation, raw=True)
+
+    values = np.ascontiguousarray(
+        data.to_numpy(dtype=np.float64).reshape(len(data), -1)
+    )
+    result = _mad_kernel(values, window)
+    if isinstance(data, pd.Series):
+        return pd.Series(result[:, 0], index=data.index, name=data.name)
+    return pd.DataFrame(result, index=data.index, columns=data.columns)
+
 
 class StockDataPreprocessor:
     """
@@ -253,9 +298,7 @@ class StockDataPreprocessor:
         # CCI (approximation)
         typical_price = (df["high"] + df["low"] + df["close"]) / 3
         sma_tp = typical_price.rolling(window=30).mean()
-        mean_dev = typical_price.rolling(window=30).apply(
-            lambda x: np.abs(x - x.mean()).mean()
-        )
+        mean_dev = _rolling_mean_abs_deviation(typical_price, 30)
         df["cci_30"] = (typical_price - sma_tp) / (0.015 * mean_dev)
 
         # DX (simple approximation using price momentum)
@@ -357,6 +400,98 @@ def preprocess_for_rl(stock_data: pd.DataFrame) -> Optional[np.ndarray]:
         return None
 
 
+def preprocess_batch_for_rl(
+    stock_data: Dict[str, pd.DataFrame],
+) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Latest RL observation for many tickers at once.
+
+    With the manual indicator fallback, tickers that share one DatetimeIndex
+    are computed together on a (date x ticker) panel. TA-Lib/pandas_ta users
+    and any ticker that cannot be batched go through preprocess_for_rl, so
+    features always match the single-ticker path.
+
+    Args:
+        stock_data: Dictionary of ticker -> raw OHLCV DataFrame
+
+    Returns:
+        Dictionary of ticker -> observation (None if preprocessing failed)
+    """
+    observations = {}
+
+    if not (TALIB_AVAILABLE or PANDAS_TA_AVAILABLE):
+        preprocessor = StockDataPreprocessor()
+        panel_frames = {}
+        reference = None
+        for ticker, df in stock_data.items():
+            try:
+                df = preprocessor._standardize_columns(df)
+            except ValueError:
+                continue
+            if reference is None and isinstance(df.index, pd.DatetimeIndex):
+                reference = df.index
+            if reference is not None and df.index.equals(reference):
+                panel_frames[ticker] = df
+
+        if len(panel_frames) > 1:
+            try:
+                observations.update(_panel_observations(panel_frames))
+            except Exception as e:
+                logger.error(f"Batch preprocessing failed: {e}")
+
+    for ticker, df in stock_data.items():
+        if ticker not in observations:
+            observations[ticker] = preprocess_for_rl(df)
+
+    return observations
+
+
+def _panel_observations(frames: Dict[str, pd.DataFrame]) -> Dict[str, np.ndarray]:
+    """Manual-fallback features for tickers sharing one DatetimeIndex."""
+    tickers = list(frames)
+    panel = pd.concat(frames, axis=1)
+    close = panel.xs("close", axis=1, level=1)
+    high = panel.xs("high", axis=1, level=1)
+    low = panel.xs("low", axis=1, level=1)
+
+    # Same formulas as _calculate_indicators_manual, one column per ticker
+    bb_middle = close.rolling(window=20).mean()
+    bb_std = close.rolling(window=20).std()
+    typical_price = (high + low + close) / 3
+    mean_dev = _rolling_mean_abs_deviation(typical_price, 30)
+    features = {
+        "close": close,
+        "high": high,
+        "low": low,
+        "open": panel.xs("open", axis=1, level=1),
+        "volume": panel.xs("volume", axis=1, level=1),
+        "macd": close.ewm(span=12, adjust=False).mean()
+        - close.ewm(span=26, adjust=False).mean(),
+        "boll_ub": bb_middle + (bb_std * 2),
+        "boll_lb": bb_middle - (bb_std * 2),
+        "rsi_30": StockDataPreprocessor._calculate_rsi(close, period=30),
+        "cci_30": (typical_price - typical_price.rolling(window=30).mean())
+        / (0.015 * mean_dev),
+        "dx_30": close.pct_change(30).abs() * 100,
+        "close_30_sma": close.rolling(window=30).mean(),
+        "close_60_sma": close.rolling(window=60).mean(),
+    }
+
+    # Forward fill then zero-fill leaves each column's last valid value,
+    # matching _handle_missing_values on the final row
+    day = float(close.index[-1].dayofweek)
+    columns = [
+        np.full(len(tickers), day)
+        if name == "day"
+        else features[name].ffill().iloc[-1][tickers].to_numpy(dtype=np.float64)
+        for name in StockDataPreprocessor.REQUIRED_COLUMNS
+    ]
+    matrix = np.nan_to_num(
+        np.column_stack(columns).astype(np.float32), nan=0.0, posinf=0.0, neginf=0.0
+    )
+    return dict(zip(tickers, matrix))
+
+
 # Legacy function names for backwards compatibility
 def get_processed_features_for_rl(stock_data: pd.DataFrame) -> Optional[np.ndarray]:
     """Legacy function name - use preprocess_for_rl instead."""
@@ -0,0 +1,45 @@
+# Unit tests for batched RL preprocessing
+import numpy as np
+import pandas as pd
+
+from src.utils import data_preprocessor
+from src.utils.data_preprocessor import (
+    _panel_observations,
+    preprocess_batch_for_rl,
+    preprocess_for_rl,
+)
+
+
+def make_bars(index, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, len(index)).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, len(index)),
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(1_000, 10_000, len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+class TestPreprocessBatchForRl:
+    """Test cases for preprocess_batch_for_rl."""
+
+    def test_panel_matches_single_ticker_path(self, monkeypatch):
+        """Test that panel observations equal preprocess_for_rl per ticker."""
+        # The panel path is only taken with the manual indicator fallback
+        monkeypatch.setattr(data_preprocessor, "TALIB_AVAILABLE", False)
+        monkeypatch.setattr(data_preprocessor, "PANDAS_TA_AVAILABLE", False, raising=False)
+
+        index = pd.bdate_range("2024-01-01", periods=90)
+        frames = {"AAPL": make_bars(index, 1), "MSFT": make_bars(index, 2)}
+
+        panel = _panel_observations(frames)
+        batch = preprocess_batch_for_rl(frames)
+        for ticker, df in frames.items():
+            expected = preprocess_for_rl(df)
+            np.testing.assert_allclose(panel[ticker], expected, rtol=1e-5)
+            np.testing.assert_allclose(batch[ticker], expected, rtol=1e-5)
@@ -0,0 +1,66 @@
+# Unit tests for the decision ring buffer
+import pytest
+from src.data.decision_log import DecisionLog
+
+
+class TestDecisionLog:
+    """Test cases for DecisionLog."""
+    
+    def test_summary_counts_recent_decisions(self, tmp_path):
+        """Test signal distribution and confidence over the last n records."""
+        log = DecisionLog(str(tmp_path / "decisions.bin"), capacity=16)
+        log.record("AAPL", "BUY", 80)
+        log.record("TSLA", "SELL", 60)
+        log.record("GOOGL", "HOLD", 50)
+        log.record("MSFT", "BUY", 70)
+        
+        summary = log.summary(3)
+        assert summary["recent_decisions"] == 3
+        assert summary["signal_distribution"] == {"BUY": 1, "SELL": 1, "HOLD": 1}
+        assert summary["average_confidence"] == pytest.approx(60.0)
+    
+    def test_ring_buffer_wraps(self, tmp_path):
+        """Test that the oldest records are overwritten once full."""
+        log = DecisionLog(str(tmp_path / "decisions.bin"), capacity=4)
+        for _ in range(3):
+            log.record("AAPL", "SELL", 10)
+        for _ in range(4):
+            log.record("AAPL", "BUY", 90)
+        
+        assert len(log) == 4
+        assert log.summary(10)["signal_distribution"] == {"BUY": 4, "SELL": 0, "HOLD": 0}
+    
+    def test_reopen_recovers_position(self, tmp_path):
+        """Test that records survive reopening the same file."""
+        path = str(tmp_path / "decisions.bin")
+        log = DecisionLog(path, capacity=8)
+        log.record("AAPL", "BUY", 75)
+        log.record("TSLA", "HOLD", 50)
+        log.flush()
+        
+        reopened = DecisionLog(path, capacity=8)
+        assert len(reopened) == 2
+        reopened.record("MSFT", "SELL", 40)
+        assert reopened.summary(10)["signal_distribution"] == {"BUY": 1, "SELL": 1, "HOLD": 1}
+    
+    def test_file_created_on_first_record(self, tmp_path):
+        """Test that opening a log does not create its file until a decision is recorded."""
+        path = tmp_path / "data" / "decisions.bin"
+        log = DecisionLog(str(path), capacity=8)
+        assert not path.exists()
+        assert log.summary(10)["recent_decisions"] == 0
+        
+        log.record("AAPL", "BUY", 75)
+        assert path.exists()
+        assert len(log) == 1
+    
+    def test_reopen_keeps_existing_capacity(self, tmp_path):
+        """Test that a different capacity setting does not truncate an existing log."""
+        path = str(tmp_path / "decisions.bin")
+        log = DecisionLog(path, capacity=8)
+        log.record("AAPL", "BUY", 75)
+        log.flush()
+        
+        reopened = DecisionLog(path, capacity=16)
+        assert reopened.capacity == 8
+        assert len(reopened) == 1
@@ -0,0 +1,62 @@
+# Unit tests for the on-disk bar cache
+import json
+import os
+
+import pandas as pd
+
+from src.data.file_cache import FileCache
+
+
+def make_bars(start, periods):
+    index = pd.date_range(start, periods=periods, freq="D", tz="UTC")
+    return pd.DataFrame({"Close": range(periods)}, index=index, dtype=float)
+
+
+class TestFileCache:
+    """Test cases for FileCache."""
+
+    def test_get_slices_a_covered_window(self, tmp_path):
+        """Test that a narrower window is served from a wider closed entry."""
+        cache = FileCache(str(tmp_path))
+        cache.set("AAPL", "2024-01-01", "2024-01-10", make_bars("2024-01-01", 10))
+
+        cached = cache.get("AAPL", "2024-01-03", "2024-01-05")
+        assert cached is not None
+        assert cached["Close"].tolist() == [2.0, 3.0, 4.0]
+
+    def test_get_misses_outside_the_stored_window(self, tmp_path):
+        """Test that a window the entry does not fully cover is a miss."""
+        cache = FileCache(str(tmp_path))
+        cache.set("AAPL", "2024-01-01", "2024-01-10", make_bars("2024-01-01", 10))
+
+        assert cache.get("AAPL", "2024-01-05", "2024-01-11") is None
+        assert cache.get("MSFT", "2024-01-01", "2024-01-10") is None
+
+    def test_prune_removes_only_its_own_stale_files(self, tmp_path):
+        """Test that pruning deletes expired entries and leftovers but keeps foreign files."""
+        cache = FileCache(str(tmp_path))
+        cache.set("AAPL", "2024-01-01", "2024-01-10", make_bars("2024-01-01", 10))
+        cache.set("MSFT", "2024-01-01", "2024-01-10", make_bars("2024-01-01", 10))
+
+        with open(tmp_path / "MSFT.json") as f:
+            meta = json.load(f)
+        meta["fetched_at"] -= meta["ttl"]
+        with open(tmp_path / "MSFT.json", "w") as f:
+            json.dump(meta, f)
+        (tmp_path / "TSLA.parquet.tmp").write_bytes(b"")
+        (tmp_path / "notes.txt").write_text("keep me")
+        os.makedirs(tmp_path / "other")
+        (tmp_path / "other" / "GOOGL.parquet").write_bytes(b"")
+
+        assert cache.prune() == 3
+        assert sorted(os.listdir(tmp_path)) == ["AAPL.json", "AAPL.parquet", "notes.txt", "other"]
+        assert os.listdir(tmp_path / "other") == ["GOOGL.parquet"]
+        assert cache.get("AAPL", "2024-01-01", "2024-01-10") is not None
+
+    def test_default_root_is_not_the_working_directory(self, tmp_path, monkeypatch):
+        """Test that the default cache root does not depend on the current directory."""
+        monkeypatch.chdir(tmp_path)
+        root = FileCache().root
+
+        assert os.path.isabs(root)
+        assert not root.startswith(str(tmp_path))
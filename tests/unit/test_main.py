@@ -0,0 +1,52 @@
+# Unit tests for the application's trading cycle
+import asyncio
+import threading
+
+import src.main
+from src.main import StockAIApplication
+
+
+class FakeSettings:
+    """Settings stub for two stocks analyzed at most two at a time."""
+
+    stock_list = ["AAPL", "MSFT"]
+    initial_cash = 100000.0
+    max_concurrent_analyses = 2
+    confidence_threshold = 60.0
+    api_key = "key"
+    api_secret = "secret"
+
+
+class BarrierEngine:
+    """Decision engine whose analyses only finish once two are running at once."""
+
+    def __init__(self):
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.stock_data = {}
+
+    def run_comprehensive_analysis(self, stock, stock_data, start_date, end_date, portfolio):
+        self.stock_data[stock] = stock_data
+        self.barrier.wait()
+        return {
+            "final_decision": {"signal": "HOLD", "confidence": 50, "quantity": 0}
+        }
+
+
+class TestRunTradingCycle:
+    """Test cases for StockAIApplication.run_trading_cycle."""
+
+    def test_analyses_overlap(self, monkeypatch):
+        """Test that a cycle's stocks are analyzed concurrently with their price data."""
+        monkeypatch.setattr(src.main, "get_settings", FakeSettings)
+        monkeypatch.setattr(src.main, "validate_stock_list", lambda stocks: True)
+        monkeypatch.setattr(
+            src.main, "get_price_data", lambda stock, start, end: f"{stock} bars"
+        )
+        app = StockAIApplication()
+        app.decision_engine = BarrierEngine()
+
+        asyncio.run(app.run_trading_cycle())
+
+        # A sequential cycle would break the barrier and record no decisions
+        assert not app.decision_engine.barrier.broken
+        assert app.decision_engine.stock_data == {"AAPL": "AAPL bars", "MSFT": "MSFT bars"}
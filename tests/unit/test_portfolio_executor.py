@@ -0,0 +1,176 @@
+# Unit tests for batch execution in the portfolio executor
+import time
+from types import SimpleNamespace
+
+from src.trading import portfolio_executor
+from src.trading.portfolio_executor import PortfolioExecutor, TradingDecision
+
+
+class FakeTrader:
+    """Trader stub with a fixed account, no positions and fixed prices."""
+
+    def __init__(self, buying_power, prices):
+        self.account = {
+            "portfolio_value": buying_power,
+            "buying_power": buying_power,
+            "cash": buying_power,
+        }
+        self.prices = prices
+        self.submitted = []
+
+    def get_account(self, force_refresh=False):
+        return self.account
+
+    def get_all_positions(self, force_refresh=False):
+        return []
+
+    def get_latest_prices(self, symbols):
+        return {symbol: self.prices[symbol] for symbol in symbols}
+
+    def get_latest_price(self, symbol):
+        return self.prices[symbol]
+
+    def can_trade(self, symbol, qty, side, current_price=None):
+        # Same check as AlpacaTrader.can_trade against the unchanged account
+        if side == "buy" and current_price * qty > self.account["buying_power"]:
+            return False, "Insufficient buying power"
+        return True, "OK"
+
+    def submit_orders(self, orders):
+        self.submitted.extend(orders)
+        return [{"id": order.client_order_id} for order in orders]
+
+
+class TestSubmitBatch:
+    """Test cases for PortfolioExecutor.submit_batch."""
+
+    def test_buys_cannot_exceed_buying_power_together(self):
+        """Test that each accepted buy draws down the batch's buying power."""
+        trader = FakeTrader(10_000.0, {"AAPL": 100.0, "MSFT": 100.0})
+        executor = PortfolioExecutor(trader=trader, enable_risk_controls=False, dry_run=True)
+        decisions = {
+            "AAPL": TradingDecision("AAPL", "BUY", 90, 60, "test"),
+            "MSFT": TradingDecision("MSFT", "BUY", 90, 60, "test"),
+        }
+
+        try:
+            results = executor.submit_batch(decisions)
+        finally:
+            executor.close()
+
+        assert results["AAPL"].success
+        assert results["AAPL"].executed_quantity == 60
+        assert not results["MSFT"].success
+        assert "Insufficient buying power" in results["MSFT"].error_message
+
+    def test_reservations_survive_snapshot_ttl(self, monkeypatch):
+        """Test that a batch outliving SNAPSHOT_TTL keeps checking against its reservations."""
+        clock = SimpleNamespace(now=time.monotonic())
+        monkeypatch.setattr(
+            portfolio_executor, "time", SimpleNamespace(monotonic=lambda: clock.now)
+        )
+
+        class SlowTrader(FakeTrader):
+            def can_trade(self, symbol, qty, side, current_price=None):
+                # Each check takes longer than the snapshot TTL
+                clock.now += portfolio_executor.SNAPSHOT_TTL + 1
+                return super().can_trade(symbol, qty, side, current_price)
+
+        trader = SlowTrader(10_000.0, {"AAPL": 100.0, "MSFT": 100.0})
+        executor = PortfolioExecutor(trader=trader, enable_risk_controls=False, dry_run=True)
+        decisions = {
+            "AAPL": TradingDecision("AAPL", "BUY", 90, 60, "test"),
+            "MSFT": TradingDecision("MSFT", "BUY", 90, 60, "test"),
+        }
+
+        try:
+            results = executor.submit_batch(decisions)
+        finally:
+            executor.close()
+
+        assert results["AAPL"].success
+        assert not results["MSFT"].success
+        assert "Insufficient buying power" in results["MSFT"].error_message
+
+    def test_untracked_results_are_per_symbol(self):
+        """Test that untracked HOLD/SKIP results name their symbol and serialize."""
+        trader = FakeTrader(10_000.0, {"AAPL": 100.0, "MSFT": 100.0})
+        executor = PortfolioExecutor(
+            trader=trader, enable_risk_controls=False, dry_run=True, track_inactive=False
+        )
+        decisions = {
+            "AAPL": TradingDecision("AAPL", "HOLD", 90, 0, "test"),
+            "MSFT": TradingDecision("MSFT", "BUY", 10, 5, "test"),
+        }
+
+        try:
+            results = executor.submit_batch(decisions)
+        finally:
+            executor.close()
+
+        assert results["AAPL"].action == "HOLD"
+        assert results["MSFT"].action == "SKIP"
+        for symbol, result in results.items():
+            assert result.symbol == symbol
+            assert result.to_record()["timestamp"] == decisions[symbol].timestamp.isoformat()
+        assert not executor.execution_history
+
+    def test_each_decision_gets_its_own_order_id(self):
+        """Test that identical decisions in successive batches are sent as distinct orders."""
+        trader = FakeTrader(10_000.0, {"AAPL": 100.0})
+        executor = PortfolioExecutor(trader=trader, enable_risk_controls=False)
+        first = TradingDecision("AAPL", "BUY", 90, 10, "test")
+        second = TradingDecision("AAPL", "BUY", 90, 10, "test")
+
+        try:
+            executor.submit_batch({"AAPL": first})
+            executor.submit_batch({"AAPL": second})
+        finally:
+            executor.close()
+
+        sent = [order.client_order_id for order in trader.submitted]
+        assert sent == [first.client_order_id, second.client_order_id]
+        assert sent[0] != sent[1]
+
+
+class TestExecutionLog:
+    """Test cases for the persisted execution history."""
+
+    def test_close_closes_log_and_history_replays(self, tmp_path):
+        """Test that close() releases the log file and its records load on restart."""
+        trader = FakeTrader(10_000.0, {"AAPL": 100.0})
+        decisions = {"AAPL": TradingDecision("AAPL", "BUY", 90, 10, "test")}
+
+        executor = PortfolioExecutor(
+            trader=trader, enable_risk_controls=False, dry_run=True, persist_path=str(tmp_path)
+        )
+        log_file = executor._history_file
+        executor.submit_batch(decisions)
+        executor.close()
+        executor.close()
+
+        assert log_file.closed
+        assert executor._history_file is None
+
+        reloaded = PortfolioExecutor(
+            trader=trader, enable_risk_controls=False, dry_run=True, persist_path=str(tmp_path)
+        )
+        try:
+            assert [r.symbol for r in reloaded.execution_history] == ["AAPL"]
+        finally:
+            reloaded.close()
+
+
+class TestValidatePortfolioRisk:
+    """Test cases for PortfolioExecutor.validate_portfolio_risk."""
+
+    def test_empty_account_is_valid(self):
+        """Test that an account with no value and no positions has no warnings."""
+        executor = PortfolioExecutor(trader=FakeTrader(0.0, {}), dry_run=True)
+        try:
+            is_valid, warnings = executor.validate_portfolio_risk()
+        finally:
+            executor.close()
+
+        assert is_valid
+        assert warnings == []
@@ -0,0 +1,27 @@
+# Unit tests for the state manager
+from src.core.state_manager import StateManager
+
+
+class TestStateManagerBatch:
+    """Test cases for StateManager.batch."""
+
+    def test_updates_are_written_once_on_exit(self, tmp_path, monkeypatch):
+        """Test that updates inside a batch reach the file in a single write."""
+        manager = StateManager(str(tmp_path))
+        writes = []
+        write_state = manager._write_state
+        monkeypatch.setattr(
+            manager, "_write_state", lambda state: writes.append(state) or write_state(state)
+        )
+
+        with manager.batch():
+            manager.update_state(cycle_count=5)
+            with manager.batch():
+                manager.update_state(total_trades=3)
+            assert manager.get_state().cycle_count == 5
+            assert writes == []
+
+        assert len(writes) == 1
+        reloaded = StateManager(str(tmp_path)).get_state()
+        assert reloaded.cycle_count == 5
+        assert reloaded.total_trades == 3